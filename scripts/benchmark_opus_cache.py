@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark player CPU time per notification with and without the Opus packet cache.
+
+Usage:
+    uv run python scripts/benchmark_opus_cache.py [--wav FILE] [--seconds S]
+        [--iterations N] [--bitrate KBPS] [--complexity 0-10]
+
+Without --wav a synthetic tone is used. "PCM" reproduces what discord.py does
+for a PCM source (one Opus encode per 20 ms frame on every play); "Opus cache"
+replays packets encoded once, as OpusPacketAudio does. Requires libopus.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord import opus  # noqa: E402
+
+from src.audio import (  # noqa: E402
+    DISCORD_CHANNELS,
+    DISCORD_SAMPLE_RATE,
+    OpusPacketAudio,
+    PCMBufferAudio,
+    encode_opus_packets,
+    wav_to_discord_pcm,
+)
+
+
+def _tone(seconds: float) -> bytes:
+    """Generate 48 kHz stereo PCM of a speech-like harmonic tone."""
+    t = np.arange(int(seconds * DISCORD_SAMPLE_RATE)) / DISCORD_SAMPLE_RATE
+    wave = sum(np.sin(2 * np.pi * 180 * k * t) / k for k in range(1, 6))
+    samples = (wave / 2.5 * 12000).astype(np.int16)
+    return np.repeat(samples[:, None], DISCORD_CHANNELS, axis=1).tobytes()
+
+
+def _play_pcm(pcm: bytes) -> None:
+    """Read a PCM source and encode every frame like the voice player does."""
+    encoder = opus.Encoder()
+    source = PCMBufferAudio(pcm)
+    while frame := source.read():
+        encoder.encode(frame, encoder.SAMPLES_PER_FRAME)
+
+
+def _play_opus(packets: list[bytes]) -> None:
+    """Read pre-encoded packets like the voice player does for Opus sources."""
+    source = OpusPacketAudio(packets)
+    while source.read():
+        pass
+
+
+def _cpu_ms(func, *args) -> float:
+    """Return the CPU time of one call in ms."""
+    start = time.process_time()
+    func(*args)
+    return (time.process_time() - start) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wav", help="16-bit PCM WAV file to play")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--bitrate", type=int, default=64)
+    parser.add_argument("--complexity", type=int, default=10)
+    args = parser.parse_args()
+
+    if not opus.is_loaded() and not opus._load_default():
+        sys.exit("libopus is not available; install it (e.g. apt install libopus0)")
+
+    pcm = (
+        wav_to_discord_pcm(Path(args.wav).read_bytes())
+        if args.wav
+        else _tone(args.seconds)
+    )
+    seconds = len(pcm) / (DISCORD_SAMPLE_RATE * DISCORD_CHANNELS * 2)
+
+    fill = _cpu_ms(encode_opus_packets, pcm, args.bitrate, args.complexity)
+    packets = encode_opus_packets(pcm, args.bitrate, args.complexity)
+    before = [_cpu_ms(_play_pcm, pcm) for _ in range(args.iterations)]
+    after = [_cpu_ms(_play_opus, packets) for _ in range(args.iterations)]
+
+    print(
+        f"{seconds:.2f}s clip, {len(packets)} frames, "
+        f"bitrate={args.bitrate}kbps complexity={args.complexity}"
+    )
+    print(f"cache fill (one-time) {fill:8.2f}ms CPU")
+    print(f"PCM        mean={statistics.mean(before):8.2f}ms CPU per notification")
+    print(f"Opus cache mean={statistics.mean(after):8.2f}ms CPU per notification")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark per-notification VoiceVox latency with and without connection pooling.
+
+Usage:
+    uv run python scripts/benchmark_voicevox.py [--url URL] [--iterations N] [--text TEXT]
+
+A "notification" is what DiscordLogger.notify_voice does against the engine:
+an availability probe followed by audio_query + synthesis.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.voicevox_client import VoiceVoxClient  # noqa: E402
+
+
+async def _run_notifications(
+    client: VoiceVoxClient, text: str, speaker_id: int, iterations: int
+) -> list[float]:
+    """Run the notification round trips and return per-iteration latency in ms."""
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        if not await client.is_available():
+            raise RuntimeError(f"VoiceVox Engine is not available at {client.base_url}")
+        await client.text_to_speech(text, speaker_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    """Print latency summary."""
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<10} mean={statistics.mean(latencies):8.2f}ms "
+        f"p50={statistics.median(latencies):8.2f}ms p95={p95:8.2f}ms"
+    )
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://localhost:50021")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--speaker-id", type=int, default=1)
+    parser.add_argument("--text", default="ビルド完了")
+    args = parser.parse_args()
+
+    # Before: every call opens and tears down its own connection
+    unpooled = VoiceVoxClient(args.url)
+    await _run_notifications(unpooled, args.text, args.speaker_id, 1)  # warm up engine
+    before = await _run_notifications(
+        unpooled, args.text, args.speaker_id, args.iterations
+    )
+
+    # After: one keep-alive pool for the whole run
+    async with VoiceVoxClient(args.url) as pooled:
+        after = await _run_notifications(
+            pooled, args.text, args.speaker_id, args.iterations
+        )
+
+    print(f"{args.iterations} notifications against {args.url}")
+    _report("unpooled", before)
+    _report("pooled", after)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
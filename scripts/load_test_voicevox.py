@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Load-test VoiceVoxClient against the VoiceVox Engine stub (or a real engine).
+
+Usage:
+    uv run python scripts/load_test_voicevox.py [--requests N] [--concurrency C]
+        [--latency-ms MS] [--latency-ms-per-char MS] [--distribution NAME]
+        [--max-concurrency N] [--error-rate R] [--engines N] [--adaptive]
+        [--url URL]
+
+Without --url the engine is simulated in-process by VoiceVoxStub, so no
+Docker or VoiceVox install is needed. Every request uses a distinct text, so
+the audio caches do not hide the engine.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.concurrency import AdaptiveLimiter  # noqa: E402
+from src.voicevox_client import VoiceVoxClient  # noqa: E402
+from src.voicevox_stub import StubConfig, VoiceVoxStub  # noqa: E402
+
+
+class _Router(httpx.AsyncBaseTransport):
+    """Route requests to one in-process stub per fake engine host."""
+
+    def __init__(self, stubs: dict[str, VoiceVoxStub]):
+        self._transports = {
+            host: httpx.ASGITransport(app=stub.app) for host, stub in stubs.items()
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transports[request.url.host].handle_async_request(request)
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+async def _run(args: argparse.Namespace) -> None:
+    stubs: dict[str, VoiceVoxStub] = {}
+    transport = None
+    urls = [args.url] if args.url else []
+    if not args.url:
+        for index in range(args.engines):
+            stubs[f"engine{index}"] = VoiceVoxStub(
+                StubConfig(
+                    latency_ms=args.latency_ms,
+                    latency_ms_per_char=args.latency_ms_per_char,
+                    distribution=args.distribution,
+                    max_concurrency=args.max_concurrency,
+                    error_rate=args.error_rate,
+                    seed=index,
+                )
+            )
+        urls = [f"http://{host}:50021" for host in stubs]
+        transport = _Router(stubs)
+
+    client = VoiceVoxClient(
+        urls,
+        limiter=AdaptiveLimiter() if args.adaptive else None,
+        transport=transport,
+    )
+    gate = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async def request(index: int) -> None:
+        nonlocal failures
+        async with gate:
+            started_at = time.perf_counter()
+            try:
+                await client.text_to_speech(f"ベンチマーク通知その{index}です。", 1)
+            except httpx.HTTPError:
+                failures += 1
+                return
+            latencies.append(time.perf_counter() - started_at)
+
+    async with client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(request(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - started_at
+
+    print(
+        f"{args.requests} requests, concurrency={args.concurrency}, "
+        f"engines={len(urls)}, adaptive={args.adaptive}"
+    )
+    print(f"throughput {args.requests / elapsed:8.1f} req/s, failures={failures}")
+    if latencies:
+        print(
+            f"latency    p50={_percentile(latencies, 50) * 1000:8.1f}ms "
+            f"p95={_percentile(latencies, 95) * 1000:8.1f}ms "
+            f"mean={statistics.mean(latencies) * 1000:8.1f}ms"
+        )
+    if client.limiter is not None:
+        print(f"limiter    {client.limiter.stats()}")
+    for host, stub in stubs.items():
+        print(f"{host:10} {stub.stats()}")
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-ms-per-char", type=float, default=2.0)
+    parser.add_argument(
+        "--distribution",
+        choices=["fixed", "uniform", "lognormal", "exponential"],
+        default="lognormal",
+    )
+    parser.add_argument("--max-concurrency", type=int, default=2)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--engines", type=int, default=1)
+    parser.add_argument("--adaptive", action="store_true")
+    parser.add_argument("--url", help="Benchmark a real engine instead of the stub")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,554 @@
+"""Audio sources for playing synthesized speech in Discord voice channels."""
+
+import asyncio
+import queue
+import struct
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+import discord
+import numpy as np
+from discord import opus
+from discord.opus import OPUS_SILENCE, Encoder as OpusEncoder
+
+# Discord voice expects 48 kHz, 16-bit little-endian, stereo PCM in 20 ms frames
+DISCORD_SAMPLE_RATE = OpusEncoder.SAMPLING_RATE
+DISCORD_CHANNELS = OpusEncoder.CHANNELS
+FRAME_SIZE = OpusEncoder.FRAME_SIZE
+
+# One 20 ms frame of 48 kHz stereo s16le silence
+SILENCE_FRAME = b"\x00" * FRAME_SIZE
+
+# opus_encoder_ctl request that discord.opus.Encoder does not wrap
+_CTL_SET_COMPLEXITY = 4010
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@dataclass
+class WavInfo:
+    """Format of a PCM WAV buffer."""
+
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+    data_offset: int
+    data_size: int
+
+
+def parse_wav_header(buffer: bytes | memoryview) -> WavInfo:
+    """Parse the RIFF header of a 16-bit PCM WAV buffer.
+
+    Args:
+        buffer: WAV file contents
+
+    Returns:
+        Format information and location of the sample data
+
+    Raises:
+        ValueError: If the buffer is not 16-bit PCM WAV
+    """
+    view = memoryview(buffer)
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE buffer")
+
+    fmt: Optional[tuple[int, int, int, int]] = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset : offset + 4])
+        (chunk_size,) = struct.unpack_from("<I", view, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            audio_format, channels, sample_rate = struct.unpack_from("<HHI", view, body)
+            (bits_per_sample,) = struct.unpack_from("<H", view, body + 14)
+            fmt = (audio_format, channels, sample_rate, bits_per_sample)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV data chunk precedes fmt chunk")
+            audio_format, channels, sample_rate, bits_per_sample = fmt
+            if audio_format not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_EXTENSIBLE):
+                raise ValueError(f"Unsupported WAV format: {audio_format:#x}")
+            if bits_per_sample != 16 or channels < 1:
+                raise ValueError(
+                    f"Unsupported WAV sample format: {bits_per_sample} bit, "
+                    f"{channels} channel(s)"
+                )
+            # Streamed WAVs may declare a placeholder size; trust the buffer length
+            data_size = min(chunk_size, len(view) - body)
+            return WavInfo(sample_rate, channels, bits_per_sample, body, data_size)
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise ValueError("WAV buffer has no data chunk")
+
+
+def resample_to_discord(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Convert int16 samples to 48 kHz stereo.
+
+    Uses linear interpolation for the sample-rate conversion and duplicates
+    mono into both channels, all as vectorized NumPy operations.
+
+    Args:
+        samples: int16 array of shape (frames, channels)
+        sample_rate: Sample rate of samples in Hz
+
+    Returns:
+        int16 array of shape (frames_out, 2)
+    """
+    channels = samples[:, :DISCORD_CHANNELS]
+    if sample_rate != DISCORD_SAMPLE_RATE and len(channels):
+        frames_out = len(channels) * DISCORD_SAMPLE_RATE // sample_rate
+        positions = np.arange(frames_out) * (sample_rate / DISCORD_SAMPLE_RATE)
+        source_index = np.arange(len(channels))
+        channels = np.stack(
+            [
+                np.interp(positions, source_index, channels[:, c])
+                for c in range(channels.shape[1])
+            ],
+            axis=1,
+        )
+        channels = np.clip(np.rint(channels), -32768, 32767).astype(np.int16)
+
+    if channels.shape[1] == 1:
+        return np.repeat(channels, DISCORD_CHANNELS, axis=1)
+    return np.ascontiguousarray(channels)
+
+
+def wav_to_discord_pcm(buffer: bytes | memoryview) -> bytes:
+    """Decode a 16-bit PCM WAV buffer into 48 kHz stereo s16le PCM.
+
+    Args:
+        buffer: WAV file contents (bytes or a memory-mapped view)
+
+    Returns:
+        Raw PCM ready to be split into Discord voice frames
+
+    Raises:
+        ValueError: If the buffer is not 16-bit PCM WAV
+    """
+    info = parse_wav_header(buffer)
+    frame_bytes = info.channels * 2
+    frames = info.data_size // frame_bytes
+    samples = np.frombuffer(
+        buffer, dtype="<i2", count=frames * info.channels, offset=info.data_offset
+    ).reshape(frames, info.channels)
+    return resample_to_discord(samples, info.sample_rate).tobytes()
+
+
+def encode_opus_packets(
+    pcm: bytes | memoryview, bitrate: int = 64, complexity: int = 10
+) -> list[bytes]:
+    """Encode 48 kHz stereo PCM into one Opus packet per 20 ms frame.
+
+    This is CPU bound; call it off the event loop (e.g. asyncio.to_thread).
+
+    Args:
+        pcm: 48 kHz stereo s16le PCM
+        bitrate: Encoder bitrate in kbps, 16-512 (default: 64)
+        complexity: Encoder complexity, 0 (fastest) to 10 (best quality) (default: 10)
+
+    Returns:
+        Opus packets ready to be sent without re-encoding
+
+    Raises:
+        discord.opus.OpusNotLoaded: If libopus is not available
+    """
+    encoder = OpusEncoder(bitrate=bitrate)
+    opus._lib.opus_encoder_ctl(
+        encoder._state, _CTL_SET_COMPLEXITY, max(0, min(10, complexity))
+    )
+    view = memoryview(pcm)
+    packets = []
+    for offset in range(0, len(view), FRAME_SIZE):
+        frame = bytes(view[offset : offset + FRAME_SIZE])
+        if len(frame) < FRAME_SIZE:
+            frame += b"\x00" * (FRAME_SIZE - len(frame))
+        packets.append(encoder.encode(frame, encoder.SAMPLES_PER_FRAME))
+    return packets
+
+
+class StreamingWavDecoder:
+    """Incrementally decode 16-bit PCM WAV bytes into 48 kHz stereo PCM.
+
+    Bytes may be fed in arbitrary pieces (split headers or samples are
+    buffered). Resampling state is carried across pieces, so block
+    boundaries do not introduce clicks or drift.
+    """
+
+    def __init__(self):
+        """Initialize the decoder."""
+        self._header = bytearray()
+        self._info: Optional[WavInfo] = None
+        self._remaining = 0
+        self._partial = b""
+        self._previous: Optional[np.ndarray] = None
+        self._position = 0.0
+
+    def feed(self, data: bytes | memoryview) -> bytes:
+        """Decode the next piece of the WAV stream.
+
+        Args:
+            data: Next bytes of the WAV stream
+
+        Returns:
+            48 kHz stereo s16le PCM decoded so far (may be empty)
+
+        Raises:
+            ValueError: If the stream is not 16-bit PCM WAV
+        """
+        if self._info is None:
+            self._header += data
+            marker = self._header.find(b"data", 12)
+            if len(self._header) < 4096 and (
+                marker < 0 or len(self._header) < marker + 8
+            ):
+                return b""  # Header not complete yet
+            self._info = parse_wav_header(self._header)
+            self._remaining = self._declared_data_size()
+            data = bytes(self._header[self._info.data_offset :])
+            self._header = bytearray()
+
+        if self._remaining is not None:
+            data = data[: self._remaining]
+            self._remaining -= len(data)
+
+        frame_bytes = self._info.channels * 2
+        data = self._partial + bytes(data)
+        usable = len(data) - len(data) % frame_bytes
+        self._partial = data[usable:]
+        if not usable:
+            return b""
+
+        samples = np.frombuffer(data, dtype="<i2", count=usable // 2).reshape(
+            -1, self._info.channels
+        )
+        return self._resample(samples).tobytes()
+
+    def _declared_data_size(self) -> Optional[int]:
+        """Return the declared data size, or None for streamed placeholders."""
+        assert self._info is not None
+        (size,) = struct.unpack_from("<I", self._header, self._info.data_offset - 4)
+        return None if size in (0, 0xFFFFFFFF) else size
+
+    def _resample(self, samples: np.ndarray) -> np.ndarray:
+        """Resample one block, continuing the interpolation of the previous one."""
+        assert self._info is not None
+        rate = self._info.sample_rate
+        if rate == DISCORD_SAMPLE_RATE:
+            return resample_to_discord(samples, rate)
+
+        block = samples[:, :DISCORD_CHANNELS]
+        if self._previous is not None:
+            block = np.concatenate([self._previous, block])
+        self._previous = block[-1:]
+
+        step = rate / DISCORD_SAMPLE_RATE
+        last = len(block) - 1
+        positions = np.arange(self._position, last + 1e-9, step)
+        next_position = positions[-1] + step if len(positions) else self._position
+        self._position = next_position - last
+
+        index = np.arange(len(block))
+        resampled = np.stack(
+            [np.interp(positions, index, block[:, c]) for c in range(block.shape[1])],
+            axis=1,
+        )
+        resampled = np.clip(np.rint(resampled), -32768, 32767).astype(np.int16)
+        if resampled.shape[1] == 1:
+            return np.repeat(resampled, DISCORD_CHANNELS, axis=1)
+        return resampled
+
+
+class StreamingPCMAudio(discord.AudioSource):
+    """Audio source fed with PCM from the event loop through a bounded buffer.
+
+    The producer awaits ``feed()`` (which applies backpressure when the
+    buffer is full) and calls ``finish()`` at the end, so memory use stays
+    constant regardless of the audio length. Underruns are padded with
+    silence to keep the player's timing steady.
+    """
+
+    def __init__(self, max_blocks: int = 16, wait_timeout: float = 30.0):
+        """Initialize the streaming source.
+
+        Args:
+            max_blocks: Maximum number of buffered PCM blocks (default: 16)
+            wait_timeout: Maximum seconds to pad with silence on underrun (default: 30.0)
+        """
+        self._blocks: queue.Queue[Optional[bytes]] = queue.Queue(maxsize=max_blocks)
+        self._pending = b""
+        self._finished = False
+        self._closed = False
+        self._wait_frames = int(wait_timeout / 0.02)
+        self._waited_frames = 0
+        self.frames_read = 0
+
+    async def feed(self, pcm: bytes) -> None:
+        """Queue PCM for playback, waiting while the buffer is full.
+
+        Args:
+            pcm: 48 kHz stereo s16le PCM
+        """
+        if not pcm:
+            return
+        while not self._closed:
+            try:
+                self._blocks.put_nowait(pcm)
+                return
+            except queue.Full:
+                await asyncio.sleep(0.02)
+
+    async def finish(self) -> None:
+        """Mark the end of the stream."""
+        while not self._closed:
+            try:
+                self._blocks.put_nowait(None)
+                return
+            except queue.Full:
+                await asyncio.sleep(0.02)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the player has released this source."""
+        return self._closed
+
+    def read(self) -> bytes:
+        while len(self._pending) < FRAME_SIZE and not self._finished:
+            try:
+                block = self._blocks.get_nowait()
+            except queue.Empty:
+                self._waited_frames += 1
+                if self._waited_frames > self._wait_frames:
+                    return b""
+                return SILENCE_FRAME
+            self._waited_frames = 0
+            if block is None:
+                self._finished = True
+            else:
+                self._pending += block
+
+        if not self._pending:
+            return b""
+        frame, self._pending = self._pending[:FRAME_SIZE], self._pending[FRAME_SIZE:]
+        self.frames_read += 1
+        if len(frame) < FRAME_SIZE:
+            return frame + b"\x00" * (FRAME_SIZE - len(frame))
+        return frame
+
+    def is_opus(self) -> bool:
+        return False
+
+    def cleanup(self) -> None:
+        self._closed = True
+
+
+async def stream_wav_to_source(
+    chunks: AsyncIterator[bytes | memoryview], source: StreamingPCMAudio
+) -> None:
+    """Decode a WAV byte stream into a StreamingPCMAudio source.
+
+    Args:
+        chunks: Pieces of a WAV stream (e.g. VoiceVoxClient.stream_text_to_speech)
+        source: Source to feed
+
+    Raises:
+        ValueError: If the stream is not 16-bit PCM WAV
+    """
+    decoder = StreamingWavDecoder()
+    try:
+        async for chunk in chunks:
+            if source.closed:
+                break
+            await source.feed(decoder.feed(chunk))
+    finally:
+        await source.finish()
+
+
+class PCMBufferAudio(discord.AudioSource):
+    """Audio source serving 20 ms frames from an in-memory 48 kHz stereo PCM buffer."""
+
+    def __init__(self, pcm: bytes):
+        """Initialize the source.
+
+        Args:
+            pcm: 48 kHz stereo s16le PCM
+        """
+        self._pcm = memoryview(pcm)
+        self._offset = 0
+
+    @classmethod
+    def from_wav(cls, buffer: bytes | memoryview) -> "PCMBufferAudio":
+        """Create a source by decoding a WAV buffer in process (no FFmpeg).
+
+        Raises:
+            ValueError: If the buffer is not 16-bit PCM WAV
+        """
+        return cls(wav_to_discord_pcm(buffer))
+
+    @property
+    def pcm(self) -> memoryview:
+        """The whole PCM buffer (independent of the read position)."""
+        return self._pcm
+
+    @property
+    def frames_read(self) -> int:
+        """Number of 20 ms frames already read."""
+        return self._offset // FRAME_SIZE
+
+    @property
+    def total_frames(self) -> int:
+        """Total number of 20 ms frames in the buffer."""
+        return -(-len(self._pcm) // FRAME_SIZE)
+
+    def seek(self, frame: int) -> None:
+        """Continue reading from a 20 ms frame index (used to resume playback)."""
+        self._offset = max(0, min(frame, self.total_frames)) * FRAME_SIZE
+
+    def read(self) -> bytes:
+        frame = self._pcm[self._offset : self._offset + FRAME_SIZE]
+        if not frame:
+            return b""
+        self._offset += FRAME_SIZE
+        if len(frame) < FRAME_SIZE:
+            # Pad the last partial frame instead of dropping it
+            return bytes(frame) + b"\x00" * (FRAME_SIZE - len(frame))
+        return bytes(frame)
+
+    def is_opus(self) -> bool:
+        return False
+
+
+class OpusPacketAudio(discord.AudioSource):
+    """Audio source serving pre-encoded Opus packets.
+
+    The player sends the packets as they are, skipping the per-frame Opus
+    encoding it performs for PCM sources.
+    """
+
+    def __init__(self, packets: Sequence[bytes]):
+        """Initialize the source.
+
+        Args:
+            packets: One Opus packet per 20 ms frame (see encode_opus_packets)
+        """
+        self._packets = packets
+        self._index = 0
+
+    @property
+    def frames_read(self) -> int:
+        """Number of 20 ms frames already read."""
+        return self._index
+
+    @property
+    def total_frames(self) -> int:
+        """Total number of 20 ms frames."""
+        return len(self._packets)
+
+    def seek(self, frame: int) -> None:
+        """Continue reading from a 20 ms frame index (used to resume playback)."""
+        self._index = max(0, min(frame, len(self._packets)))
+
+    def read(self) -> bytes:
+        if self._index >= len(self._packets):
+            return b""
+        packet = self._packets[self._index]
+        self._index += 1
+        return packet
+
+    def is_opus(self) -> bool:
+        return True
+
+
+class ChainedAudioSource(discord.AudioSource):
+    """Audio source that plays a sequence of sources back to back.
+
+    Sources are appended from the event loop while the player thread is
+    already reading, so the next clip starts on the frame right after the
+    previous one ends. If the next source is not ready yet, silence frames are
+    emitted to keep the player's timing steady. Playback ends after
+    ``finish()`` once every appended source has been read. All appended
+    sources must agree with the chain on ``is_opus()``.
+    """
+
+    def __init__(self, wait_timeout: float = 30.0, opus: bool = False):
+        """Initialize the chained source.
+
+        Args:
+            wait_timeout: Maximum seconds to pad with silence while waiting for
+                the next source before giving up (default: 30.0)
+            opus: Whether the appended sources yield Opus packets (default: False)
+        """
+        self._opus = opus
+        self._silence = OPUS_SILENCE if opus else SILENCE_FRAME
+        self._sources: queue.SimpleQueue[Optional[discord.AudioSource]] = (
+            queue.SimpleQueue()
+        )
+        self._current: Optional[discord.AudioSource] = None
+        self._sources_done = 0
+        self._stopped_at: Optional[tuple[int, int]] = None
+        self._finished = False
+        self._wait_frames = int(wait_timeout / 0.02)
+        self._waited_frames = 0
+
+    def append(self, source: discord.AudioSource) -> None:
+        """Queue a source to play after the ones already appended."""
+        self._sources.put(source)
+
+    def finish(self) -> None:
+        """Mark that no more sources will be appended."""
+        self._sources.put(None)
+
+    @property
+    def position(self) -> tuple[int, int]:
+        """Playback position as (index of the current source, frames read from it).
+
+        The frame count is 0 for sources that do not report ``frames_read``
+        (streamed or FFmpeg-decoded audio), which can only restart from the top.
+        It is kept after ``cleanup()``, which the player calls when stopped.
+        """
+        if self._stopped_at is not None:
+            return self._stopped_at
+        current = self._current
+        frames = getattr(current, "frames_read", 0) if current is not None else 0
+        return self._sources_done, frames
+
+    def read(self) -> bytes:
+        while not self._finished:
+            if self._current is None:
+                try:
+                    self._current = self._sources.get_nowait()
+                except queue.Empty:
+                    self._waited_frames += 1
+                    if self._waited_frames > self._wait_frames:
+                        return b""
+                    return self._silence
+                self._waited_frames = 0
+                if self._current is None:
+                    self._finished = True
+                    break
+
+            data = self._current.read()
+            if data:
+                return data
+            self._current.cleanup()
+            self._current = None
+            self._sources_done += 1
+        return b""
+
+    def is_opus(self) -> bool:
+        return self._opus
+
+    def cleanup(self) -> None:
+        if self._stopped_at is None:
+            self._stopped_at = self.position
+        if self._current is not None:
+            self._current.cleanup()
+            self._current = None
+        while True:
+            try:
+                source = self._sources.get_nowait()
+            except queue.Empty:
+                break
+            if source is not None:
+                source.cleanup()
@@ -4,11 +4,23 @@ import asyncio
 import os
 from typing import Optional, List
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from pydantic import BaseModel
 import uvicorn
 
 from .discord_logger import DiscordLogger  # type: ignore
+from .voicevox_client import VoiceVoxClient  # type: ignore
+from .concurrency import AdaptiveLimiter  # type: ignore
+from .speaker_catalog import SpeakerCatalog  # type: ignore
+from .voicevox_health import CircuitBreaker, VoiceVoxHealthMonitor  # type: ignore
+from .voicevox_warmup import VoiceVoxWarmup  # type: ignore
+from .voice_backlog import BacklogPolicy  # type: ignore
+from .tts_cache import (  # type: ignore
+    AudioCache,
+    AudioQueryCache,
+    DiskAudioCache,
+    OpusPacketCache,
+)
 from .settings import get_settings  # type: ignore
 
 
@@ -36,6 +48,8 @@ class NotifyVoiceRequest(BaseModel):
     message: str
     priority: str = "normal"
     speaker_id: int = 1
+    speaker: Optional[str] = None
+    wait: bool = True  # False returns a job id as soon as the request is queued
 
 
 class BotDaemon:
@@ -56,10 +70,42 @@ class BotDaemon:
             """Health check endpoint."""
             if self.discord_logger and self.discord_logger._client:
                 is_ready = self.discord_logger._client.is_ready()
-                return {
+                health = {
                     "status": "healthy" if is_ready else "starting",
                     "discord_connected": is_ready,
                 }
+                if self.discord_logger._voicevox:
+                    health["voicevox_cache"] = (
+                        self.discord_logger._voicevox.cache_stats()
+                    )
+                    health["voicevox_engines"] = (
+                        self.discord_logger._voicevox.pool.stats()
+                    )
+                    health["voicevox_hedging"] = (
+                        self.discord_logger._voicevox.hedge_stats()
+                    )
+                    health["voicevox_batching"] = (
+                        self.discord_logger._voicevox.batch_stats()
+                    )
+                    if self.discord_logger._voicevox.limiter:
+                        health["voicevox_concurrency"] = (
+                            self.discord_logger._voicevox.limiter.stats()
+                        )
+                if self.discord_logger._voicevox_health:
+                    health["voicevox"] = self.discord_logger._voicevox_health.stats()
+                if self.discord_logger._voicevox_warmup:
+                    health["warmup"] = self.discord_logger._voicevox_warmup.stats()
+                if self.discord_logger._speaker_catalog:
+                    health["speakers"] = self.discord_logger._speaker_catalog.stats()
+                health["voice_queue"] = self.discord_logger._voice_queue.stats()
+                health["voice_connection"] = (
+                    self.discord_logger._voice_connection.stats()
+                )
+                if self.discord_logger.voice_backlog:
+                    health["voice_backlog"] = self.discord_logger.voice_backlog.stats()
+                if self.discord_logger.opus_cache:
+                    health["opus_cache"] = self.discord_logger.opus_cache.stats()
+                return health
             return {"status": "starting", "discord_connected": False}
 
         @self.app.post("/log")
@@ -97,7 +143,7 @@ class BotDaemon:
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.post("/notify_voice")
-        async def notify_voice(request: NotifyVoiceRequest):
+        async def notify_voice(request: NotifyVoiceRequest, response: Response):
             """Send voice notification."""
             if not self.discord_logger:
                 raise HTTPException(
@@ -113,27 +159,145 @@ class BotDaemon:
                 )
 
             try:
-                result = await self.discord_logger.notify_voice(
+                item = await self.discord_logger.submit_voice(
                     message=request.message,
                     priority=request.priority,
                     speaker_id=request.speaker_id,
                     voice_channel_id=voice_channel_id,
+                    speaker=request.speaker,
                 )
+                if not request.wait:
+                    # Nobody awaits the result; failures are reported by the job status
+                    item.future.add_done_callback(  # type: ignore[union-attr]
+                        lambda future: future.cancelled() or future.exception()
+                    )
+                    response.status_code = 202
+                    return {"status": "queued", "job_id": item.id, "job": item.status()}
+                result = await item.future  # type: ignore[misc]
                 return {"status": "success", "result": result}
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @self.app.get("/notify_voice/{job_id}")
+        async def notify_voice_status(job_id: int):
+            """Get the state and timing of a voice notification job."""
+            if not self.discord_logger:
+                raise HTTPException(
+                    status_code=503, detail="Discord logger not initialized"
+                )
+
+            job = self.discord_logger.get_voice_job(job_id)
+            if job is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Unknown voice notification job: {job_id}"
+                )
+            return {"status": "success", "job": job}
+
     async def start_discord(self):
         """Start Discord client."""
         cwd = os.getcwd()
         thread_name_with_cwd = f"{self.settings.log_thread_name} [{cwd}]"
 
+        voicevox = VoiceVoxClient(
+            self.settings.voicevox_urls,
+            timeout=self.settings.voicevox_timeout,
+            max_connections=self.settings.voicevox_max_connections,
+            max_keepalive_connections=self.settings.voicevox_max_keepalive_connections,
+            keepalive_expiry=self.settings.voicevox_keepalive_expiry,
+            hedge_percentile=self.settings.voicevox_hedge_percentile,
+            hedge_min_samples=self.settings.voicevox_hedge_min_samples,
+            limiter=(
+                AdaptiveLimiter(
+                    initial_limit=self.settings.voicevox_concurrency_initial,
+                    max_limit=self.settings.voicevox_concurrency_max,
+                )
+                if self.settings.voicevox_adaptive_concurrency
+                else None
+            ),
+            audio_cache=(
+                AudioCache(self.settings.voice_cache_max_bytes)
+                if self.settings.voice_cache_max_bytes > 0
+                else None
+            ),
+            disk_cache=(
+                DiskAudioCache(
+                    self.settings.voice_disk_cache_dir,
+                    self.settings.voice_disk_cache_max_bytes,
+                )
+                if self.settings.voice_disk_cache_dir
+                else None
+            ),
+            query_cache=(
+                AudioQueryCache(self.settings.voice_query_cache_entries)
+                if self.settings.voice_query_cache_entries > 0
+                else None
+            ),
+        )
+        voicevox_health = VoiceVoxHealthMonitor(
+            voicevox,
+            interval=self.settings.voicevox_health_interval,
+            breaker=CircuitBreaker(
+                failure_threshold=self.settings.voicevox_breaker_failure_threshold,
+                reset_timeout=self.settings.voicevox_breaker_reset_timeout,
+                max_reset_timeout=self.settings.voicevox_breaker_max_reset_timeout,
+            ),
+        )
+
+        warmup_speaker_ids = self.settings.warmup_speaker_ids
+        warmup_phrases = self.settings.warmup_phrases
+        voicevox_warmup = (
+            VoiceVoxWarmup(
+                voicevox,
+                speaker_ids=warmup_speaker_ids,
+                phrases=warmup_phrases,
+                chunk_max_chars=self.settings.voice_chunk_max_chars,
+            )
+            if warmup_speaker_ids or warmup_phrases
+            else None
+        )
+
         self.discord_logger = DiscordLogger(
             token=self.settings.discord_token,
             log_channel_id=self.settings.log_channel_id,
             log_thread_name=thread_name_with_cwd,
             voicevox_url=self.settings.voicevox_url,
             voice_channel_id=self.settings.voice_channel_id,
+            voicevox_client=voicevox,
+            voicevox_health=voicevox_health,
+            speaker_catalog=SpeakerCatalog(
+                voicevox, ttl=self.settings.voicevox_speaker_cache_ttl
+            ),
+            voicevox_warmup=voicevox_warmup,
+            voice_chunk_max_chars=self.settings.voice_chunk_max_chars,
+            voice_synthesis_concurrency=self.settings.voice_synthesis_concurrency,
+            voice_streaming=self.settings.voice_streaming_synthesis,
+            voice_batch_synthesis=self.settings.voice_batch_synthesis,
+            voice_preemption=self.settings.voice_preemption,
+            voice_dedup_window=self.settings.voice_dedup_window,
+            voice_idle_timeout=self.settings.voice_idle_timeout,
+            voice_reconnect_max_delay=self.settings.voice_reconnect_max_delay,
+            voice_require_listeners=self.settings.voice_require_listeners,
+            voice_listener_wait=self.settings.voice_listener_wait,
+            voice_backlog=(
+                BacklogPolicy(
+                    speed_steps=self.settings.backlog_speed_steps,
+                    text_only_seconds=self.settings.voice_backlog_text_only_seconds,
+                )
+                if self.settings.backlog_speed_steps
+                or self.settings.voice_backlog_text_only_seconds > 0
+                else None
+            ),
+            opus_cache=(
+                OpusPacketCache(
+                    self.settings.voice_opus_cache_max_bytes,
+                    bitrate=self.settings.voice_opus_bitrate,
+                    complexity=self.settings.voice_opus_complexity,
+                )
+                if self.settings.voice_opus_cache_max_bytes > 0
+                else None
+            ),
         )
 
         await self.discord_logger.start()
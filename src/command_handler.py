@@ -18,6 +18,11 @@ class Command:
     aliases: list[str] | None = None
 
 
+def _preview(text: str, limit: int = 80) -> str:
+    """Shorten a notification for display in a command reply."""
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
 class CommandRegistry:
     """Registry for bot commands."""
 
@@ -238,10 +243,15 @@ class CommandHandler:
 
             # VoiceVox status
             if self.logger._voicevox:
-                voicevox_available = await self.logger._voicevox.is_available()
+                voicevox_available = await self.logger._voicevox_available()
                 voicevox_status = (
                     "✅ Available" if voicevox_available else "❌ Unavailable"
                 )
+                health = self.logger._voicevox_health
+                if health is not None and health.breaker.retry_in > 0:
+                    voicevox_status += (
+                        f" (circuit open, retry in {health.breaker.retry_in:.0f}s)"
+                    )
                 embed.add_field(
                     name="VoiceVox Engine",
                     value=f"{voicevox_status}\n`{self.logger.voicevox_url}`",
@@ -320,7 +330,7 @@ class CommandHandler:
         @self.registry.register(
             name="speakers",
             description="List available VoiceVox speakers",
-            usage="!speakers",
+            usage="!speakers [speaker name]",
             category="Voice",
         )
         async def speakers_command(message: Message, args: list[str]):
@@ -329,14 +339,38 @@ class CommandHandler:
                 await message.reply("❌ VoiceVox client not initialized")
                 return
 
-            if not await self.logger._voicevox.is_available():
+            # A loaded catalog can be shown even while the engine is down
+            catalog = self.logger._speaker_catalog
+            if (
+                catalog is None or not catalog.loaded
+            ) and not await self.logger._voicevox_available():
                 await message.reply(
                     f"❌ VoiceVox Engine is not available at `{self.logger.voicevox_url}`"
                 )
                 return
 
             try:
-                speakers = await self.logger._voicevox.get_speakers()
+                if catalog is None:
+                    speakers = await self.logger._voicevox.get_speakers()
+                else:
+                    speakers = await catalog.get_speakers()
+
+                if args and catalog is not None:
+                    # Show every style of one speaker
+                    name = " ".join(args)
+                    styles = catalog.styles_of(name)
+                    if not styles:
+                        await message.reply(f"❌ Unknown speaker: **{name}**")
+                        return
+                    embed = discord.Embed(
+                        title=f"🎤 {styles[0].speaker_name}",
+                        description="\n".join(
+                            f"`{style.style_id}` {style.style_name}" for style in styles
+                        ),
+                        color=0x9B59B6,
+                    )
+                    await message.reply(embed=embed)
+                    return
 
                 embed = discord.Embed(
                     title="🎤 Available VoiceVox Speakers",
@@ -365,6 +399,63 @@ class CommandHandler:
             except Exception as e:
                 await message.reply(f"❌ Error fetching speakers: {str(e)}")
 
+        @self.registry.register(
+            name="queue",
+            description="Show the voice notification queue",
+            usage="!queue",
+            category="Voice",
+            aliases=["q"],
+        )
+        async def queue_command(message: Message, args: list[str]):
+            """Show the voice notification queue."""
+            queue = self.logger._voice_queue
+            embed = discord.Embed(title="🎶 Voice Queue", color=0x3498DB)
+            embed.add_field(
+                name="Now Playing",
+                value=_preview(queue.current.message) if queue.current else "-",
+                inline=False,
+            )
+
+            pending = queue.pending()
+            lines = [
+                f"`{index}.` {'🔴 ' if item.priority == 'high' else ''}{_preview(item.message)}"
+                + (f" ×{item.count}" if item.count > 1 else "")
+                for index, item in enumerate(pending[:10], start=1)
+            ]
+            if len(pending) > 10:
+                lines.append(f"... and {len(pending) - 10} more")
+            embed.add_field(
+                name=f"Up Next ({len(pending)})",
+                value="\n".join(lines) or "Queue is empty",
+                inline=False,
+            )
+            await message.reply(embed=embed)
+
+        @self.registry.register(
+            name="skip",
+            description="Skip the voice notification that is playing",
+            usage="!skip",
+            category="Voice",
+        )
+        async def skip_command(message: Message, args: list[str]):
+            """Skip the voice notification that is playing."""
+            item = self.logger._voice_queue.skip()
+            if item is None:
+                await message.reply("❌ Nothing is playing")
+                return
+            await message.reply(f"⏭️ Skipped: {_preview(item.message)}")
+
+        @self.registry.register(
+            name="clear",
+            description="Drop every queued voice notification",
+            usage="!clear",
+            category="Voice",
+        )
+        async def clear_command(message: Message, args: list[str]):
+            """Drop every queued voice notification."""
+            cleared = self.logger._voice_queue.clear()
+            await message.reply(f"🗑️ Cleared {cleared} queued notification(s)")
+
         @self.registry.register(
             name="join",
             description="Connect to a voice channel",
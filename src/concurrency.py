@@ -0,0 +1,176 @@
+"""Adaptive concurrency limiting for VoiceVox synthesis."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+# Lower rank is served first; unknown priorities are treated as "normal"
+PRIORITY_RANKS = {"high": 0, "normal": 1}
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter that learns the engine's best in-flight count.
+
+    The limit grows by one per "round" of requests while the smoothed latency
+    stays close to the baseline (a low percentile of recent latencies), and
+    shrinks multiplicatively once it rises above ``latency_tolerance`` times
+    that baseline (the engine is queueing internally) or a request fails. Requests over the limit wait
+    in priority order ("high" before "normal", FIFO within a priority).
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.75,
+        window: int = 100,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting concurrency limit (default: 4)
+            min_limit: Lower bound of the limit (default: 1)
+            max_limit: Upper bound of the limit (default: 16)
+            latency_tolerance: Latency/baseline ratio treated as overload (default: 2.0)
+            backoff: Factor applied to the limit on overload (default: 0.75)
+            window: Number of recent latencies the baseline is taken from (default: 100)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self.completed = 0
+        self.queued_total = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._smoothed: Optional[float] = None
+        self._decreased_at = float("-inf")
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def baseline(self) -> Optional[float]:
+        """10th percentile of recent latencies per unit of cost in seconds.
+
+        None before any request completed.
+        """
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[int(len(ordered) * 0.1)]
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    @asynccontextmanager
+    async def acquire(
+        self, priority: str = "normal", cost: float = 1.0
+    ) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the duration of the block.
+
+        Args:
+            priority: "high" or "normal" (default: "normal")
+            cost: Size of the work (e.g. characters to synthesize); latencies
+                are compared per unit of cost (default: 1.0)
+
+        The block's latency adjusts the limit; exceptions count as overload
+        (cancellation does not).
+        """
+        if self._has_capacity() and not self.queued:
+            self.in_flight += 1
+        else:
+            await self._wait(PRIORITY_RANKS.get(priority, PRIORITY_RANKS["normal"]))
+
+        started_at = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self._on_overload(started_at)
+            raise
+        else:
+            self._on_success(started_at, max(cost, 1.0))
+        finally:
+            self.in_flight -= 1
+            self._wake()
+
+    async def _wait(self, rank: int) -> None:
+        """Queue until a slot is handed over by _wake()."""
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._sequence), waiter))
+        self.queued_total += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before cancellation; give it back
+                self.in_flight -= 1
+                self._wake()
+            raise
+
+    def _wake(self) -> None:
+        """Hand free slots to the highest-priority waiters."""
+        while self._waiters and self._has_capacity():
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue  # Cancelled while queued
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def _on_success(self, started_at: float, cost: float) -> None:
+        """Grow or shrink the limit from a completed request's latency."""
+        latency = (time.perf_counter() - started_at) / cost
+        self._latencies.append(latency)
+        self.completed += 1
+        # Smooth single slow requests out; sustained queueing still shows up
+        if self._smoothed is None:
+            self._smoothed = latency
+        else:
+            self._smoothed = 0.8 * self._smoothed + 0.2 * latency
+        baseline = self.baseline
+        if baseline is not None and self._smoothed > baseline * self.latency_tolerance:
+            self._on_overload(started_at)
+        elif self.in_flight >= int(self.limit):
+            # Only grow while the limit is actually the bottleneck
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _on_overload(self, started_at: float) -> None:
+        """Shrink the limit multiplicatively.
+
+        Requests that started before the last decrease ran under the old limit,
+        so they do not shrink it again.
+        """
+        if started_at < self._decreased_at:
+            return
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self._decreased_at = time.perf_counter()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return limiter counters.
+
+        Returns:
+            Dictionary with limit, in_flight, queued and baseline latency
+        """
+        baseline = self.baseline
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "queued_total": self.queued_total,
+            "completed": self.completed,
+            "baseline_ms_per_unit": (
+                round(baseline * 1000, 3) if baseline is not None else None
+            ),
+        }
@@ -1,15 +1,33 @@
 """Discord logger implementation using discord.py."""
 
 import asyncio
-import os
-import tempfile
+import io
+import time
+from contextlib import aclosing
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
 import discord
+import httpx
 from discord import Intents, Thread, Message, VoiceClient, FFmpegPCMAudio
 
+from .audio import (  # type: ignore
+    ChainedAudioSource,
+    OpusPacketAudio,
+    PCMBufferAudio,
+    StreamingPCMAudio,
+    encode_opus_packets,
+    stream_wav_to_source,
+)
+from .tts_cache import AudioCache, OpusPacketCache  # type: ignore
+from .speaker_catalog import SpeakerCatalog  # type: ignore
+from .voice_pipeline import pipelined, split_sentences  # type: ignore
 from .voicevox_client import VoiceVoxClient  # type: ignore
+from .voicevox_health import VoiceVoxHealthMonitor  # type: ignore
+from .voicevox_warmup import VoiceVoxWarmup  # type: ignore
+from .voice_backlog import BacklogDecision, BacklogPolicy  # type: ignore
+from .voice_connection import VoiceConnectionSupervisor  # type: ignore
+from .voice_queue import VoiceQueue, VoiceQueueItem  # type: ignore
 from .command_handler import CommandHandler  # type: ignore
 
 
@@ -23,6 +41,22 @@ class DiscordLogger:
         log_thread_name: str,
         voicevox_url: str = "http://localhost:50021",
         voice_channel_id: Optional[int] = None,
+        voicevox_client: Optional[VoiceVoxClient] = None,
+        voice_chunk_max_chars: int = 80,
+        voice_synthesis_concurrency: int = 2,
+        voice_streaming: bool = False,
+        voice_batch_synthesis: bool = True,
+        voice_preemption: bool = False,
+        voice_dedup_window: float = 0.0,
+        voice_idle_timeout: float = 0.0,
+        voice_reconnect_max_delay: float = 60.0,
+        voice_require_listeners: bool = False,
+        voice_listener_wait: float = 0.0,
+        voice_backlog: Optional[BacklogPolicy] = None,
+        opus_cache: Optional[OpusPacketCache] = None,
+        voicevox_health: Optional[VoiceVoxHealthMonitor] = None,
+        speaker_catalog: Optional[SpeakerCatalog] = None,
+        voicevox_warmup: Optional[VoiceVoxWarmup] = None,
     ):
         """Initialize the Discord logger.
 
@@ -32,18 +66,72 @@ class DiscordLogger:
             log_thread_name: Name for the log thread
             voicevox_url: VoiceVox Engine API URL (default: http://localhost:50021)
             voice_channel_id: Default voice channel ID (optional, can be set via !join command)
+            voicevox_client: Pre-configured VoiceVox client (optional, built from voicevox_url if omitted)
+            voice_chunk_max_chars: Maximum characters per synthesized sentence chunk (default: 80)
+            voice_synthesis_concurrency: Maximum chunks synthesized concurrently (default: 2)
+            voice_streaming: Start playback while the engine response is still arriving (default: False)
+            voice_batch_synthesis: Synthesize the chunks after the first in one batch request (default: True)
+            voice_preemption: Let high-priority notifications interrupt normal ones, which resume afterwards (default: False)
+            voice_dedup_window: Seconds within which repeated notifications are merged into the queued one (default: 0.0 = disabled)
+            voice_idle_timeout: Seconds without playback before the voice connection is released (default: 0.0 = keep it)
+            voice_reconnect_max_delay: Upper bound of the voice reconnect backoff in seconds (default: 60.0)
+            voice_require_listeners: Skip synthesis and playback while no human is in the voice channel (default: False)
+            voice_listener_wait: Seconds a notification waits for someone to join before it is skipped (default: 0.0)
+            voice_backlog: Speeds up or sheds notifications as the voice backlog grows (optional)
+            opus_cache: Cache of pre-encoded Opus packets for repeated phrases (optional)
+            voicevox_health: Background VoiceVox health monitor (optional, created on start if omitted)
+            speaker_catalog: Cached VoiceVox speaker catalog (optional, created on start if omitted)
+            voicevox_warmup: Speaker warm-up and phrase pre-rendering run during login (optional)
         """
         self.token = token
         self.log_channel_id = log_channel_id
         self.log_thread_name = log_thread_name
         self.voicevox_url = voicevox_url
         self.voice_channel_id = voice_channel_id
+        self.voice_chunk_max_chars = voice_chunk_max_chars
+        self.voice_synthesis_concurrency = voice_synthesis_concurrency
+        self.voice_streaming = voice_streaming
+        self.voice_batch_synthesis = voice_batch_synthesis
+        self.voice_require_listeners = voice_require_listeners
+        self.voice_listener_wait = voice_listener_wait
+        self.voice_backlog = voice_backlog
+        self.opus_cache = opus_cache
         self._client: Optional[discord.Client] = None
         self._log_thread: Optional[Thread] = None
         self._ready_event = asyncio.Event()
-        self._voicevox: Optional[VoiceVoxClient] = None
-        self._voice_client: Optional[VoiceClient] = None  # Persistent voice connection
+        self._voicevox: Optional[VoiceVoxClient] = voicevox_client
+        self._voicevox_health: Optional[VoiceVoxHealthMonitor] = voicevox_health
+        self._speaker_catalog: Optional[SpeakerCatalog] = speaker_catalog
+        self._voicevox_warmup: Optional[VoiceVoxWarmup] = voicevox_warmup
         self._command_handler: Optional[CommandHandler] = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._voice_members_changed = asyncio.Event()
+        self._voice_queue = VoiceQueue(
+            self._play_notification,
+            prepare=self._prefetch_notification,
+            on_skip=self._stop_playback,
+            preempt=voice_preemption,
+            dedup_window=voice_dedup_window,
+        )
+        # Persistent voice connection, reconnected and released in the background
+        self._voice_connection = VoiceConnectionSupervisor(
+            get_channel=lambda channel_id: self._client.get_channel(channel_id),  # type: ignore
+            channel_id=voice_channel_id,
+            busy=lambda: (
+                self._voice_queue.current is not None or len(self._voice_queue) > 0
+            ),
+            idle_timeout=voice_idle_timeout,
+            backoff_max=voice_reconnect_max_delay,
+        )
+
+    @property
+    def _voice_client(self) -> Optional[VoiceClient]:
+        """Current voice connection (owned by the connection supervisor)."""
+        return self._voice_connection.voice_client
+
+    @_voice_client.setter
+    def _voice_client(self, voice_client: Optional[VoiceClient]) -> None:
+        self._voice_connection.attach(voice_client)
 
     async def start(self) -> None:
         """Start the Discord client."""
@@ -73,17 +161,43 @@ class DiscordLogger:
             if self._command_handler:
                 await self._command_handler.handle_message(message)
 
-        # Initialize VoiceVox client
-        self._voicevox = VoiceVoxClient(self.voicevox_url)
-
-        # Check if VoiceVox is available
-        voicevox_available = await self._voicevox.is_available()
+        @self._client.event
+        async def on_voice_state_update(member, before, after):
+            """Wake notifications waiting for someone to join the voice channel."""
+            if before.channel != after.channel and not member.bot:
+                self._voice_members_changed.set()
+
+        # Initialize VoiceVox client and open its pooled connection for the daemon lifetime
+        if self._voicevox is None:
+            self._voicevox = VoiceVoxClient(self.voicevox_url)
+        await self._voicevox.open()
+
+        # Check if VoiceVox is available, then keep the state fresh in the background
+        if self._voicevox_health is None:
+            self._voicevox_health = VoiceVoxHealthMonitor(self._voicevox)
+        voicevox_available = await self._voicevox_health.check()
+        self._voicevox_health.start()
+
+        # Load the speaker catalog so speaker IDs can be validated locally
+        if self._speaker_catalog is None:
+            self._speaker_catalog = SpeakerCatalog(self._voicevox)
+        if voicevox_available:
+            try:
+                await self._speaker_catalog.refresh()
+            except Exception as e:
+                print(f"Warning: Failed to load VoiceVox speakers: {e}")
         if voicevox_available:
             print(f"VoiceVox Engine is available at {self.voicevox_url}")
         else:
             print(f"Warning: VoiceVox Engine is not available at {self.voicevox_url}")
             print("Voice notifications will be logged to text channel only")
 
+        # Warm up speakers and pre-render phrases while logging in to Discord
+        if self._voicevox_warmup is not None and voicevox_available:
+            task = asyncio.create_task(self._voicevox_warmup.run())
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
         # Start the client in the background
         asyncio.create_task(self._client.start(self.token))
 
@@ -96,6 +210,7 @@ class DiscordLogger:
         # Auto-connect to voice channel if configured
         if self.voice_channel_id:
             await self._auto_connect_voice()
+        self._voice_connection.start()
 
     async def _ensure_thread(self) -> Thread:
         """Ensure the log thread exists, creating it if necessary.
@@ -265,6 +380,7 @@ class DiscordLogger:
         priority: str = "normal",
         speaker_id: int = 1,
         voice_channel_id: Optional[int] = None,
+        speaker: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Send a voice notification using VoiceVox TTS.
 
@@ -273,27 +389,121 @@ class DiscordLogger:
             priority: Priority level ("normal" or "high")
             speaker_id: VoiceVox speaker ID (default: 1 = 四国めたん ノーマル)
             voice_channel_id: ID of the voice channel (overrides configured default if provided)
+            speaker: Speaker name or "speaker/style" (overrides speaker_id if provided)
 
         Returns:
             Dictionary with notification status
 
         Raises:
             RuntimeError: If the Discord client is not ready
+            ValueError: If the speaker is unknown
+        """
+        item = await self.submit_voice(
+            message, priority, speaker_id, voice_channel_id, speaker
+        )
+        return await item.future  # type: ignore[misc]
+
+    async def submit_voice(
+        self,
+        message: str,
+        priority: str = "normal",
+        speaker_id: int = 1,
+        voice_channel_id: Optional[int] = None,
+        speaker: Optional[str] = None,
+    ) -> VoiceQueueItem:
+        """Queue a voice notification without waiting for it to play.
+
+        Takes the same arguments as notify_voice. Progress is available from
+        ``item.status()`` (or ``get_voice_job(item.id)``) and the result from
+        ``item.future``.
+
+        Returns:
+            The queued request
+
+        Raises:
+            RuntimeError: If the Discord client is not ready
+            ValueError: If the speaker is unknown
         """
         if self._client is None or not self._client.is_ready():
             raise RuntimeError("The connection with Discord is not ready")
 
+        # Reject unknown speakers before posting anything to Discord
+        speaker_id = await self._resolve_speaker(speaker_id, speaker)
+
+        # A single worker owns the player; concurrent callers wait their turn and
+        # repeats of a queued notification are merged into it
+        item = VoiceQueueItem(
+            message=message,
+            priority=priority,
+            speaker_id=speaker_id,
+            voice_channel_id=voice_channel_id,
+        )
+        self._voice_queue.submit(item)
+        # Connect (or reconnect) while the notification waits and is synthesized
+        self._voice_connection.wake()
+        return item
+
+    def get_voice_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Return the state and timing of a recent voice notification.
+
+        Args:
+            job_id: Request id returned by submit_voice or notify_voice
+
+        Returns:
+            Job status dictionary, or None if the id is unknown or expired
+        """
+        item = self._voice_queue.get(job_id)
+        return item.status() if item is not None else None
+
+    async def _play_notification(self, item: VoiceQueueItem) -> Dict[str, Any]:
+        """Play one queued notification (runs on the voice queue worker).
+
+        Args:
+            item: Queued notification
+
+        Returns:
+            Dictionary with notification status
+        """
+        message, priority = item.message, item.priority
+        speaker_id, voice_channel_id = item.speaker_id, item.voice_channel_id
+
         # Log to text channel
         thread = await self._ensure_thread()
 
+        resumed = item.preemptions > 0
         embed = discord.Embed(
-            title="🔊 VOICE NOTIFICATION",
-            description=message,
+            title="🔊 VOICE NOTIFICATION (resumed)"
+            if resumed
+            else "🔊 VOICE NOTIFICATION",
+            # Merged duplicates are announced once with their count
+            description=f"{message} ×{item.count}" if item.count > 1 else message,
             color=0xE74C3C if priority == "high" else 0x3498DB,
             timestamp=datetime.now(timezone.utc),
         )
         embed.add_field(name="Priority", value=priority.upper(), inline=True)
 
+        # Keep voice latency bounded when notifications pile up. A resumed
+        # notification keeps its speed so the saved frame position still fits.
+        if not resumed:
+            decision = self._backlog_decision(item)
+            if decision is not None:
+                self.voice_backlog.record(decision)  # type: ignore[union-attr]
+                if decision.text_only:
+                    embed.add_field(
+                        name="Status",
+                        value=f"📝 Text only (voice backlog ~{decision.backlog_seconds:.0f}s)",
+                        inline=False,
+                    )
+                    await thread.send(embed=embed)
+                    return {
+                        "status": "text_only",
+                        "message": message,
+                        "priority": priority,
+                        "backlog_seconds": round(decision.backlog_seconds, 1),
+                    }
+                item.speed_scale = decision.speed_scale
+        prosody = {"speed_scale": item.speed_scale} if item.speed_scale else {}
+
         # Ensure voice connection is available. If接続できない場合は例外を投げて呼び出し元に失敗を伝える。
         try:
             voice_channel_name = await self._ensure_voice_connection(voice_channel_id)
@@ -306,8 +516,48 @@ class DiscordLogger:
             await thread.send(embed=embed)
             return {"status": "not_connected", "note": str(e)}
 
-        # Check if VoiceVox is available
-        if self._voicevox is None or not await self._voicevox.is_available():
+        # Nobody would hear it: post the text only and spare the engine and encoder
+        if self.voice_require_listeners and not await self._wait_for_listeners(
+            voice_channel_id
+        ):
+            embed.add_field(
+                name="Status", value="🔇 Skipped: no listeners", inline=False
+            )
+            await thread.send(embed=embed)
+            return {
+                "status": "skipped_no_listeners",
+                "voice_channel": voice_channel_name,
+                "message": message,
+                "priority": priority,
+            }
+
+        # Split long messages so the first sentence can play while the rest is synthesized
+        chunks = split_sentences(message, self.voice_chunk_max_chars) or [message]
+        # An interrupted notification continues from the chunk it was stopped in
+        total_chunks = len(chunks)
+        first_chunk = min(item.resume_chunk, total_chunks - 1)
+        chunks = chunks[first_chunk:]
+
+        # Phrases whose Opus packets are cached are sent without encoding
+        opus_packets: Dict[str, Optional[List[bytes]]] = {}
+        if self.opus_cache is not None:
+            for chunk in chunks:
+                opus_packets[chunk] = self.opus_cache.get(
+                    AudioCache.make_key(chunk, speaker_id, **prosody)
+                )
+        play_opus = bool(opus_packets) and all(
+            packets is not None for packets in opus_packets.values()
+        )
+
+        # Check if VoiceVox is available (cached audio needs no engine round trip)
+        if self._voicevox is None or (
+            not play_opus
+            and not all(
+                self._voicevox.is_cached(chunk, speaker_id, **prosody)
+                for chunk in chunks
+            )
+            and not await self._voicevox_available()
+        ):
             embed.add_field(
                 name="Status", value="❌ VoiceVox not available", inline=False
             )
@@ -315,50 +565,181 @@ class DiscordLogger:
             await thread.send(embed=embed)
             raise RuntimeError("VoiceVox is required for voice notifications")
 
-        audio_file_path: Optional[str] = None
+        voicevox = self._voicevox
+        started_at = time.perf_counter()
+        chained = ChainedAudioSource(opus=play_opus)
+        finished = asyncio.get_running_loop().create_future()
+
+        producers: List[asyncio.Task] = []
+        stream_slots = asyncio.Semaphore(max(1, self.voice_synthesis_concurrency))
+
+        async def stream_chunk(chunk: str, source: StreamingPCMAudio) -> None:
+            async with stream_slots:
+                await stream_wav_to_source(
+                    voicevox.stream_text_to_speech(
+                        chunk, speaker_id, priority=priority, **prosody
+                    ),
+                    source,
+                )
+
+        # The first chunk is synthesized alone so playback starts early; the
+        # uncached rest goes to the engine as one batch while it plays
+        batched = list(
+            dict.fromkeys(
+                chunk
+                for chunk in chunks[1:]
+                if chunk != chunks[0]
+                and not voicevox.is_cached(chunk, speaker_id, **prosody)
+            )
+        )
+        batch: Optional[asyncio.Task] = None
+        if (
+            self.voice_batch_synthesis
+            and not play_opus
+            and not self.voice_streaming
+            and len(batched) >= 2
+        ):
+            batch = asyncio.create_task(
+                voicevox.batch_text_to_speech(
+                    batched, speaker_id, priority=priority, **prosody
+                )
+            )
+            producers.append(batch)
+
+        async def render_chunk(chunk: str) -> discord.AudioSource:
+            if play_opus:
+                return OpusPacketAudio(opus_packets[chunk])  # type: ignore[arg-type]
+
+            if self.voice_streaming and not voicevox.is_cached(
+                chunk, speaker_id, **prosody
+            ):
+                # Decode the engine response into a bounded buffer as it arrives
+                streaming = StreamingPCMAudio()
+                producers.append(asyncio.create_task(stream_chunk(chunk, streaming)))
+                return streaming
+
+            # Disk cache hits arrive memory-mapped and are decoded without a copy
+            repeated = voicevox.is_cached(chunk, speaker_id, **prosody)
+            if batch is not None and chunk in batched:
+                audio_data = (await batch)[batched.index(chunk)]
+            else:
+                audio_data = await voicevox.text_to_speech(
+                    chunk, speaker_id, priority=priority, **prosody
+                )
+            try:
+                source = PCMBufferAudio.from_wav(audio_data)
+            except ValueError:
+                # Not 16-bit PCM WAV; let FFmpeg decode it
+                return FFmpegPCMAudio(io.BytesIO(audio_data), pipe=True)
+            if repeated:
+                self._fill_opus_cache(
+                    AudioCache.make_key(chunk, speaker_id, **prosody), source.pcm
+                )
+            return source
 
         try:
             embed.add_field(name="Status", value="🎵 Generating audio...", inline=False)
             # Generate TTS audio using VoiceVox
             status_msg = await thread.send(embed=embed)
 
-            audio_data = await self._voicevox.text_to_speech(message, speaker_id)
-
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(audio_data)
-                audio_file_path = temp_file.name
-
-            # Play audio (already connected)
-            embed.set_field_at(
-                2, name="Status", value="▶️ Playing audio...", inline=False
-            )
-            await status_msg.edit(embed=embed)
-
-            # Wait for any currently playing audio to finish
-            while self._voice_client.is_playing():
-                await asyncio.sleep(0.1)
-
-            self._voice_client.play(FFmpegPCMAudio(audio_file_path))
+            time_to_first_audio: Optional[float] = None
+            async with aclosing(
+                pipelined(chunks, render_chunk, self.voice_synthesis_concurrency)
+            ) as sources:
+                async for source in sources:
+                    if item.skipped or item.preempted:
+                        break
+                    if time_to_first_audio is None and hasattr(source, "seek"):
+                        # Continue an interrupted chunk; streamed audio restarts it
+                        source.seek(item.resume_frame)
+                    chained.append(source)
+                    if time_to_first_audio is not None:
+                        continue
+
+                    # Start playing the first chunk while the rest is synthesized;
+                    # the player thread reports the end through after=
+                    self._voice_client.play(
+                        chained, after=self._playback_done(finished)
+                    )
+                    item.mark_playing()
+                    time_to_first_audio = time.perf_counter() - started_at
+
+                    embed.set_field_at(
+                        2, name="Status", value="▶️ Playing audio...", inline=False
+                    )
+                    await status_msg.edit(embed=embed)
+            chained.finish()
+            if item.skipped or item.preempted:
+                # Stop synthesizing the rest of a skipped or interrupted message
+                for producer in producers:
+                    producer.cancel()
+                await asyncio.gather(*producers, return_exceptions=True)
+            else:
+                # Surface synthesis errors from streamed chunks
+                await asyncio.gather(*producers)
 
             # Wait for playback to finish
-            while self._voice_client.is_playing():
-                await asyncio.sleep(0.1)
+            if time_to_first_audio is not None:
+                await finished
+                self._voice_connection.touch()
+            if item.skipped or item.preempted:
+                chained.cleanup()  # Release chunks that were never played
+
+            if item.preempted and not item.skipped:
+                # Remember where to continue once the high-priority notification is done
+                played_chunks, frame = chained.position
+                if played_chunks < len(chunks):
+                    if time_to_first_audio is not None:
+                        item.resume_chunk = first_chunk + played_chunks
+                        item.resume_frame = frame  # Counted from the chunk start
+                    embed.set_field_at(
+                        2,
+                        name="Status",
+                        value="⏸️ Interrupted by a high-priority notification",
+                        inline=False,
+                    )
+                    await status_msg.edit(embed=embed)
+                    return {"status": "preempted", "message": message}
+                item.preempted = False  # It had already finished playing
 
             # Update status
-            embed.set_field_at(2, name="Status", value="✅ Completed", inline=False)
-            embed.set_footer(text=f"Speaker ID: {speaker_id}")
+            embed.set_field_at(
+                2,
+                name="Status",
+                value="⏭️ Skipped" if item.skipped else "✅ Completed",
+                inline=False,
+            )
+            footer = f"Speaker ID: {speaker_id}"
+            if item.speed_scale:
+                footer += f" • Speed ×{item.speed_scale:g} (voice backlog)"
+            embed.set_footer(text=footer)
             await status_msg.edit(embed=embed)
 
             return {
-                "status": "played",
+                "status": "skipped" if item.skipped else "played",
                 "voice_channel": voice_channel_name,
                 "message": message,
                 "priority": priority,
                 "speaker_id": speaker_id,
+                "chunks": total_chunks,
+                "preemptions": item.preemptions,
+                "speed_scale": item.speed_scale or 1.0,
+                "time_to_first_audio_ms": round((time_to_first_audio or 0.0) * 1000, 1),
             }
 
         except Exception as e:
+            if isinstance(e, httpx.HTTPError) and self._voicevox_health is not None:
+                self._voicevox_health.record_failure()
+
+            # Stop a partially played message (keep voice connection)
+            for producer in producers:
+                producer.cancel()
+            chained.finish()
+            if self._voice_client.source is chained:
+                self._voice_client.stop()
+            else:
+                chained.cleanup()
+
             # Handle errors
             error_embed = discord.Embed(
                 title="❌ VOICE NOTIFICATION FAILED",
@@ -374,62 +755,220 @@ class DiscordLogger:
 
             raise RuntimeError(f"Failed to send voice notification: {e}") from e
 
-        finally:
-            # Cleanup temporary file only (keep voice connection)
-            if audio_file_path and os.path.exists(audio_file_path):
-                try:
-                    os.unlink(audio_file_path)
-                except Exception:
-                    pass  # Ignore cleanup errors
+    @staticmethod
+    def _playback_done(
+        finished: asyncio.Future,
+    ) -> Callable[[Optional[Exception]], None]:
+        """Build a player after= callback that resolves finished on its loop.
 
-    async def _ensure_voice_connection(
-        self, requested_channel_id: Optional[int]
-    ) -> str:
-        """Ensure the bot is connected to a voice channel for notifications.
+        discord.py calls after= from the player thread once the source ends or
+        is stopped.
+        """
+        loop = finished.get_loop()
+
+        def resolve() -> None:
+            if not finished.done():
+                finished.set_result(None)
+
+        def after(error: Optional[Exception]) -> None:
+            if error is not None:
+                print(f"Warning: Voice playback failed: {error}")
+            loop.call_soon_threadsafe(resolve)
+
+        return after
+
+    async def _prefetch_notification(self, item: VoiceQueueItem) -> None:
+        """Synthesize a queued notification into the audio caches ahead of its turn."""
+        voicevox = self._voicevox
+        if voicevox is None or (
+            voicevox.audio_cache is None and voicevox.disk_cache is None
+        ):
+            return  # Nowhere to keep the audio until the item plays
+        chunks = split_sentences(item.message, self.voice_chunk_max_chars) or [
+            item.message
+        ]
+        decision = self._backlog_decision(item)
+        if decision is not None and decision.text_only:
+            return  # Will be posted as text only
+        prosody = (
+            {"speed_scale": decision.speed_scale}
+            if decision is not None and decision.speed_scale
+            else {}
+        )
+        if all(
+            voicevox.is_cached(chunk, item.speaker_id, **prosody) for chunk in chunks
+        ):
+            return
+        if self.voice_require_listeners and not self._listener_count(
+            item.voice_channel_id
+        ):
+            return  # Likely skipped; synthesize only once someone is there
+        if not await self._voicevox_available():
+            return
+        await voicevox.batch_text_to_speech(
+            chunks, item.speaker_id, priority=item.priority, **prosody
+        )
 
-        Returns the connected channel name or raises an exception if connection fails.
+    def _backlog_decision(self, item: VoiceQueueItem) -> Optional[BacklogDecision]:
+        """Apply the backlog policy to a notification.
+
+        The backlog covers the playing notification and everything queued,
+        including the item itself.
+
+        Returns:
+            The policy's decision, or None without a policy
         """
+        policy = self.voice_backlog
+        if policy is None:
+            return None
+        queue = self._voice_queue
+        items = [queue.current] if queue.current is not None else []
+        items += [
+            pending for pending in queue.pending() if pending is not queue.current
+        ]
+        if item not in items:
+            items.append(item)
+        backlog = policy.backlog_seconds(queued.message for queued in items)
+        return policy.decide(item.priority, backlog)
+
+    def _listener_count(self, voice_channel_id: Optional[int]) -> Optional[int]:
+        """Count the human members of the notification voice channel.
+
+        Membership comes from discord.py's voice state cache, which is kept up
+        to date by voice state events.
 
-        # If already connected, reuse the existing connection
-        if self._voice_client and self._voice_client.is_connected():
-            return self._voice_client.channel.name
+        Returns:
+            Number of non-bot members, or None if the channel is unknown
+        """
+        voice_client = self._voice_client
+        if voice_client is not None and voice_client.is_connected():
+            channel = voice_client.channel
+        elif self._client is not None:
+            channel = self._client.get_channel(
+                voice_channel_id or self.voice_channel_id  # type: ignore[arg-type]
+            )
+        else:
+            return None
+        if not isinstance(channel, discord.VoiceChannel):
+            return None
+        return sum(1 for member in channel.members if not member.bot)
 
-        channel_id = requested_channel_id or self.voice_channel_id
-        if not channel_id:
-            raise RuntimeError("Voice channel ID is required for voice notifications")
+    async def _wait_for_listeners(self, voice_channel_id: Optional[int]) -> bool:
+        """Wait up to voice_listener_wait seconds for a human in the voice channel.
 
-        voice_channel = self._client.get_channel(channel_id)  # type: ignore
-        if voice_channel is None:
-            raise RuntimeError(f"Voice channel {channel_id} not found")
+        Returns:
+            Whether someone is listening (True if it cannot be determined)
+        """
+        deadline = time.monotonic() + self.voice_listener_wait
+        while True:
+            count = self._listener_count(voice_channel_id)
+            if count is None or count > 0:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._voice_members_changed.clear()
+            try:
+                await asyncio.wait_for(
+                    self._voice_members_changed.wait(), timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                pass
 
-        if not isinstance(voice_channel, discord.VoiceChannel):
-            raise RuntimeError(f"Channel {channel_id} is not a voice channel")
+    def _stop_playback(self) -> None:
+        """Stop the notification that is playing (used by !skip and preemption)."""
+        if self._voice_client is not None and self._voice_client.is_playing():
+            self._voice_client.stop()
 
-        self._voice_client = await voice_channel.connect()
-        return voice_channel.name
+    async def _resolve_speaker(self, speaker_id: int, speaker: Optional[str]) -> int:
+        """Validate the requested speaker against the speaker catalog.
 
-    async def _auto_connect_voice(self) -> None:
-        """Automatically connect to voice channel if configured."""
-        if not self.voice_channel_id:
+        Args:
+            speaker_id: Requested VoiceVox speaker ID
+            speaker: Requested speaker name (takes precedence if provided)
+
+        Returns:
+            VoiceVox speaker ID to synthesize with
+
+        Raises:
+            ValueError: If the speaker is unknown
+        """
+        catalog = self._speaker_catalog
+        if speaker is not None:
+            if catalog is None:
+                raise ValueError("Speaker names require the VoiceVox speaker catalog")
+            await catalog.ensure_fresh()
+            return catalog.resolve(speaker).style_id
+
+        if catalog is None or not catalog.loaded:
+            return speaker_id  # Nothing to validate against yet
+        if speaker_id not in catalog and catalog.stale:
+            await catalog.ensure_fresh()  # The engine may have gained speakers
+        if speaker_id not in catalog:
+            raise ValueError(f"Unknown VoiceVox speaker_id: {speaker_id}")
+        return speaker_id
+
+    async def _voicevox_available(self) -> bool:
+        """Return whether VoiceVox is available.
+
+        Reads the health monitor's cached state when it is running, so callers
+        do not wait for a probe.
+        """
+        if self._voicevox is None:
+            return False
+        if self._voicevox_health is not None:
+            return self._voicevox_health.available
+        return await self._voicevox.is_available()
+
+    def _fill_opus_cache(self, key: tuple, pcm: memoryview) -> None:
+        """Encode a repeatedly played phrase to Opus in the background.
+
+        Args:
+            key: Cache key from AudioCache.make_key
+            pcm: 48 kHz stereo PCM of the phrase
+        """
+        cache = self.opus_cache
+        if cache is None or key in cache:
             return
 
-        try:
-            voice_channel = self._client.get_channel(self.voice_channel_id)  # type: ignore
-            if voice_channel is None:
-                print(
-                    f"Warning: Voice channel {self.voice_channel_id} not found. Skipping auto-connect."
+        async def fill() -> None:
+            try:
+                packets = await asyncio.to_thread(
+                    encode_opus_packets, pcm, cache.bitrate, cache.complexity
                 )
+            except discord.opus.OpusNotLoaded:
+                print("Warning: libopus is not available, disabling the Opus cache")
+                self.opus_cache = None
                 return
+            cache.put(key, packets)
 
-            if not isinstance(voice_channel, discord.VoiceChannel):
-                print(
-                    f"Warning: Channel {self.voice_channel_id} is not a voice channel. Skipping auto-connect."
-                )
-                return
+        task = asyncio.create_task(fill())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _ensure_voice_connection(
+        self, requested_channel_id: Optional[int]
+    ) -> str:
+        """Ensure the bot is connected to a voice channel for notifications.
 
-            self._voice_client = await voice_channel.connect()
+        Returns the connected channel name or raises an exception if connection fails.
+        The supervisor normally has the connection ready, so this only connects
+        inline if the background (re)connect has not succeeded yet.
+        """
+        voice_client = await self._voice_connection.ensure(
+            requested_channel_id or self.voice_channel_id
+        )
+        return voice_client.channel.name
+
+    async def _auto_connect_voice(self) -> None:
+        """Automatically connect to voice channel if configured."""
+        if not self.voice_channel_id:
+            return
+
+        try:
+            voice_client = await self._voice_connection.connect(self.voice_channel_id)
             print(
-                f"Auto-connected to voice channel: {voice_channel.name} (ID: {self.voice_channel_id})"
+                f"Auto-connected to voice channel: {voice_client.channel.name} (ID: {self.voice_channel_id})"
             )
 
         except Exception as e:
@@ -490,7 +1029,7 @@ class DiscordLogger:
 
         # Connect to voice channel
         try:
-            self._voice_client = await voice_channel.connect()
+            await self._voice_connection.connect(voice_channel_id)
             await message.reply(
                 f"✅ Connected to voice channel: **{voice_channel.name}**\n"
                 f"Voice notifications will now be played in this channel.\n"
@@ -517,8 +1056,8 @@ class DiscordLogger:
         channel_name = self._voice_client.channel.name
 
         try:
-            await self._voice_client.disconnect()
-            self._voice_client = None
+            # Stay disconnected until the next notification needs the channel
+            await self._voice_connection.release()
             await message.reply(
                 f"✅ Disconnected from voice channel: **{channel_name}**"
             )
@@ -571,10 +1110,20 @@ class DiscordLogger:
 
     async def close(self) -> None:
         """Close the Discord client."""
+        for task in self._background_tasks:
+            task.cancel()
+
+        await self._voice_queue.stop()
+        await self._voice_connection.stop()
+
+        if self._voicevox_health is not None:
+            await self._voicevox_health.stop()
+
         # Disconnect from voice if connected
-        if self._voice_client and self._voice_client.is_connected():
-            await self._voice_client.disconnect()
-            self._voice_client = None
+        await self._voice_connection.release()
+
+        if self._voicevox is not None:
+            await self._voicevox.close()
 
         if self._client is not None:
             await self._client.close()
@@ -46,6 +46,20 @@ class NotifyVoiceRequest(BaseModel):
     speaker_id: int = Field(
         default=1, description="VoiceVox speaker ID (default: 1 = 四国めたん ノーマル)"
     )
+    speaker: Optional[str] = Field(
+        default=None,
+        description=(
+            "VoiceVox speaker name, optionally with a style as 'speaker/style' "
+            "(e.g. 'ずんだもん/あまあま'); overrides speaker_id"
+        ),
+    )
+    wait: bool = Field(
+        default=True,
+        description=(
+            "Wait until the message has been played (default: true). "
+            "Set to false to return a job id as soon as the notification is queued"
+        ),
+    )
 
 
 class ConversationLoggerServer:
@@ -90,7 +104,8 @@ class ConversationLoggerServer:
                     name="notify_voice",
                     description=(
                         "Send a voice notification to a Discord voice channel while also logging the message to text. "
-                        "Both text and TTS playback are performed; if audio playback fails the tool returns an error."
+                        "Both text and TTS playback are performed; if audio playback fails the tool returns an error. "
+                        "With wait=false the tool returns as soon as the notification is queued."
                     ),
                     inputSchema=NotifyVoiceRequest.model_json_schema(),
                 ),
@@ -163,16 +178,37 @@ class ConversationLoggerServer:
                                 "message": request.message,
                                 "priority": request.priority,
                                 "speaker_id": request.speaker_id,
+                                "speaker": request.speaker,
+                                "wait": request.wait,
                             },
                         )
                         response.raise_for_status()
+
+                        if not request.wait:
+                            job_id = response.json()["job_id"]
+                            return [
+                                TextContent(
+                                    type="text",
+                                    text=(
+                                        f"Voice notification queued (job {job_id}); "
+                                        f"status: GET {self.bot_daemon_url}/notify_voice/{job_id}"
+                                    ),
+                                )
+                            ]
+
                         result = response.json()["result"]
 
                         # Build response message
-                        response_text = (
-                            f"Voice notification played in {result['voice_channel']} "
-                            f"(Speaker: {result['speaker_id']})"
-                        )
+                        if result.get("status") == "played":
+                            response_text = (
+                                f"Voice notification played in {result['voice_channel']} "
+                                f"(Speaker: {result['speaker_id']})"
+                            )
+                        else:
+                            # Skipped, cleared or merged into an identical queued notification
+                            response_text = (
+                                f"Voice notification {result.get('status', 'finished')}"
+                            )
 
                         return [TextContent(type="text", text=response_text)]
                     except httpx.HTTPError as e:
@@ -1,5 +1,7 @@
 """Configuration settings using pydantic-settings."""
 
+import json
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -35,8 +37,194 @@ class Settings(BaseSettings):
     # VoiceVox Configuration
     voicevox_url: str = Field(
         default="http://localhost:50021",
-        description="VoiceVox Engine API URL",
+        description=(
+            "VoiceVox Engine API URL, or several URLs (comma-separated or a JSON list) "
+            "to balance synthesis across engines"
+        ),
+    )
+    voicevox_timeout: float = Field(
+        default=30.0,
+        description="Timeout in seconds for VoiceVox Engine requests",
+    )
+    voicevox_max_connections: int = Field(
+        default=10,
+        description="Maximum number of pooled HTTP connections to VoiceVox Engine",
+    )
+    voicevox_max_keepalive_connections: int = Field(
+        default=5,
+        description="Maximum number of idle keep-alive connections to VoiceVox Engine",
+    )
+    voicevox_keepalive_expiry: float = Field(
+        default=60.0,
+        description="Seconds an idle keep-alive connection to VoiceVox Engine is kept",
+    )
+    voicevox_hedge_percentile: float | None = Field(
+        default=None,
+        description=(
+            "With several engines, also send a synthesis to a second engine once it is slower "
+            "than this percentile of recent latencies (disabled if unset)"
+        ),
+    )
+    voicevox_hedge_min_samples: int = Field(
+        default=20,
+        description="Syntheses observed before hedging starts",
+    )
+    voicevox_adaptive_concurrency: bool = Field(
+        default=True,
+        description="Adapt the number of concurrent VoiceVox syntheses to observed latency",
+    )
+    voicevox_concurrency_initial: int = Field(
+        default=4,
+        description="Initial concurrent VoiceVox synthesis limit",
+    )
+    voicevox_concurrency_max: int = Field(
+        default=16,
+        description="Upper bound of the adaptive VoiceVox synthesis limit",
+    )
+    voicevox_health_interval: float = Field(
+        default=10.0,
+        description="Seconds between background VoiceVox health checks while the engine is healthy",
+    )
+    voicevox_breaker_failure_threshold: int = Field(
+        default=3,
+        description="Consecutive VoiceVox failures that open the circuit breaker",
+    )
+    voicevox_breaker_reset_timeout: float = Field(
+        default=5.0,
+        description="Initial seconds before probing VoiceVox again after the circuit opens",
+    )
+    voicevox_breaker_max_reset_timeout: float = Field(
+        default=60.0,
+        description="Maximum backoff in seconds between probes while VoiceVox is down",
+    )
+    voicevox_speaker_cache_ttl: float = Field(
+        default=3600.0,
+        description="Seconds the VoiceVox speaker list is cached before it is fetched again",
+    )
+    voice_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Maximum size in bytes of the in-memory synthesized audio cache (0 disables it)",
+    )
+    voice_disk_cache_dir: str | None = Field(
+        default=None,
+        description="Directory of the persistent synthesized audio cache (disabled if unset)",
+    )
+    voice_disk_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="Maximum size in bytes of the persistent synthesized audio cache",
+    )
+    voice_query_cache_entries: int = Field(
+        default=512,
+        description="Maximum number of cached VoiceVox audio_query results (0 disables it)",
+    )
+    voice_chunk_max_chars: int = Field(
+        default=80,
+        description="Maximum characters per sentence chunk synthesized for long voice messages",
     )
+    voice_synthesis_concurrency: int = Field(
+        default=2,
+        description="Maximum number of sentence chunks synthesized concurrently",
+    )
+    voice_warmup_speaker_ids: str = Field(
+        default="",
+        description="Speaker IDs initialized on the VoiceVox Engine at startup (comma-separated or JSON list)",
+    )
+    voice_warmup_phrases: str = Field(
+        default="",
+        description="Phrases pre-rendered into the audio cache at startup (comma-separated or JSON list)",
+    )
+    voice_batch_synthesis: bool = Field(
+        default=True,
+        description="Synthesize the remaining chunks of a long message in one VoiceVox /multi_synthesis request",
+    )
+    voice_streaming_synthesis: bool = Field(
+        default=False,
+        description="Start playback while the VoiceVox synthesis response is still streaming",
+    )
+    voice_preemption: bool = Field(
+        default=False,
+        description="Let high-priority voice notifications interrupt a normal one, which resumes afterwards",
+    )
+    voice_dedup_window: float = Field(
+        default=0.0,
+        description="Seconds within which identical queued voice notifications are merged into one (0 disables it)",
+    )
+    voice_idle_timeout: float = Field(
+        default=0.0,
+        description="Seconds without voice playback before the voice connection is released (0 keeps it)",
+    )
+    voice_reconnect_max_delay: float = Field(
+        default=60.0,
+        description="Upper bound in seconds of the exponential backoff between voice reconnect attempts",
+    )
+    voice_require_listeners: bool = Field(
+        default=False,
+        description="Skip voice synthesis and playback while no human member is in the voice channel",
+    )
+    voice_listener_wait: float = Field(
+        default=0.0,
+        description="Seconds a voice notification waits for someone to join the voice channel before it is skipped",
+    )
+    voice_backlog_speed_steps: str = Field(
+        default="",
+        description=(
+            "Speech speed applied as the estimated voice backlog grows, as 'seconds:speed' "
+            "entries (e.g. '20:1.2,40:1.4'; comma-separated or JSON list)"
+        ),
+    )
+    voice_backlog_text_only_seconds: float = Field(
+        default=0.0,
+        description="Voice backlog in seconds above which normal-priority notifications are posted as text only (0 disables it)",
+    )
+    voice_opus_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        description="Maximum size in bytes of pre-encoded Opus packets for repeated phrases (0 disables it)",
+    )
+    voice_opus_bitrate: int = Field(
+        default=64,
+        description="Opus encoder bitrate in kbps used to fill the Opus packet cache",
+    )
+    voice_opus_complexity: int = Field(
+        default=10,
+        description="Opus encoder complexity (0-10) used to fill the Opus packet cache",
+    )
+
+    @property
+    def voicevox_urls(self) -> list[str]:
+        """VoiceVox Engine URLs parsed from voicevox_url."""
+        return _parse_list(self.voicevox_url)
+
+    @property
+    def warmup_speaker_ids(self) -> list[int]:
+        """Speaker IDs parsed from voice_warmup_speaker_ids."""
+        return [
+            int(speaker_id) for speaker_id in _parse_list(self.voice_warmup_speaker_ids)
+        ]
+
+    @property
+    def warmup_phrases(self) -> list[str]:
+        """Phrases parsed from voice_warmup_phrases."""
+        return _parse_list(self.voice_warmup_phrases)
+
+    @property
+    def backlog_speed_steps(self) -> list[tuple[float, float]]:
+        """(backlog seconds, speed) pairs parsed from voice_backlog_speed_steps."""
+        steps = []
+        for step in _parse_list(self.voice_backlog_speed_steps):
+            seconds, sep, speed = step.partition(":")
+            if not sep:
+                raise ValueError(
+                    f"Invalid VOICE_BACKLOG_SPEED_STEPS entry {step!r}, expected 'seconds:speed'"
+                )
+            steps.append((float(seconds), float(speed)))
+        return steps
+
+
+def _parse_list(value: str) -> list[str]:
+    """Parse a comma-separated or JSON list setting into non-empty strings."""
+    value = value.strip()
+    items = json.loads(value) if value.startswith("[") else value.split(",")
+    return [str(item).strip() for item in items if str(item).strip()]
 
 
 def get_settings() -> Settings:
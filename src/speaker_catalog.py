@@ -0,0 +1,218 @@
+"""Cached, indexed catalog of VoiceVox speakers and styles."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from .tts_cache import normalize_text  # type: ignore
+from .voicevox_client import VoiceVoxClient  # type: ignore
+
+# Separator between speaker and style in names such as "ずんだもん/あまあま"
+STYLE_SEPARATOR = "/"
+
+
+@dataclass(frozen=True)
+class SpeakerStyle:
+    """One VoiceVox style (the unit addressed by speaker_id)."""
+
+    style_id: int
+    speaker_name: str
+    style_name: str
+    speaker_uuid: str = ""
+    type: str = "talk"
+
+    @property
+    def label(self) -> str:
+        """Human readable name, e.g. "ずんだもん/あまあま"."""
+        return f"{self.speaker_name}{STYLE_SEPARATOR}{self.style_name}"
+
+
+def _name_key(name: str) -> str:
+    """Normalize a speaker or style name for lookups."""
+    return normalize_text(name).casefold()
+
+
+class SpeakerCatalog:
+    """TTL-cached copy of ``/speakers`` indexed by style ID and by name.
+
+    Lookups are dictionary reads against the last fetched catalog, so a
+    speaker_id can be validated without contacting the engine. Concurrent
+    refreshes share a single ``/speakers`` request.
+    """
+
+    def __init__(
+        self,
+        client: VoiceVoxClient,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the speaker catalog.
+
+        Args:
+            client: VoiceVox client used to fetch /speakers
+            ttl: Seconds before the catalog is considered stale (default: 3600.0)
+            clock: Monotonic time source (for testing)
+        """
+        self.client = client
+        self.ttl = ttl
+        self.refreshes = 0
+        self._clock = clock
+        self._speakers: List[Dict[str, Any]] = []
+        self._by_id: Dict[int, SpeakerStyle] = {}
+        self._by_name: Dict[str, SpeakerStyle] = {}
+        self._by_speaker: Dict[str, List[SpeakerStyle]] = {}
+        self._loaded_at: Optional[float] = None
+        self._refreshing: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the catalog has been fetched at least once."""
+        return self._loaded_at is not None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the catalog is missing or older than the TTL."""
+        return self._loaded_at is None or self._clock() - self._loaded_at >= self.ttl
+
+    def __contains__(self, style_id: int) -> bool:
+        return style_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    async def refresh(self) -> None:
+        """Fetch /speakers and rebuild the indexes.
+
+        Callers arriving while a refresh is in flight wait for that refresh
+        instead of sending another request.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._fetch())
+        # Shield so one cancelled caller does not cancel the shared request
+        await asyncio.shield(self._refreshing)
+
+    async def ensure_fresh(self) -> None:
+        """Refresh the catalog if it is stale.
+
+        A failed refresh keeps serving the previous catalog if there is one.
+
+        Raises:
+            httpx.HTTPError: If the catalog was never loaded and the request fails
+        """
+        if not self.stale:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            if not self.loaded:
+                raise
+            print(f"Warning: Failed to refresh VoiceVox speakers: {e}")
+
+    async def _fetch(self) -> None:
+        """Fetch the speaker list and swap in new indexes."""
+        speakers = await self.client.get_speakers()
+        by_id: Dict[int, SpeakerStyle] = {}
+        by_name: Dict[str, SpeakerStyle] = {}
+        by_speaker: Dict[str, List[SpeakerStyle]] = {}
+        for speaker in speakers:
+            speaker_key = _name_key(speaker["name"])
+            for style in speaker.get("styles", []):
+                entry = SpeakerStyle(
+                    style_id=style["id"],
+                    speaker_name=speaker["name"],
+                    style_name=style["name"],
+                    speaker_uuid=speaker.get("speaker_uuid", ""),
+                    type=style.get("type", "talk"),
+                )
+                by_id[entry.style_id] = entry
+                by_speaker.setdefault(speaker_key, []).append(entry)
+                by_name.setdefault(
+                    speaker_key + STYLE_SEPARATOR + _name_key(entry.style_name), entry
+                )
+                if entry.type == "talk":
+                    # A bare speaker name selects its first talk style
+                    by_name.setdefault(speaker_key, entry)
+
+        self._speakers = speakers
+        self._by_id = by_id
+        self._by_name = by_name
+        self._by_speaker = by_speaker
+        self._loaded_at = self._clock()
+        self.refreshes += 1
+
+    async def get_speakers(self) -> List[Dict[str, Any]]:
+        """Return the raw /speakers list, refreshing it if stale.
+
+        Returns:
+            List of speakers as returned by the engine
+        """
+        await self.ensure_fresh()
+        return self._speakers
+
+    def get_style(self, style_id: int) -> Optional[SpeakerStyle]:
+        """Look up a style by ID (speaker_id).
+
+        Args:
+            style_id: VoiceVox style ID
+
+        Returns:
+            The style, or None if unknown
+        """
+        return self._by_id.get(style_id)
+
+    def find(self, name: str) -> Optional[SpeakerStyle]:
+        """Look up a style by name.
+
+        Args:
+            name: Speaker name ("ずんだもん", first talk style) or
+                "speaker/style" ("ずんだもん/あまあま"); case and width insensitive
+
+        Returns:
+            The style, or None if unknown
+        """
+        return self._by_name.get(_name_key(name))
+
+    def styles_of(self, speaker_name: str) -> List[SpeakerStyle]:
+        """Return every style of a speaker (empty if unknown)."""
+        return list(self._by_speaker.get(_name_key(speaker_name), []))
+
+    def resolve(self, speaker: str) -> SpeakerStyle:
+        """Resolve a style ID or name to a style.
+
+        Args:
+            speaker: Style ID as a string, speaker name or "speaker/style"
+
+        Returns:
+            The matching style
+
+        Raises:
+            ValueError: If no style matches
+        """
+        style = self.find(speaker)
+        if style is None and speaker.strip().isdigit():
+            style = self.get_style(int(speaker))
+        if style is None:
+            raise ValueError(f"Unknown VoiceVox speaker: {speaker}")
+        return style
+
+    def stats(self) -> Dict[str, Any]:
+        """Return catalog counters.
+
+        Returns:
+            Dictionary with speakers, styles, age and refreshes
+        """
+        return {
+            "speakers": len(self._speakers),
+            "styles": len(self._by_id),
+            "age": (
+                round(self._clock() - self._loaded_at, 1)
+                if self._loaded_at is not None
+                else None
+            ),
+            "ttl": self.ttl,
+            "refreshes": self.refreshes,
+        }
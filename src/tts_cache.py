@@ -0,0 +1,457 @@
+"""Caches for synthesized VoiceVox audio."""
+
+import copy
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Hashable, Optional
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so that trivially different inputs share a cache entry.
+
+    Applies NFKC normalization (full-width/half-width folding) and collapses
+    runs of whitespace.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class AudioCache:
+    """Byte-size-bounded LRU cache of synthesized WAV audio."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        """Initialize the audio cache.
+
+        Args:
+            max_bytes: Maximum total size of cached audio in bytes (default: 32 MiB)
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        text: str,
+        speaker_id: int,
+        speed_scale: float | None = None,
+        volume_scale: float | None = None,
+        pitch_scale: float | None = None,
+    ) -> tuple:
+        """Build a cache key from synthesis parameters.
+
+        Args:
+            text: Text to speak
+            speaker_id: VoiceVox speaker ID
+            speed_scale: Speech speed multiplier (None = engine default)
+            volume_scale: Volume multiplier (None = engine default)
+            pitch_scale: Pitch shift (None = engine default)
+
+        Returns:
+            Hashable cache key
+        """
+        return (
+            normalize_text(text),
+            speaker_id,
+            speed_scale,
+            volume_scale,
+            pitch_scale,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def size(self) -> int:
+        """Total size of cached audio in bytes."""
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Look up audio and mark it as most recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached audio, or None on a miss
+        """
+        audio = self._entries.get(key)
+        if audio is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return audio
+
+    def put(self, key: Hashable, audio: bytes) -> None:
+        """Store audio, evicting least recently used entries to stay within max_bytes.
+
+        Audio larger than max_bytes is not cached.
+
+        Args:
+            key: Cache key from make_key
+            audio: Audio data
+        """
+        size = self._size_of(audio)
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= self._size_of(previous)
+
+        self._entries[key] = audio
+        self._size += size
+
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= self._size_of(evicted)
+            self.evictions += 1
+
+    @staticmethod
+    def _size_of(audio: Any) -> int:
+        """Return the size of a cached value in bytes."""
+        return len(audio)
+
+    def clear(self) -> None:
+        """Remove all cached audio (counters are kept)."""
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary with entries, size, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class OpusPacketCache(AudioCache):
+    """Byte-size-bounded LRU cache of pre-encoded Opus packet sequences.
+
+    Entries use AudioCache keys and hold one Opus packet per 20 ms frame, so a
+    frequently played phrase can be sent to Discord without re-encoding. The
+    encoder settings used to fill the cache are kept alongside it.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        bitrate: int = 64,
+        complexity: int = 10,
+    ):
+        """Initialize the Opus packet cache.
+
+        Args:
+            max_bytes: Maximum total size of cached packets in bytes (default: 16 MiB)
+            bitrate: Encoder bitrate in kbps used when filling the cache (default: 64)
+            complexity: Encoder complexity (0-10) used when filling the cache (default: 10)
+        """
+        super().__init__(max_bytes)
+        self.bitrate = bitrate
+        self.complexity = complexity
+
+    @staticmethod
+    def _size_of(audio: Any) -> int:
+        return sum(len(packet) for packet in audio)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters and encoder settings."""
+        return {
+            **super().stats(),
+            "bitrate": self.bitrate,
+            "complexity": self.complexity,
+        }
+
+
+class AudioQueryCache:
+    """Entry-count-bounded LRU cache of VoiceVox audio_query results.
+
+    An audio query (accent phrases, mora) depends only on text and speaker, so
+    one entry serves every speed/volume/pitch variation of the same text.
+    Lookups return a deep copy so callers can adjust prosody freely.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """Initialize the audio query cache.
+
+        Args:
+            max_entries: Maximum number of cached queries (default: 512)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(text: str, speaker_id: int) -> tuple:
+        """Build a cache key from the text and speaker."""
+        return (normalize_text(text), speaker_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        """Look up a query and mark it as most recently used.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Copy of the cached audio query, or None on a miss
+        """
+        query = self._entries.get(key)
+        if query is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(query)
+
+    def put(self, key: Hashable, query: dict) -> None:
+        """Store a copy of a query, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from make_key
+            query: Audio query returned by the engine
+        """
+        self._entries[key] = copy.deepcopy(query)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary with entries, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class DiskAudioCache:
+    """Size-capped, content-addressed on-disk cache of synthesized WAV audio.
+
+    Each entry is stored as ``<sha256 of key>.wav`` in a flat directory, so the
+    cache survives restarts and several daemons on one host can share it.
+    Files are written atomically (temp file + rename), read through ``mmap``,
+    and evicted least-recently-used by access time.
+    """
+
+    SUFFIX = ".wav"
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        """Initialize the disk cache.
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Maximum total size of cached files in bytes (default: 256 MiB)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def address(key: Hashable) -> str:
+        """Return the content address (hex digest) for a cache key.
+
+        Args:
+            key: Cache key from AudioCache.make_key
+
+        Returns:
+            SHA-256 hex digest identifying the entry
+        """
+        encoded = json.dumps(key, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: Hashable) -> str:
+        """Return the file path an entry is (or would be) stored at."""
+        return os.path.join(self.directory, self.address(key) + self.SUFFIX)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return os.path.exists(self.path_for(key))
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """Record an access; atime is updated explicitly because of noatime mounts."""
+        now = time.time()
+        os.utime(path, (now, os.stat(path).st_mtime))
+
+    def get_path(self, key: Hashable) -> Optional[str]:
+        """Look up an entry and return its file path.
+
+        Args:
+            key: Cache key from AudioCache.make_key
+
+        Returns:
+            Path of the cached WAV file, or None on a miss
+        """
+        path = self.path_for(key)
+        try:
+            self._touch(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def get(self, key: Hashable) -> Optional[memoryview]:
+        """Look up an entry and return a read-only memory-mapped view of it.
+
+        Args:
+            key: Cache key from AudioCache.make_key
+
+        Returns:
+            Memory-mapped audio data, or None on a miss
+        """
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._touch(path)
+        except (FileNotFoundError, ValueError):
+            # ValueError: empty file (partially evicted/corrupt entry)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return memoryview(mapped)
+
+    def put(self, key: Hashable, audio: bytes | memoryview) -> str:
+        """Store audio atomically and evict old entries to stay within max_bytes.
+
+        Args:
+            key: Cache key from AudioCache.make_key
+            audio: Audio data
+
+        Returns:
+            Path of the cached WAV file
+        """
+        with self.writer(key) as f:
+            f.write(audio)
+        return self.path_for(key)
+
+    @contextmanager
+    def writer(self, key: Hashable) -> Iterator[BinaryIO]:
+        """Write an entry incrementally (e.g. while streaming from the engine).
+
+        The entry becomes visible atomically when the block exits normally and
+        is discarded if it raises.
+
+        Args:
+            key: Cache key from AudioCache.make_key
+
+        Yields:
+            Binary file object to write the audio to
+        """
+        path = self.path_for(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._enforce_limit(keep=path)
+
+    def _entries(self) -> list[tuple[str, os.stat_result]]:
+        """List cached files as (path, stat) pairs."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    entries.append((entry.path, entry.stat()))
+                except FileNotFoundError:
+                    continue  # Evicted concurrently by another instance
+        return entries
+
+    def _enforce_limit(self, keep: Optional[str] = None) -> None:
+        """Delete least recently accessed files until the cache fits in max_bytes."""
+        entries = self._entries()
+        total = sum(stat.st_size for _, stat in entries)
+        if total <= self.max_bytes:
+            return
+
+        for path, stat in sorted(entries, key=lambda e: e[1].st_atime):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+
+    def size(self) -> int:
+        """Total size of cached files in bytes."""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary with entries, size, hits, misses, evictions and hit_rate
+        """
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            "directory": self.directory,
+            "entries": len(entries),
+            "bytes": sum(stat.st_size for _, stat in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
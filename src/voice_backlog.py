@@ -0,0 +1,111 @@
+"""Backlog-aware degradation of voice notifications."""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+def estimate_speech_seconds(text: str, seconds_per_char: float = 0.15) -> float:
+    """Roughly estimate how long a message takes to speak at normal speed.
+
+    Args:
+        text: Message to speak
+        seconds_per_char: Average speaking time per character (default: 0.15)
+
+    Returns:
+        Estimated duration in seconds
+    """
+    return sum(1 for ch in text if not ch.isspace()) * seconds_per_char
+
+
+@dataclass(frozen=True)
+class BacklogDecision:
+    """How one notification is delivered given the voice backlog."""
+
+    backlog_seconds: float
+    speed_scale: Optional[float] = None  # None = engine default speed
+    text_only: bool = False
+
+
+class BacklogPolicy:
+    """Keeps voice latency bounded when notifications arrive faster than they are spoken.
+
+    The backlog is the estimated speech duration of the notification that is
+    playing plus everything waiting behind it. As it grows past the
+    ``speed_steps`` thresholds, notifications are spoken faster; past
+    ``text_only_seconds``, normal-priority notifications are posted as text
+    only, so the queue drains instead of announcements arriving minutes late.
+    """
+
+    def __init__(
+        self,
+        speed_steps: Sequence[Tuple[float, float]] = (),
+        text_only_seconds: float = 0.0,
+        seconds_per_char: float = 0.15,
+    ):
+        """Initialize the policy.
+
+        Args:
+            speed_steps: (backlog seconds, speed_scale) pairs; the highest
+                threshold reached applies (default: () = never speed up)
+            text_only_seconds: Backlog in seconds above which normal-priority
+                notifications are shed to text only (default: 0.0 = never)
+            seconds_per_char: Speaking time per character used for estimates (default: 0.15)
+        """
+        self.speed_steps = sorted(speed_steps)
+        self.text_only_seconds = text_only_seconds
+        self.seconds_per_char = seconds_per_char
+        self.sped_up = 0
+        self.text_only = 0
+        self.last_backlog_seconds = 0.0
+
+    def estimate(self, text: str) -> float:
+        """Estimate the speech duration of a message in seconds."""
+        return estimate_speech_seconds(text, self.seconds_per_char)
+
+    def backlog_seconds(self, messages: Iterable[str]) -> float:
+        """Estimate the total speech duration of the given messages."""
+        return sum(self.estimate(message) for message in messages)
+
+    def decide(self, priority: str, backlog_seconds: float) -> BacklogDecision:
+        """Decide how to deliver a notification.
+
+        Args:
+            priority: Notification priority ("normal" or "high")
+            backlog_seconds: Current backlog estimate (see backlog_seconds)
+
+        Returns:
+            Speed to synthesize with, or text-only delivery
+        """
+        if (
+            self.text_only_seconds > 0
+            and priority != "high"
+            and backlog_seconds > self.text_only_seconds
+        ):
+            return BacklogDecision(backlog_seconds, text_only=True)
+
+        speed_scale = None
+        for threshold, speed in self.speed_steps:
+            if backlog_seconds >= threshold:
+                speed_scale = speed
+        return BacklogDecision(backlog_seconds, speed_scale=speed_scale)
+
+    def record(self, decision: BacklogDecision) -> None:
+        """Count a decision that was applied to a notification."""
+        self.last_backlog_seconds = round(decision.backlog_seconds, 1)
+        if decision.text_only:
+            self.text_only += 1
+        elif decision.speed_scale is not None:
+            self.sped_up += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return policy counters.
+
+        Returns:
+            Dictionary with the last backlog estimate and decision counters
+        """
+        return {
+            "backlog_seconds": self.last_backlog_seconds,
+            "sped_up": self.sped_up,
+            "text_only": self.text_only,
+        }
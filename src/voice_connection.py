@@ -0,0 +1,272 @@
+"""Background supervision of the persistent Discord voice connection."""
+
+import asyncio
+import random
+import time
+from collections.abc import Callable
+from typing import Any, Dict, Optional
+
+import discord
+from discord import VoiceClient
+
+
+class VoiceConnectionSupervisor:
+    """Keeps the voice connection ready so notifications never wait for a connect.
+
+    A background task watches the connection. While it is wanted (after a
+    connect, or whenever notifications are queued) a dropped connection is
+    re-established with exponential backoff and jitter, instead of being
+    discovered by the next notification. ``wake()`` connects ahead of time as
+    soon as a notification is queued. After ``idle_timeout`` seconds without
+    playback the connection is released; the next notification wakes it again.
+    """
+
+    def __init__(
+        self,
+        get_channel: Callable[[int], Any],
+        channel_id: Optional[int] = None,
+        busy: Callable[[], bool] = lambda: False,
+        idle_timeout: float = 0.0,
+        check_interval: float = 5.0,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        jitter: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the supervisor.
+
+        Args:
+            get_channel: Looks up a Discord channel by ID (e.g. client.get_channel)
+            channel_id: Default voice channel ID (optional)
+            busy: Returns whether notifications are queued or playing
+            idle_timeout: Seconds without playback before the connection is
+                released (default: 0.0 = keep it)
+            check_interval: Seconds between connection checks (default: 5.0)
+            backoff_base: First reconnect delay in seconds, doubled per failure (default: 1.0)
+            backoff_max: Upper bound of the reconnect delay in seconds (default: 60.0)
+            jitter: Fraction of the delay randomized to spread retries (default: 0.5)
+            clock: Monotonic time source (for testing)
+        """
+        self.get_channel = get_channel
+        self.channel_id = channel_id
+        self.busy = busy
+        self.idle_timeout = idle_timeout
+        self.check_interval = check_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.voice_client: Optional[VoiceClient] = None
+        self.wanted = False
+        self.connects = 0
+        self.reconnects = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.idle_releases = 0
+        self.last_connect_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._clock = clock
+        self._last_used = clock()
+        self._retry_at = 0.0
+        self._lock = asyncio.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the voice connection is up."""
+        return self.voice_client is not None and self.voice_client.is_connected()
+
+    def attach(self, voice_client: Optional[VoiceClient]) -> None:
+        """Adopt a connection made elsewhere (e.g. !join), or forget it (None)."""
+        self.voice_client = voice_client
+        self.wanted = voice_client is not None
+        if voice_client is not None:
+            channel = getattr(voice_client, "channel", None)
+            self.channel_id = getattr(channel, "id", None) or self.channel_id
+            self.touch()
+
+    def touch(self) -> None:
+        """Record voice activity, postponing the idle release."""
+        self._last_used = self._clock()
+
+    def wake(self) -> None:
+        """Connect in the background now if a notification needs the connection."""
+        self.touch()
+        if self._wakeup is not None and not self.connected:
+            self._retry_at = 0.0  # A waiting notification skips the backoff
+            self._wakeup.set()
+
+    async def ensure(self, channel_id: Optional[int] = None) -> VoiceClient:
+        """Return a connected voice client, connecting now if needed.
+
+        Args:
+            channel_id: Voice channel to connect to (default: the configured one)
+
+        Returns:
+            Connected voice client
+
+        Raises:
+            RuntimeError: If the channel is missing or not a voice channel
+        """
+        self.touch()
+        if self.connected:
+            return self.voice_client  # type: ignore[return-value]
+        return await self.connect(channel_id)
+
+    async def connect(self, channel_id: Optional[int] = None) -> VoiceClient:
+        """Connect to a voice channel, sharing an attempt already in progress.
+
+        Args:
+            channel_id: Voice channel to connect to (default: the configured one)
+
+        Returns:
+            Connected voice client
+
+        Raises:
+            RuntimeError: If the channel is missing or not a voice channel
+        """
+        async with self._lock:
+            if self.connected:
+                return self.voice_client  # type: ignore[return-value]
+
+            channel_id = channel_id or self.channel_id
+            if not channel_id:
+                raise RuntimeError(
+                    "Voice channel ID is required for voice notifications"
+                )
+            voice_channel = self.get_channel(channel_id)
+            if voice_channel is None:
+                raise RuntimeError(f"Voice channel {channel_id} not found")
+            if not isinstance(voice_channel, discord.VoiceChannel):
+                raise RuntimeError(f"Channel {channel_id} is not a voice channel")
+
+            reconnecting = self.wanted  # The connection we meant to keep dropped
+            stale = self.voice_client
+            if stale is not None:
+                # A dropped client still occupies the guild's voice slot
+                try:
+                    await stale.disconnect(force=True)
+                except Exception:
+                    pass
+
+            started_at = time.perf_counter()
+            try:
+                self.voice_client = await voice_channel.connect()
+            except Exception as e:
+                self.voice_client = None
+                self.channel_id = channel_id
+                self.wanted = True  # Keep retrying in the background
+                self._record_failure(e)
+                raise
+            self.last_connect_ms = round((time.perf_counter() - started_at) * 1000, 1)
+            self.channel_id = channel_id
+            self.wanted = True
+            self.connects += 1
+            if reconnecting:
+                self.reconnects += 1
+            self.consecutive_failures = 0
+            self._retry_at = 0.0
+            self.touch()
+            return self.voice_client
+
+    async def release(self) -> None:
+        """Disconnect and stop reconnecting until the connection is needed again."""
+        self.wanted = False
+        async with self._lock:
+            voice_client, self.voice_client = self.voice_client, None
+            if voice_client is not None and voice_client.is_connected():
+                await voice_client.disconnect()
+
+    def _record_failure(self, error: Exception) -> None:
+        """Schedule the next reconnect with exponential backoff and jitter."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = str(error)
+        delay = min(
+            self.backoff_max,
+            self.backoff_base * 2 ** (self.consecutive_failures - 1),
+        )
+        delay *= 1 - self.jitter * random.random()
+        self._retry_at = self._clock() + delay
+
+    def _idle(self) -> bool:
+        """Whether the connection has gone unused for longer than idle_timeout."""
+        if self.idle_timeout <= 0 or self.busy():
+            return False
+        if self.voice_client is not None and self.voice_client.is_playing():
+            return False
+        return self._clock() - self._last_used >= self.idle_timeout
+
+    async def check(self) -> None:
+        """Reconnect a wanted connection or release an idle one."""
+        if self.connected:
+            if self._idle():
+                await self.release()
+                self.idle_releases += 1
+                print("Released idle voice connection")
+            return
+
+        if not (self.wanted or self.busy()) or not self.channel_id:
+            return
+        if self._clock() < self._retry_at:
+            return
+        try:
+            await self.connect()
+        except Exception as e:
+            print(
+                f"Warning: Voice reconnect failed ({self.consecutive_failures} in a row): {e}"
+            )
+
+    async def _run(self) -> None:
+        """Check the connection until stopped."""
+        assert self._wakeup is not None
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                print(f"Warning: Voice connection check failed: {e}")
+            delay = self.check_interval
+            if not self.connected and self._retry_at:
+                delay = min(delay, max(self._retry_at - self._clock(), 0.1))
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start supervising in the background."""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop supervising (the connection itself is left as it is)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the connection state.
+
+        Returns:
+            Dictionary with connection state, counters and reconnect backoff
+        """
+        return {
+            "connected": self.connected,
+            "channel_id": self.channel_id,
+            "wanted": self.wanted,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in": round(max(0.0, self._retry_at - self._clock()), 1),
+            "idle_releases": self.idle_releases,
+            "last_connect_ms": self.last_connect_ms,
+            "last_error": self.last_error,
+        }
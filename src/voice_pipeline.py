@@ -0,0 +1,109 @@
+"""Text chunking and pipelined synthesis for voice notifications."""
+
+import asyncio
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Split after Japanese/full-width terminators and newlines, or after ASCII
+# sentence punctuation followed by whitespace ("v1.2" stays intact).
+_SENTENCE_END = re.compile(r"(?<=[。！？…\n])|(?<=[.!?])(?=\s)")
+# Preferred places to break a sentence that is longer than the chunk limit
+_CLAUSE_END = re.compile(r"(?<=[、，,;；:：])|(?<=\s)")
+
+
+def _split_long(sentence: str, max_chars: int) -> list[str]:
+    """Split a sentence longer than max_chars at clause boundaries."""
+    parts: list[str] = []
+    current = ""
+    for clause in _CLAUSE_END.split(sentence):
+        while len(clause) > max_chars:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(clause[:max_chars])
+            clause = clause[max_chars:]
+        if current and len(current) + len(clause) > max_chars:
+            parts.append(current)
+            current = ""
+        current += clause
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_sentences(text: str, max_chars: int = 80) -> list[str]:
+    """Split text into chunks at Japanese/English sentence boundaries.
+
+    The first sentence is kept as its own chunk so it can be synthesized and
+    played as early as possible; following sentences are packed together up
+    to max_chars. Sentences longer than max_chars are broken at clause
+    boundaries (、, commas, spaces) or, failing that, hard-wrapped.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk (default: 80)
+
+    Returns:
+        Non-empty chunks in reading order
+    """
+    sentences: list[str] = []
+    for sentence in _SENTENCE_END.split(text):
+        if not sentence.strip():
+            continue
+        if len(sentence) > max_chars:
+            sentences.extend(_split_long(sentence, max_chars))
+        else:
+            sentences.append(sentence)
+
+    chunks: list[str] = []
+    current = ""
+    for sentence in sentences:
+        if not chunks and not current:
+            chunks.append(sentence)
+            continue
+        if current and len(current) + len(sentence) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += sentence
+    if current:
+        chunks.append(current)
+
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+async def pipelined(
+    items: list[str],
+    render: Callable[[str], Awaitable[T]],
+    concurrency: int = 2,
+) -> AsyncIterator[T]:
+    """Render items concurrently and yield the results in input order.
+
+    At most ``concurrency`` renders run at once, so the first result is
+    available as soon as the first item is rendered while the following ones
+    are still in progress.
+
+    Args:
+        items: Items to render (e.g. text chunks)
+        render: Async function producing the result for one item
+        concurrency: Maximum number of concurrent renders (default: 2)
+
+    Yields:
+        Render results in the same order as items
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def bounded(item: str) -> T:
+        async with semaphore:
+            return await render(item)
+
+    tasks = [asyncio.create_task(bounded(item)) for item in items]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
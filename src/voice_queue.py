@@ -0,0 +1,418 @@
+"""Single-worker priority queue for voice notifications."""
+
+import asyncio
+import heapq
+import itertools
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .concurrency import PRIORITY_RANKS  # type: ignore
+
+
+def dedup_key(message: str) -> str:
+    """Normalize a message for duplicate detection.
+
+    Width, case, whitespace and punctuation are ignored, so "テスト失敗！" and
+    "テスト失敗" are the same announcement while "3件" and "4件" are not.
+    """
+    text = unicodedata.normalize("NFKC", message).casefold()
+    return "".join(
+        ch
+        for ch in text
+        if not ch.isspace() and not unicodedata.category(ch).startswith("P")
+    )
+
+
+@dataclass(eq=False)
+class VoiceQueueItem:
+    """One queued voice notification."""
+
+    message: str
+    priority: str = "normal"
+    speaker_id: int = 1
+    voice_channel_id: Optional[int] = None
+    id: int = 0  # Assigned by VoiceQueue.submit
+    enqueued_at: float = field(default_factory=time.monotonic)
+    future: Optional[asyncio.Future] = None
+    lookahead: Optional[asyncio.Task] = None
+    skipped: bool = False
+    # Interrupted by a higher priority item; set back when it is requeued
+    preempted: bool = False
+    preemptions: int = 0
+    resume_chunk: int = 0  # Where play() continues an interrupted item
+    resume_frame: int = 0
+    speed_scale: Optional[float] = None  # Set when the backlog policy speeds it up
+    merged: List["VoiceQueueItem"] = field(default_factory=list)
+    merged_into: Optional["VoiceQueueItem"] = None
+    # Job state: queued, synthesizing, playing, done or failed
+    state: str = "queued"
+    started_at: Optional[float] = None
+    playing_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def count(self) -> int:
+        """Number of requests this item announces (itself plus merged duplicates)."""
+        return 1 + len(self.merged)
+
+    @property
+    def waiting(self) -> bool:
+        """Whether any caller (this one or a merged one) still awaits the result."""
+        return any(
+            request.future is not None and not request.future.done()
+            for request in (self, *self.merged)
+        )
+
+    @property
+    def rank(self) -> int:
+        """Queue rank of the priority (lower plays first)."""
+        return PRIORITY_RANKS.get(self.priority, PRIORITY_RANKS["normal"])
+
+    def mark_playing(self) -> None:
+        """Record that audio started playing (called by play())."""
+        self.state = "playing"
+        if self.playing_at is None:  # Kept across a preemption
+            self.playing_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        """Return the job state and timing of this request.
+
+        A merged request reports the state of the item it was merged into
+        until its own result is delivered.
+
+        Returns:
+            Dictionary with job id, state, timings in ms and the result or error
+        """
+        source = self
+        if self.merged_into is not None and self.state == "queued":
+            source = self.merged_into
+        now = time.monotonic()
+
+        def elapsed(start: Optional[float], stop: Optional[float]) -> Optional[float]:
+            # A stage without an end is still running, unless the job is over
+            if stop is None and source.finished_at is None:
+                stop = now
+            if start is None or stop is None:
+                return None
+            return round((stop - start) * 1000, 1)
+
+        status: Dict[str, Any] = {
+            "job_id": self.id,
+            "state": source.state,
+            "message": self.message,
+            "priority": self.priority,
+            "timing": {
+                "queued_ms": elapsed(self.enqueued_at, source.started_at),
+                "time_to_audio_ms": elapsed(source.started_at, source.playing_at),
+                "playback_ms": elapsed(source.playing_at, source.finished_at),
+                "total_ms": elapsed(self.enqueued_at, source.finished_at),
+            },
+        }
+        if self.merged_into is not None:
+            status["merged_into"] = self.merged_into.id
+        if self.result is not None:
+            status["result"] = self.result
+        if self.error is not None:
+            status["error"] = self.error
+        return status
+
+
+class VoiceQueue:
+    """Plays queued notifications one at a time, highest priority first.
+
+    A single worker owns the voice player, so concurrent callers never race
+    for it. While an item plays, the next one is prepared (synthesized into
+    the caches) so it can start as soon as the player is free.
+
+    With ``preempt`` enabled, an item of higher priority than the one playing
+    interrupts it: the interrupted item is marked ``preempted``, play() is
+    expected to return early after recording ``resume_chunk``/``resume_frame``,
+    and the item goes back into the queue ahead of everything of its priority
+    that arrived after it.
+
+    With a ``dedup_window``, a request whose text matches a waiting item of the
+    same speaker and priority (see dedup_key) submitted within the window of
+    it is merged into that item instead of being queued: it is announced once
+    with its ``count``, and the merged caller gets status "merged" with the id
+    of the request it was merged into.
+    """
+
+    def __init__(
+        self,
+        play: Callable[[VoiceQueueItem], Awaitable[Dict[str, Any]]],
+        prepare: Optional[Callable[[VoiceQueueItem], Awaitable[None]]] = None,
+        on_skip: Optional[Callable[[], None]] = None,
+        preempt: bool = False,
+        dedup_window: float = 0.0,
+        history: int = 256,
+    ):
+        """Initialize the queue.
+
+        Args:
+            play: Plays one item and returns its result
+            prepare: Pre-synthesizes an item while the previous one plays (optional)
+            on_skip: Stops the item that is playing (optional, also used to preempt)
+            preempt: Let higher priority items interrupt the playing one (default: False)
+            dedup_window: Seconds within which duplicates of a waiting item are
+                merged into it (default: 0.0 = disabled)
+            history: Number of recent requests kept for status lookups (default: 256)
+        """
+        self._play = play
+        self._prepare = prepare
+        self._on_skip = on_skip
+        self.preempt = preempt
+        self.dedup_window = dedup_window
+        self.current: Optional[VoiceQueueItem] = None
+        self.played = 0
+        self.skipped = 0
+        self.cleared = 0
+        self.preempted = 0
+        self.merged = 0
+        self._heap: List[Tuple[int, int, VoiceQueueItem]] = []
+        self._jobs: OrderedDict[int, VoiceQueueItem] = OrderedDict()
+        self._history = history
+        self._ids = itertools.count(1)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.pending())
+
+    def submit(self, item: VoiceQueueItem) -> asyncio.Future:
+        """Queue an item, starting the worker if needed.
+
+        Args:
+            item: Notification to play
+
+        Returns:
+            Future resolved with the play result (or its exception)
+        """
+        loop = asyncio.get_running_loop()
+        item.id = next(self._ids)
+        item.future = loop.create_future()
+        self._jobs[item.id] = item
+        while len(self._jobs) > self._history:
+            self._jobs.popitem(last=False)
+
+        target = self._find_duplicate(item)
+        if target is not None:
+            item.merged_into = target
+            target.merged.append(item)
+            self.merged += 1
+            return item.future
+
+        heapq.heappush(self._heap, (item.rank, item.id, item))
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        elif self.current is not None:
+            if self.preempt and item.rank < self.current.rank:
+                self._interrupt(self.current)
+            self._start_lookahead()
+        return item.future
+
+    def get(self, job_id: int) -> Optional[VoiceQueueItem]:
+        """Look up a recent request by id (None once it left the history)."""
+        return self._jobs.get(job_id)
+
+    def pending(self) -> List[VoiceQueueItem]:
+        """Return the waiting items in play order."""
+        return [item for _, _, item in sorted(self._heap) if item.waiting]
+
+    def skip(self) -> Optional[VoiceQueueItem]:
+        """Stop the item that is playing.
+
+        Returns:
+            The skipped item, or None if nothing was playing
+        """
+        item = self.current
+        if item is None or item.skipped:
+            return None
+        item.skipped = True
+        self.skipped += 1
+        if self._on_skip is not None:
+            self._on_skip()
+        return item
+
+    def _find_duplicate(self, item: VoiceQueueItem) -> Optional[VoiceQueueItem]:
+        """Find a waiting item the new one can be merged into."""
+        if self.dedup_window <= 0:
+            return None
+        key = dedup_key(item.message)
+        for candidate in self.pending():
+            if (
+                candidate.speaker_id == item.speaker_id
+                and candidate.priority == item.priority
+                and item.enqueued_at - candidate.enqueued_at <= self.dedup_window
+                and dedup_key(candidate.message) == key
+            ):
+                return candidate
+        return None
+
+    def _resolve(
+        self,
+        item: VoiceQueueItem,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Deliver an item's result to its caller and to the merged callers."""
+        if result is not None:
+            result = {
+                **result,
+                "request_id": item.id,
+                "merged_requests": [request.id for request in item.merged],
+            }
+        now = time.monotonic()
+        for request in (item, *item.merged):
+            if request is not item:
+                request.started_at = item.started_at
+                request.playing_at = item.playing_at
+            request.finished_at = now
+            if error is not None:
+                request.state = "failed"
+                request.error = str(error) or type(error).__name__
+            else:
+                request.state = "done"
+                request.result = (
+                    result
+                    if request is item
+                    else {
+                        "status": "merged",
+                        "request_id": request.id,
+                        "merged_into": item.id,
+                        "message": request.message,
+                        "result": result,
+                    }
+                )
+
+            future = request.future
+            if future is None or future.done():
+                continue  # Caller gave up
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(request.result)
+
+    def _interrupt(self, item: VoiceQueueItem) -> None:
+        """Stop the playing item so it can be resumed after higher priority ones."""
+        if item.skipped or item.preempted:
+            return
+        item.preempted = True
+        item.preemptions += 1
+        self.preempted += 1
+        if self._on_skip is not None:
+            self._on_skip()
+
+    def clear(self) -> int:
+        """Drop every waiting item; their callers get status "cleared".
+
+        Returns:
+            Number of dropped items
+        """
+        items = self.pending()
+        self._heap.clear()
+        for item in items:
+            if item.lookahead is not None:
+                item.lookahead.cancel()
+            self._resolve(item, {"status": "cleared", "message": item.message})
+        self.cleared += len(items)
+        return len(items)
+
+    async def stop(self) -> None:
+        """Stop the worker and fail waiting items."""
+        for _, _, item in self._heap:
+            if item.lookahead is not None:
+                item.lookahead.cancel()
+            self._resolve(item, error=RuntimeError("Voice queue stopped"))
+        self._heap.clear()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def _pop(self) -> Optional[VoiceQueueItem]:
+        """Pop the next item whose caller is still waiting."""
+        while self._heap:
+            _, _, item = heapq.heappop(self._heap)
+            if item.waiting:
+                return item
+            if item.lookahead is not None:
+                item.lookahead.cancel()  # Caller gave up while queued
+        return None
+
+    def _start_lookahead(self) -> None:
+        """Prepare the next item while the current one plays."""
+        if self._prepare is None:
+            return
+        upcoming = self.pending()
+        if upcoming and upcoming[0].lookahead is None:
+            upcoming[0].lookahead = asyncio.create_task(self._prefetch(upcoming[0]))
+
+    async def _prefetch(self, item: VoiceQueueItem) -> None:
+        """Run prepare() for an item; failures are retried by play()."""
+        try:
+            await self._prepare(item)  # type: ignore[misc]
+        except Exception as e:
+            print(f"Warning: Failed to prepare voice notification: {e}")
+
+    async def _run(self) -> None:
+        """Play items until stopped."""
+        assert self._wakeup is not None
+        while True:
+            item = self._pop()
+            if item is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            self.current = item
+            item.state = "synthesizing"
+            if item.started_at is None:  # Kept across a preemption
+                item.started_at = time.monotonic()
+            self._start_lookahead()
+            try:
+                if item.lookahead is not None:
+                    # Already synthesizing; starting over would only duplicate it
+                    await asyncio.gather(item.lookahead, return_exceptions=True)
+                result = await self._play(item)
+            except Exception as e:
+                self._resolve(item, error=e)
+            else:
+                if item.preempted and not item.skipped:
+                    # Keep the original id so it resumes before later arrivals
+                    item.preempted = False
+                    item.state = "queued"
+                    heapq.heappush(self._heap, (item.rank, item.id, item))
+                    continue
+                self.played += 1
+                self._resolve(item, result)
+            finally:
+                self.current = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue counters.
+
+        Returns:
+            Dictionary with the playing item, queue length and counters
+        """
+        return {
+            "playing": self.current.message if self.current is not None else None,
+            "queued": len(self),
+            "played": self.played,
+            "skipped": self.skipped,
+            "cleared": self.cleared,
+            "preempted": self.preempted,
+            "merged": self.merged,
+        }
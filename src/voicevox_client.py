@@ -1,31 +1,138 @@
 """VoiceVox API client for text-to-speech conversion."""
 
-from typing import Optional
+import asyncio
+import io
+import time
+import zipfile
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from typing import Any, Dict, Optional
 
 import httpx
 
+from .concurrency import AdaptiveLimiter  # type: ignore
+from .tts_cache import AudioCache, AudioQueryCache, DiskAudioCache  # type: ignore
+from .voicevox_pool import VoiceVoxEngine, VoiceVoxPool  # type: ignore
+
 
 class VoiceVoxClient:
-    """Client for VoiceVox Engine API."""
+    """Client for VoiceVox Engine API.
+
+    The client owns a single pooled ``httpx.AsyncClient`` between ``open()`` and
+    ``close()`` (or inside ``async with``), so keep-alive connections to the
+    engine are reused across notifications. Calls made while the client is not
+    open fall back to a short-lived connection.
+
+    Several engine URLs may be given; requests are then balanced across them
+    by a VoiceVoxPool.
+    """
 
-    def __init__(self, base_url: str = "http://localhost:50021"):
+    def __init__(
+        self,
+        base_url: str | Sequence[str] = "http://localhost:50021",
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 60.0,
+        audio_cache: Optional[AudioCache] = None,
+        disk_cache: Optional[DiskAudioCache] = None,
+        query_cache: Optional[AudioQueryCache] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        limiter: Optional[AdaptiveLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """Initialize VoiceVox client.
 
         Args:
-            base_url: Base URL of VoiceVox Engine API (default: http://localhost:50021)
+            base_url: Base URL of VoiceVox Engine API, or a list of URLs to balance
+                across (default: http://localhost:50021)
+            timeout: Request timeout in seconds (default: 30.0)
+            max_connections: Maximum number of pooled connections (default: 10)
+            max_keepalive_connections: Maximum idle keep-alive connections (default: 5)
+            keepalive_expiry: Seconds an idle keep-alive connection is kept (default: 60.0)
+            audio_cache: In-memory cache of synthesized audio used by text_to_speech (optional)
+            disk_cache: Persistent on-disk cache of synthesized audio (optional)
+            query_cache: Cache of audio_query results used by create_audio_query (optional)
+            hedge_percentile: Latency percentile (0-100) of recent syntheses after which a
+                second engine is asked too; None disables hedging (default: None)
+            hedge_min_samples: Syntheses observed before hedging starts (default: 20)
+            limiter: Adaptive concurrency limiter around text-to-speech synthesis;
+                excess requests queue by priority (optional)
+            transport: httpx transport for all requests, e.g. an ASGITransport
+                around a VoiceVoxStub for offline tests and benchmarks (optional)
         """
-        self.base_url = base_url.rstrip("/")
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        self.pool = VoiceVoxPool(urls)
+        self.base_url = self.pool.engines[0].url  # Primary engine (used in messages)
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.audio_cache = audio_cache
+        self.disk_cache = disk_cache
+        self.query_cache = query_cache
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.limiter = limiter
+        self.transport = transport
+        self.multi_synthesis_supported = True
+        self.batches = 0
+        self.batched_syntheses = 0
+        self.syntheses = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._synthesis_latencies: deque[float] = deque(maxlen=256)
         self._client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=30.0)
+        await self.open()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        await self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the pooled HTTP client is open."""
+        return self._client is not None
+
+    async def open(self) -> None:
+        """Open the pooled HTTP client. Calling this twice is a no-op."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout, limits=self.limits, transport=self.transport
+            )
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    def _engine_slot(
+        self, priority: str, text: str
+    ) -> AbstractAsyncContextManager[None]:
+        """Concurrency slot for synthesizing text (no-op without a limiter)."""
+        if self.limiter is None:
+            return nullcontext()
+        return self.limiter.acquire(priority, cost=len(text))
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the pooled client, or a one-off client if the pool is not open."""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, transport=self.transport
+            ) as client:
+                yield client
 
     async def get_speakers(self) -> list[dict]:
         """Get list of available speakers.
@@ -33,45 +140,75 @@ class VoiceVoxClient:
         Returns:
             List of speaker information dictionaries
         """
-        if not self._client:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/speakers")
-                response.raise_for_status()
-                return response.json()
-        else:
-            response = await self._client.get(f"{self.base_url}/speakers")
+        async with self.pool.request() as base_url, self._session() as client:
+            response = await client.get(f"{base_url}/speakers")
             response.raise_for_status()
             return response.json()
 
+    async def initialize_speaker(
+        self, speaker_id: int, skip_reinit: bool = True
+    ) -> None:
+        """Load a speaker's model on every engine ahead of its first synthesis.
+
+        Args:
+            speaker_id: Speaker ID to initialize
+            skip_reinit: Skip engines that already loaded the model (default: True)
+        """
+
+        async def initialize(engine: VoiceVoxEngine) -> None:
+            async with (
+                self.pool.request(engine) as base_url,
+                self._session() as client,
+            ):
+                response = await client.post(
+                    f"{base_url}/initialize_speaker",
+                    params={
+                        "speaker": speaker_id,
+                        "skip_reinit": str(skip_reinit).lower(),
+                    },
+                )
+                response.raise_for_status()
+
+        await asyncio.gather(*(initialize(engine) for engine in self.pool.engines))
+
     async def create_audio_query(self, text: str, speaker_id: int = 1) -> dict:
         """Create audio query for text.
 
+        The engine's text analysis is skipped when the query cache already holds
+        a result for this text and speaker.
+
         Args:
             text: Text to convert to speech
             speaker_id: Speaker ID (default: 1, which is typically "四国めたん (ノーマル)")
 
         Returns:
-            Audio query dictionary
+            Audio query dictionary (a private copy the caller may modify)
         """
-        if not self._client:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/audio_query",
-                    params={"text": text, "speaker": speaker_id},
-                )
-                response.raise_for_status()
-                return response.json()
-        else:
-            response = await self._client.post(
-                f"{self.base_url}/audio_query",
+        cache_key = AudioQueryCache.make_key(text, speaker_id)
+        if self.query_cache is not None:
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async with self.pool.request() as base_url, self._session() as client:
+            response = await client.post(
+                f"{base_url}/audio_query",
                 params={"text": text, "speaker": speaker_id},
             )
             response.raise_for_status()
-            return response.json()
+            audio_query = response.json()
+
+        if self.query_cache is not None:
+            self.query_cache.put(cache_key, audio_query)
+        return audio_query
 
     async def synthesize(self, audio_query: dict, speaker_id: int = 1) -> bytes:
         """Synthesize speech from audio query.
 
+        With hedging enabled and several engines configured, a request that is
+        slower than the learned latency percentile is also sent to a second
+        engine; the first response wins and the other request is cancelled.
+
         Args:
             audio_query: Audio query dictionary from create_audio_query
             speaker_id: Speaker ID (default: 1)
@@ -79,51 +216,528 @@ class VoiceVoxClient:
         Returns:
             WAV audio data as bytes
         """
-        if not self._client:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/synthesis",
-                    params={"speaker": speaker_id},
-                    json=audio_query,
+        self.syntheses += 1
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._post_synthesis(audio_query, speaker_id)
+
+        primary = self.pool.select()
+        first = asyncio.create_task(
+            self._post_synthesis(audio_query, speaker_id, primary)
+        )
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        secondary = self.pool.select(exclude=primary)
+        if done or not secondary.healthy:
+            return await first
+
+        self.hedged += 1
+        second = asyncio.create_task(
+            self._post_synthesis(audio_query, speaker_id, secondary)
+        )
+        pending = {first, second}
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                response.raise_for_status()
-                return response.content
-        else:
-            response = await self._client.post(
-                f"{self.base_url}/synthesis",
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+                if not pending:
+                    # Both failed; report the original request's error
+                    return first.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _post_synthesis(
+        self,
+        audio_query: dict,
+        speaker_id: int,
+        engine: Optional[VoiceVoxEngine] = None,
+    ) -> bytes:
+        """Send one /synthesis request and record its latency."""
+        started_at = time.perf_counter()
+        async with self.pool.request(engine) as base_url, self._session() as client:
+            response = await client.post(
+                f"{base_url}/synthesis",
                 params={"speaker": speaker_id},
                 json=audio_query,
             )
             response.raise_for_status()
-            return response.content
+        self._synthesis_latencies.append(time.perf_counter() - started_at)
+        return response.content
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging a synthesis, or None if hedging is off.
+
+        Hedging needs at least two engines and hedge_min_samples observed
+        syntheses to learn the latency percentile from.
+        """
+        if (
+            self.hedge_percentile is None
+            or len(self.pool) < 2
+            or len(self._synthesis_latencies) < self.hedge_min_samples
+        ):
+            return None
+        ordered = sorted(self._synthesis_latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100))
+        return ordered[index]
+
+    def hedge_stats(self) -> Dict[str, Any]:
+        """Return hedging counters.
+
+        Returns:
+            Dictionary with the current delay, hedge rate and hedge wins
+        """
+        delay = self.hedge_delay()
+        return {
+            "enabled": self.hedge_percentile is not None,
+            "percentile": self.hedge_percentile,
+            "delay_ms": round(delay * 1000, 1) if delay is not None else None,
+            "syntheses": self.syntheses,
+            "hedged": self.hedged,
+            "hedge_rate": self.hedged / self.syntheses if self.syntheses else 0.0,
+            "hedge_wins": self.hedge_wins,
+        }
+
+    async def stream_synthesize(
+        self, audio_query: dict, speaker_id: int = 1, chunk_size: int = 8192
+    ) -> AsyncIterator[bytes]:
+        """Synthesize speech and yield the WAV bytes as they arrive.
+
+        Args:
+            audio_query: Audio query dictionary from create_audio_query
+            speaker_id: Speaker ID (default: 1)
+            chunk_size: Maximum bytes per yielded chunk (default: 8192)
+
+        Yields:
+            Consecutive pieces of the WAV response
+        """
+        async with self.pool.request() as base_url, self._session() as client:
+            async with client.stream(
+                "POST",
+                f"{base_url}/synthesis",
+                params={"speaker": speaker_id},
+                json=audio_query,
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+
+    async def multi_synthesize(
+        self, audio_queries: Sequence[dict], speaker_id: int = 1
+    ) -> list[bytes]:
+        """Synthesize several audio queries in one /multi_synthesis request.
+
+        Args:
+            audio_queries: Audio query dictionaries from create_audio_query
+            speaker_id: Speaker ID shared by all queries (default: 1)
+
+        Returns:
+            WAV audio data for each query, in order
+
+        Raises:
+            ValueError: If the engine returns a different number of files
+        """
+        async with self.pool.request() as base_url, self._session() as client:
+            response = await client.post(
+                f"{base_url}/multi_synthesis",
+                params={"speaker": speaker_id},
+                json=list(audio_queries),
+            )
+            response.raise_for_status()
+
+        # The engine returns a zip of 001.wav, 002.wav, ...
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = sorted(name for name in archive.namelist() if name.endswith(".wav"))
+            waves = [archive.read(name) for name in names]
+        if len(waves) != len(audio_queries):
+            raise ValueError(
+                f"multi_synthesis returned {len(waves)} files for {len(audio_queries)} queries"
+            )
+        return waves
+
+    async def stream_text_to_speech(
+        self,
+        text: str,
+        speaker_id: int = 1,
+        speed_scale: float | None = None,
+        volume_scale: float | None = None,
+        pitch_scale: float | None = None,
+        chunk_size: int = 8192,
+        priority: str = "normal",
+    ) -> AsyncIterator[bytes | memoryview]:
+        """Convert text to speech, yielding audio while it is being synthesized.
+
+        Cached audio is yielded in one piece. Otherwise the engine response is
+        streamed without being buffered in memory; it is written through to
+        the disk cache (if configured) as it arrives.
+
+        Args:
+            text: Text to convert to speech
+            speaker_id: Speaker ID (default: 1)
+            speed_scale: Optional speech speed multiplier (if provided, overrides query)
+            volume_scale: Optional volume multiplier (if provided, overrides query)
+            pitch_scale: Optional pitch shift (if provided, overrides query)
+            chunk_size: Maximum bytes per yielded chunk (default: 8192)
+            priority: Queueing priority under the concurrency limiter (default: "normal")
+
+        Yields:
+            Consecutive pieces of the WAV audio
+        """
+        cache_key = AudioCache.make_key(
+            text, speaker_id, speed_scale, volume_scale, pitch_scale
+        )
+        cached: bytes | memoryview | None = None
+        if self.audio_cache is not None:
+            cached = self.audio_cache.get(cache_key)
+        if cached is None and self.disk_cache is not None:
+            cached = self.disk_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        async with self._engine_slot(priority, text):
+            audio_query = await self.create_audio_query(text, speaker_id)
+            self._apply_prosody(audio_query, speed_scale, volume_scale, pitch_scale)
+            chunks = self.stream_synthesize(audio_query, speaker_id, chunk_size)
+            if self.disk_cache is None:
+                async for chunk in chunks:
+                    yield chunk
+                return
+
+            with self.disk_cache.writer(cache_key) as cache_file:
+                async for chunk in chunks:
+                    cache_file.write(chunk)
+                    yield chunk
 
     async def text_to_speech(
-        self, text: str, speaker_id: int = 1, speed_scale: float | None = None
-    ) -> bytes:
+        self,
+        text: str,
+        speaker_id: int = 1,
+        speed_scale: float | None = None,
+        volume_scale: float | None = None,
+        pitch_scale: float | None = None,
+        priority: str = "normal",
+    ) -> bytes | memoryview:
         """Convert text to speech in one call.
 
+        Served from the audio caches without contacting the engine when the same
+        text, speaker and prosody were synthesized before. Disk cache hits are
+        returned as a memory-mapped view instead of a copy.
+
         Args:
             text: Text to convert to speech
             speaker_id: Speaker ID (default: 1)
             speed_scale: Optional speech speed multiplier (if provided, overrides query)
+            volume_scale: Optional volume multiplier (if provided, overrides query)
+            pitch_scale: Optional pitch shift (if provided, overrides query)
+            priority: Queueing priority under the concurrency limiter (default: "normal")
 
         Returns:
-            WAV audio data as bytes
+            WAV audio data
         """
-        audio_query = await self.create_audio_query(text, speaker_id)
+        cache_key = AudioCache.make_key(
+            text, speaker_id, speed_scale, volume_scale, pitch_scale
+        )
+        if self.audio_cache is not None:
+            cached = self.audio_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if self.disk_cache is not None:
+            mapped = self.disk_cache.get(cache_key)
+            if mapped is not None:
+                return mapped
+
+        audio = await self._synthesize_text(
+            cache_key,
+            text,
+            speaker_id,
+            speed_scale,
+            volume_scale,
+            pitch_scale,
+            priority,
+        )
+        if self.disk_cache is not None:
+            self.disk_cache.put(cache_key, audio)
+        return audio
+
+    async def text_to_speech_file(
+        self,
+        text: str,
+        speaker_id: int = 1,
+        speed_scale: float | None = None,
+        volume_scale: float | None = None,
+        pitch_scale: float | None = None,
+        priority: str = "normal",
+    ) -> str:
+        """Convert text to speech and return the path of the cached WAV file.
+
+        The file belongs to the disk cache and must not be deleted by the caller.
+
+        Args:
+            text: Text to convert to speech
+            speaker_id: Speaker ID (default: 1)
+            speed_scale: Optional speech speed multiplier (if provided, overrides query)
+            volume_scale: Optional volume multiplier (if provided, overrides query)
+            pitch_scale: Optional pitch shift (if provided, overrides query)
+            priority: Queueing priority under the concurrency limiter (default: "normal")
+
+        Returns:
+            Path of the WAV file in the disk cache
+
+        Raises:
+            RuntimeError: If no disk cache is configured
+        """
+        if self.disk_cache is None:
+            raise RuntimeError("Disk cache is not configured")
+
+        cache_key = AudioCache.make_key(
+            text, speaker_id, speed_scale, volume_scale, pitch_scale
+        )
+        path = self.disk_cache.get_path(cache_key)
+        if path is not None:
+            return path
+
+        audio = None
+        if self.audio_cache is not None:
+            audio = self.audio_cache.get(cache_key)
+        if audio is None:
+            audio = await self._synthesize_text(
+                cache_key,
+                text,
+                speaker_id,
+                speed_scale,
+                volume_scale,
+                pitch_scale,
+                priority,
+            )
+        return self.disk_cache.put(cache_key, audio)
+
+    async def batch_text_to_speech(
+        self,
+        texts: Sequence[str],
+        speaker_ids: int | Sequence[int] = 1,
+        speed_scale: float | None = None,
+        volume_scale: float | None = None,
+        pitch_scale: float | None = None,
+        priority: str = "normal",
+    ) -> list[bytes | memoryview]:
+        """Convert several texts to speech with as few engine round trips as possible.
+
+        Cached texts are served from the caches. The audio queries of the rest
+        are created concurrently, then each speaker's texts are synthesized in
+        a single /multi_synthesis request. Engines without /multi_synthesis
+        fall back to one /synthesis request per text.
+
+        Args:
+            texts: Texts to convert to speech
+            speaker_ids: Speaker ID for all texts, or one per text (default: 1)
+            speed_scale: Optional speech speed multiplier (if provided, overrides query)
+            volume_scale: Optional volume multiplier (if provided, overrides query)
+            pitch_scale: Optional pitch shift (if provided, overrides query)
+            priority: Queueing priority under the concurrency limiter (default: "normal")
+
+        Returns:
+            WAV audio data for each text, in order
+        """
+        if isinstance(speaker_ids, int):
+            speaker_ids = [speaker_ids] * len(texts)
+        keys = [
+            AudioCache.make_key(
+                text, speaker_id, speed_scale, volume_scale, pitch_scale
+            )
+            for text, speaker_id in zip(texts, speaker_ids)
+        ]
+
+        audio: Dict[tuple, bytes | memoryview] = {}
+        missing: Dict[tuple, tuple[str, int]] = {}
+        for key, text, speaker_id in zip(keys, texts, speaker_ids):
+            if key in audio or key in missing:
+                continue
+            cached = self.audio_cache.get(key) if self.audio_cache is not None else None
+            if cached is None and self.disk_cache is not None:
+                cached = self.disk_cache.get(key)
+            if cached is not None:
+                audio[key] = cached
+            else:
+                missing[key] = (text, speaker_id)
+
+        if missing:
+            queries = await asyncio.gather(
+                *(
+                    self.create_audio_query(text, speaker_id)
+                    for text, speaker_id in missing.values()
+                )
+            )
+            groups: Dict[int, list[tuple[tuple, dict]]] = {}
+            for (key, (_, speaker_id)), audio_query in zip(missing.items(), queries):
+                self._apply_prosody(audio_query, speed_scale, volume_scale, pitch_scale)
+                groups.setdefault(speaker_id, []).append((key, audio_query))
+
+            async def synthesize_group(speaker_id: int, group: list) -> None:
+                cost = "".join(missing[key][0] for key, _ in group)
+                async with self._engine_slot(priority, cost):
+                    waves = await self._multi_synthesize_or_fallback(
+                        [audio_query for _, audio_query in group], speaker_id
+                    )
+                for (key, _), wav in zip(group, waves):
+                    if self.audio_cache is not None:
+                        self.audio_cache.put(key, wav)
+                    if self.disk_cache is not None:
+                        self.disk_cache.put(key, wav)
+                    audio[key] = wav
+
+            await asyncio.gather(
+                *(synthesize_group(sid, group) for sid, group in groups.items())
+            )
+
+        return [audio[key] for key in keys]
+
+    async def _multi_synthesize_or_fallback(
+        self, audio_queries: list[dict], speaker_id: int
+    ) -> list[bytes]:
+        """Use /multi_synthesis when it pays off and the engine supports it."""
+        if len(audio_queries) > 1 and self.multi_synthesis_supported:
+            try:
+                waves = await self.multi_synthesize(audio_queries, speaker_id)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (404, 405):
+                    raise
+                print(
+                    "VoiceVox Engine has no /multi_synthesis; synthesizing one by one"
+                )
+                self.multi_synthesis_supported = False
+            else:
+                self.batches += 1
+                self.batched_syntheses += len(waves)
+                return waves
+        return list(
+            await asyncio.gather(
+                *(
+                    self.synthesize(audio_query, speaker_id)
+                    for audio_query in audio_queries
+                )
+            )
+        )
+
+    async def _synthesize_text(
+        self,
+        cache_key: tuple,
+        text: str,
+        speaker_id: int,
+        speed_scale: float | None,
+        volume_scale: float | None,
+        pitch_scale: float | None,
+        priority: str = "normal",
+    ) -> bytes:
+        """Run audio_query + synthesis on the engine and fill the memory cache."""
+        async with self._engine_slot(priority, text):
+            audio_query = await self.create_audio_query(text, speaker_id)
+            self._apply_prosody(audio_query, speed_scale, volume_scale, pitch_scale)
+            audio = await self.synthesize(audio_query, speaker_id)
+
+        if self.audio_cache is not None:
+            self.audio_cache.put(cache_key, audio)
+        return audio
+
+    @staticmethod
+    def _apply_prosody(
+        audio_query: dict,
+        speed_scale: float | None,
+        volume_scale: float | None,
+        pitch_scale: float | None,
+    ) -> None:
+        """Override prosody parameters of an audio query in place."""
         if speed_scale is not None:
             audio_query["speedScale"] = speed_scale
-        return await self.synthesize(audio_query, speaker_id)
+        if volume_scale is not None:
+            audio_query["volumeScale"] = volume_scale
+        if pitch_scale is not None:
+            audio_query["pitchScale"] = pitch_scale
+
+    def is_cached(
+        self,
+        text: str,
+        speaker_id: int = 1,
+        speed_scale: float | None = None,
+        volume_scale: float | None = None,
+        pitch_scale: float | None = None,
+    ) -> bool:
+        """Check whether text_to_speech can be served without the engine.
+
+        Args:
+            text: Text to convert to speech
+            speaker_id: Speaker ID (default: 1)
+            speed_scale: Optional speech speed multiplier
+            volume_scale: Optional volume multiplier
+            pitch_scale: Optional pitch shift
+
+        Returns:
+            True if the audio is cached, False otherwise
+        """
+        cache_key = AudioCache.make_key(
+            text, speaker_id, speed_scale, volume_scale, pitch_scale
+        )
+        if self.audio_cache is not None and cache_key in self.audio_cache:
+            return True
+        return self.disk_cache is not None and cache_key in self.disk_cache
+
+    def batch_stats(self) -> Dict[str, Any]:
+        """Return batch synthesis counters.
+
+        Returns:
+            Dictionary with /multi_synthesis support, batches and texts per batch
+        """
+        return {
+            "multi_synthesis": self.multi_synthesis_supported,
+            "batches": self.batches,
+            "batched_syntheses": self.batched_syntheses,
+            "average_batch_size": (
+                round(self.batched_syntheses / self.batches, 1) if self.batches else 0.0
+            ),
+        }
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return statistics of the caches in use.
+
+        Returns:
+            Dictionary of cache name to its counters
+        """
+        stats: Dict[str, Any] = {}
+        if self.audio_cache is not None:
+            stats["audio"] = self.audio_cache.stats()
+        if self.disk_cache is not None:
+            stats["disk"] = self.disk_cache.stats()
+        if self.query_cache is not None:
+            stats["audio_query"] = self.query_cache.stats()
+        return stats
 
     async def is_available(self) -> bool:
         """Check if VoiceVox Engine is available.
 
+        Every engine in the pool is probed; engines that fail are taken out of
+        rotation and engines that respond again are put back.
+
         Returns:
-            True if VoiceVox is available, False otherwise
+            True if at least one engine is available, False otherwise
         """
+        results = await asyncio.gather(
+            *(self._probe(engine) for engine in self.pool.engines)
+        )
+        return any(results)
+
+    async def _probe(self, engine: VoiceVoxEngine) -> bool:
+        """Check one engine's /version and update its rotation state."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/version")
-                return response.status_code == 200
+            async with self._session() as client:
+                response = await client.get(f"{engine.url}/version", timeout=5.0)
+                healthy = response.status_code == 200
         except Exception:
-            return False
+            healthy = False
+        self.pool.mark(engine, healthy)
+        return healthy
@@ -0,0 +1,218 @@
+"""Background VoiceVox health monitoring with a circuit breaker."""
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from .voicevox_client import VoiceVoxClient  # type: ignore
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # Engine healthy, requests pass
+    OPEN = "open"  # Engine down, requests fail fast
+    HALF_OPEN = "half_open"  # Reset timeout elapsed, one trial request allowed
+
+
+class CircuitBreaker:
+    """Circuit breaker with exponential backoff between trial requests.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast. Once the reset timeout elapses a single trial request
+    is allowed (half-open); its success closes the circuit, its failure reopens
+    it with the reset timeout doubled (up to ``max_reset_timeout``).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 5.0,
+        max_reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit (default: 3)
+            reset_timeout: Initial seconds before a trial request (default: 5.0)
+            max_reset_timeout: Upper bound of the backoff in seconds (default: 60.0)
+            clock: Monotonic time source (for testing)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self._clock = clock
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit turns half-open after the reset timeout)."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next trial request is allowed (0 if allowed now)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now.
+
+        In the half-open state only one trial request is allowed until its
+        outcome is recorded.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        self.consecutive_failures = 0
+        self.reset_timeout = self.base_reset_timeout
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit or backing off further."""
+        self.consecutive_failures += 1
+        if self._opened_at is not None:
+            # Failed trial: reopen with a longer timeout
+            if self.state is CircuitState.HALF_OPEN:
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+            self._opened_at = self._clock()
+        elif self.consecutive_failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+        self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the breaker state.
+
+        Returns:
+            Dictionary with state, consecutive_failures, reset_timeout and retry_in
+        """
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "reset_timeout": self.reset_timeout,
+            "retry_in": round(self.retry_in, 1),
+        }
+
+
+class VoiceVoxHealthMonitor:
+    """Keeps a cached VoiceVox availability state, refreshed in the background.
+
+    Callers read ``available`` instead of probing ``/version`` themselves, so
+    a notification never waits for a health check and fails fast while the
+    engine is down. Probes run every ``interval`` seconds while the circuit is
+    closed and follow the breaker's backoff while it is open.
+    """
+
+    def __init__(
+        self,
+        client: VoiceVoxClient,
+        interval: float = 10.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        """Initialize the health monitor.
+
+        Args:
+            client: VoiceVox client to probe
+            interval: Seconds between probes while the engine is healthy (default: 10.0)
+            breaker: Circuit breaker (default: CircuitBreaker())
+        """
+        self.client = client
+        self.interval = interval
+        self.breaker = breaker or CircuitBreaker()
+        self.checked_at: Optional[float] = None
+        self.last_latency_ms: Optional[float] = None
+        self._available = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        """Cached availability (False while the circuit is open)."""
+        if self.breaker.state is CircuitState.OPEN:
+            return False
+        return self._available
+
+    async def check(self) -> bool:
+        """Probe the engine now unless the circuit is open.
+
+        Returns:
+            Availability after the probe (cached state if the probe was skipped)
+        """
+        if not self.breaker.allow_request():
+            return self.available
+
+        started_at = time.perf_counter()
+        ok = await self.client.is_available()
+        self.last_latency_ms = round((time.perf_counter() - started_at) * 1000, 1)
+        self.checked_at = time.time()
+        self._available = ok
+        if ok:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return ok
+
+    def record_failure(self) -> None:
+        """Report a failed engine request made outside the monitor."""
+        self._available = False
+        self.breaker.record_failure()
+
+    def _next_delay(self) -> float:
+        """Seconds until the next probe."""
+        if self.breaker.state is CircuitState.CLOSED:
+            return self.interval
+        return max(self.breaker.retry_in, 0.1)
+
+    async def _run(self) -> None:
+        """Probe the engine until stopped."""
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                print(f"Warning: VoiceVox health check failed: {e}")
+            await asyncio.sleep(self._next_delay())
+
+    def start(self) -> None:
+        """Start probing in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background probes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cached health state.
+
+        Returns:
+            Dictionary with available, breaker state and last probe details
+        """
+        return {
+            "available": self.available,
+            **self.breaker.stats(),
+            "checked_at": self.checked_at,
+            "last_latency_ms": self.last_latency_ms,
+        }
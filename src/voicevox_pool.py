@@ -0,0 +1,152 @@
+"""Load balancing across several VoiceVox Engine instances."""
+
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+class VoiceVoxEngine:
+    """One VoiceVox Engine endpoint with its load and latency counters."""
+
+    def __init__(self, url: str, latency_window: int = 256):
+        """Initialize the engine entry.
+
+        Args:
+            url: Base URL of the engine
+            latency_window: Number of recent request latencies kept (default: 256)
+        """
+        self.url = url.rstrip("/")
+        self.healthy = True
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency_ewma_ms: Optional[float] = None
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+
+    def record_latency(self, latency_ms: float) -> None:
+        """Record the latency of a successful request."""
+        self._latencies.append(latency_ms)
+        if self.latency_ewma_ms is None:
+            self.latency_ewma_ms = latency_ms
+        else:
+            self.latency_ewma_ms = 0.8 * self.latency_ewma_ms + 0.2 * latency_ms
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Return a percentile (0-100) of the recent latencies in ms."""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the engine counters."""
+        p50 = self.latency_percentile(50)
+        p95 = self.latency_percentile(95)
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "latency_ms": {
+                "ewma": round(self.latency_ewma_ms, 1)
+                if self.latency_ewma_ms is not None
+                else None,
+                "p50": round(p50, 1) if p50 is not None else None,
+                "p95": round(p95, 1) if p95 is not None else None,
+            },
+        }
+
+
+def _is_engine_failure(error: BaseException) -> bool:
+    """Whether an error means the engine itself is unhealthy (not a bad request)."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class VoiceVoxPool:
+    """Least-outstanding-requests balancer over VoiceVox Engine instances.
+
+    Each request goes to the healthy engine with the fewest requests in
+    flight (ties go to the engine with the lower recent latency). An engine
+    whose request fails with a connection error or 5xx is taken out of
+    rotation until a health check marks it healthy again. If every engine is
+    out of rotation, all of them are tried rather than failing outright.
+    """
+
+    def __init__(self, urls: Sequence[str]):
+        """Initialize the pool.
+
+        Args:
+            urls: Base URLs of the engines
+
+        Raises:
+            ValueError: If no URL is given
+        """
+        if not urls:
+            raise ValueError("At least one VoiceVox Engine URL is required")
+        self.engines: List[VoiceVoxEngine] = [VoiceVoxEngine(url) for url in urls]
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def select(self, exclude: Optional[VoiceVoxEngine] = None) -> VoiceVoxEngine:
+        """Return the engine the next request should go to.
+
+        Args:
+            exclude: Engine to avoid (e.g. the one a hedged request already uses)
+        """
+        engines = [engine for engine in self.engines if engine is not exclude]
+        candidates = [engine for engine in engines if engine.healthy]
+        return min(
+            candidates or engines or self.engines,
+            key=lambda e: (e.outstanding, e.latency_ewma_ms or 0.0),
+        )
+
+    @asynccontextmanager
+    async def request(
+        self, engine: Optional[VoiceVoxEngine] = None
+    ) -> AsyncIterator[str]:
+        """Reserve an engine for one request.
+
+        Args:
+            engine: Engine to use (default: select())
+
+        Yields:
+            Base URL of the selected engine
+
+        The request's latency is recorded on success; engine failures take the
+        engine out of rotation.
+        """
+        engine = engine or self.select()
+        engine.outstanding += 1
+        engine.requests += 1
+        started_at = time.perf_counter()
+        try:
+            yield engine.url
+        except Exception as e:
+            engine.failures += 1
+            if _is_engine_failure(e):
+                engine.healthy = False
+            raise
+        else:
+            engine.record_latency((time.perf_counter() - started_at) * 1000)
+        finally:
+            engine.outstanding -= 1
+
+    def mark(self, engine: VoiceVoxEngine, healthy: bool) -> None:
+        """Put an engine into or out of rotation after a health check."""
+        if engine.healthy != healthy:
+            state = "back in rotation" if healthy else "out of rotation"
+            print(f"VoiceVox Engine {engine.url} is {state}")
+        engine.healthy = healthy
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return per-engine counters."""
+        return [engine.stats() for engine in self.engines]
@@ -0,0 +1,283 @@
+"""In-process stand-in for the VoiceVox Engine API with a latency model.
+
+Serves the endpoints VoiceVoxClient uses with deterministic WAVs whose
+duration is proportional to the text length, so the voice path can be tested
+and benchmarked without Docker or the real engine::
+
+    stub = VoiceVoxStub(StubConfig(latency_ms=200, max_concurrency=1))
+    client = VoiceVoxClient(transport=httpx.ASGITransport(app=stub.app))
+
+It can also be run as a server: ``python -m src.voicevox_stub --port 50021``.
+"""
+
+import argparse
+import asyncio
+import io
+import random
+import wave
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from fastapi import Body, FastAPI, HTTPException, Query, Response
+
+STUB_VERSION = "0.0.0-stub"
+
+DEFAULT_SPEAKERS: List[Dict[str, Any]] = [
+    {
+        "name": "四国めたん",
+        "speaker_uuid": "7ffcb7ce-00ec-4bdc-82cd-45a8889e43ff",
+        "styles": [
+            {"name": "ノーマル", "id": 2, "type": "talk"},
+            {"name": "あまあま", "id": 0, "type": "talk"},
+        ],
+    },
+    {
+        "name": "ずんだもん",
+        "speaker_uuid": "388f246b-8c41-4ac1-8e2d-5d79f3ff56d9",
+        "styles": [
+            {"name": "ノーマル", "id": 3, "type": "talk"},
+            {"name": "あまあま", "id": 1, "type": "talk"},
+        ],
+    },
+]
+
+
+@dataclass
+class StubConfig:
+    """Latency, failure and output model of the stub engine."""
+
+    # Synthesis latency: latency_ms + latency_ms_per_char * len(text), then
+    # shaped by the distribution ("fixed", "uniform", "lognormal" or "exponential")
+    latency_ms: float = 50.0
+    latency_ms_per_char: float = 2.0
+    distribution: str = "fixed"
+    spread: float = 0.5  # Relative width (uniform) or sigma (lognormal)
+    query_latency_ms: float = 5.0
+    cold_start_ms: float = 0.0  # Extra latency of a speaker's first synthesis
+    error_rate: float = 0.0  # Fraction of requests answered with 500
+    max_concurrency: Optional[int] = None  # Syntheses processed at once; rest queue
+    seconds_per_char: float = 0.12
+    sample_rate: int = 24000
+    seed: Optional[int] = None
+    speakers: List[Dict[str, Any]] = field(
+        default_factory=lambda: [dict(speaker) for speaker in DEFAULT_SPEAKERS]
+    )
+
+
+class VoiceVoxStub:
+    """Fake VoiceVox Engine exposing ``/version``, ``/speakers``, ``/audio_query``,
+    ``/synthesis``, ``/multi_synthesis`` and ``/initialize_speaker``.
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None):
+        """Initialize the stub engine.
+
+        Args:
+            config: Latency and failure model (default: StubConfig())
+        """
+        self.config = config or StubConfig()
+        self.requests = 0
+        self.errors = 0
+        self.syntheses = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.initialized: set[int] = set()
+        self._random = random.Random(self.config.seed)
+        self._style_ids = {
+            style["id"]
+            for speaker in self.config.speakers
+            for style in speaker.get("styles", [])
+        }
+        self._slots = (
+            asyncio.Semaphore(self.config.max_concurrency)
+            if self.config.max_concurrency
+            else None
+        )
+        self.app = self._create_app()
+
+    def latency(self, text_length: int) -> float:
+        """Sample the synthesis latency in seconds for a text length."""
+        mean = self.config.latency_ms + self.config.latency_ms_per_char * text_length
+        distribution = self.config.distribution
+        if distribution == "uniform":
+            spread = self.config.spread
+            mean *= self._random.uniform(1 - spread, 1 + spread)
+        elif distribution == "lognormal":
+            mean *= self._random.lognormvariate(0.0, self.config.spread)
+        elif distribution == "exponential":
+            mean = self._random.expovariate(1 / mean) if mean > 0 else 0.0
+        return max(0.0, mean) / 1000
+
+    def render(self, audio_query: Dict[str, Any], speaker_id: int) -> bytes:
+        """Render a deterministic 16-bit mono WAV for an audio query.
+
+        The duration is seconds_per_char per character of the query's text,
+        divided by speedScale; the tone depends on the speaker.
+        """
+        text = audio_query.get("kana", "")
+        speed = audio_query.get("speedScale") or 1.0
+        volume = audio_query.get("volumeScale", 1.0)
+        rate = int(audio_query.get("outputSamplingRate") or self.config.sample_rate)
+        frames = int(len(text) * self.config.seconds_per_char / speed * rate)
+
+        t = np.arange(frames) / rate
+        frequency = 180 + 20 * (speaker_id % 10)
+        samples = (np.sin(2 * np.pi * frequency * t) * 8000 * volume).astype(np.int16)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(samples.tobytes())
+        return buffer.getvalue()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counters."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "syntheses": self.syntheses,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "initialized": sorted(self.initialized),
+        }
+
+    def _check(self, speaker_id: Optional[int] = None) -> None:
+        """Count a request, validate the speaker and inject failures."""
+        self.requests += 1
+        if speaker_id is not None and speaker_id not in self._style_ids:
+            raise HTTPException(status_code=422, detail=f"Unknown style {speaker_id}")
+        if self._random.random() < self.config.error_rate:
+            self.errors += 1
+            raise HTTPException(status_code=500, detail="Injected stub failure")
+
+    async def _synthesize(self, audio_queries: List[Dict[str, Any]], speaker_id: int):
+        """Wait out the latency model for a batch of queries under the concurrency cap."""
+        text_length = sum(len(query.get("kana", "")) for query in audio_queries)
+        delay = self.latency(text_length)
+        if speaker_id not in self.initialized:
+            delay += self.config.cold_start_ms / 1000
+            self.initialized.add(speaker_id)
+
+        if self._slots is not None:
+            await self._slots.acquire()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+        self.syntheses += len(audio_queries)
+
+    def _create_app(self) -> FastAPI:
+        """Build the ASGI app."""
+        app = FastAPI(title="VoiceVox Engine stub")
+
+        @app.get("/version")
+        async def version():
+            self._check()
+            return STUB_VERSION
+
+        @app.get("/speakers")
+        async def speakers():
+            self._check()
+            return self.config.speakers
+
+        @app.post("/audio_query")
+        async def audio_query(text: str = Query(...), speaker: int = Query(...)):
+            self._check(speaker)
+            await asyncio.sleep(self.config.query_latency_ms / 1000)
+            return {
+                "accent_phrases": [],
+                "speedScale": 1.0,
+                "pitchScale": 0.0,
+                "intonationScale": 1.0,
+                "volumeScale": 1.0,
+                "prePhonemeLength": 0.1,
+                "postPhonemeLength": 0.1,
+                "outputSamplingRate": self.config.sample_rate,
+                "outputStereo": False,
+                "kana": text,
+            }
+
+        @app.post("/synthesis")
+        async def synthesis(
+            speaker: int = Query(...), query: Dict[str, Any] = Body(...)
+        ):
+            self._check(speaker)
+            await self._synthesize([query], speaker)
+            return Response(self.render(query, speaker), media_type="audio/wav")
+
+        @app.post("/multi_synthesis")
+        async def multi_synthesis(
+            speaker: int = Query(...), queries: List[Dict[str, Any]] = Body(...)
+        ):
+            self._check(speaker)
+            await self._synthesize(queries, speaker)
+            archive = io.BytesIO()
+            with zipfile.ZipFile(archive, "w") as zf:
+                for index, query in enumerate(queries, start=1):
+                    zf.writestr(f"{index:03}.wav", self.render(query, speaker))
+            return Response(archive.getvalue(), media_type="application/zip")
+
+        @app.post("/initialize_speaker", status_code=204)
+        async def initialize_speaker(
+            speaker: int = Query(...), skip_reinit: bool = Query(False)
+        ):
+            self._check(speaker)
+            if speaker not in self.initialized or not skip_reinit:
+                await asyncio.sleep(self.config.cold_start_ms / 1000)
+                self.initialized.add(speaker)
+            return Response(status_code=204)
+
+        @app.get("/is_initialized_speaker")
+        async def is_initialized_speaker(speaker: int = Query(...)):
+            self._check(speaker)
+            return speaker in self.initialized
+
+        return app
+
+
+def main() -> None:
+    """Run the stub engine as an HTTP server."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="VoiceVox Engine stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=50021)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-ms-per-char", type=float, default=2.0)
+    parser.add_argument(
+        "--distribution",
+        choices=["fixed", "uniform", "lognormal", "exponential"],
+        default="fixed",
+    )
+    parser.add_argument("--spread", type=float, default=0.5)
+    parser.add_argument("--cold-start-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    stub = VoiceVoxStub(
+        StubConfig(
+            latency_ms=args.latency_ms,
+            latency_ms_per_char=args.latency_ms_per_char,
+            distribution=args.distribution,
+            spread=args.spread,
+            cold_start_ms=args.cold_start_ms,
+            error_rate=args.error_rate,
+            max_concurrency=args.max_concurrency,
+            seed=args.seed,
+        )
+    )
+    uvicorn.run(stub.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""VoiceVox speaker warm-up and phrase pre-rendering at startup."""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import Any, Dict, List, Optional
+
+from .voice_pipeline import split_sentences  # type: ignore
+from .voicevox_client import VoiceVoxClient  # type: ignore
+
+
+class VoiceVoxWarmup:
+    """Loads speaker models and pre-renders canned phrases before they are needed.
+
+    VoiceVox loads a style's model on its first synthesis, which makes the
+    first notification for each speaker noticeably slower. ``run()`` calls
+    ``/initialize_speaker`` for the configured speakers on every engine and
+    then synthesizes the configured phrases into the client's audio caches,
+    so they are served without an engine round trip later.
+    """
+
+    def __init__(
+        self,
+        client: VoiceVoxClient,
+        speaker_ids: Sequence[int] = (),
+        phrases: Sequence[str] = (),
+        phrase_speaker_ids: Sequence[int] = (1,),
+        chunk_max_chars: int = 80,
+    ):
+        """Initialize the warm-up.
+
+        Args:
+            client: VoiceVox client to warm up
+            speaker_ids: Speaker IDs to initialize
+            phrases: Phrases to pre-render into the audio cache
+            phrase_speaker_ids: Speakers the phrases are rendered for when no
+                speaker_ids are given (default: (1,))
+            chunk_max_chars: Chunk size notifications are split with, so the
+                pre-rendered chunks match their cache keys (default: 80)
+        """
+        self.client = client
+        self.speaker_ids = list(dict.fromkeys(speaker_ids))
+        self.phrases = list(dict.fromkeys(phrases))
+        self.chunks = list(
+            dict.fromkeys(
+                chunk
+                for phrase in self.phrases
+                for chunk in split_sentences(phrase, chunk_max_chars) or [phrase]
+            )
+        )
+        self.phrase_speaker_ids = self.speaker_ids or list(phrase_speaker_ids)
+        self.state = "pending"
+        self.speakers_initialized = 0
+        self.phrases_rendered = 0
+        self.errors: List[str] = []
+        self.duration_ms: Optional[float] = None
+
+    @property
+    def phrases_total(self) -> int:
+        """Number of phrase renderings (phrases times speakers)."""
+        return len(self.phrases) * len(self.phrase_speaker_ids)
+
+    async def run(self) -> None:
+        """Initialize the speakers, then pre-render the phrases.
+
+        Failures are recorded in ``errors`` instead of raised, so a partial
+        warm-up never blocks startup.
+        """
+        self.state = "running"
+        started_at = time.perf_counter()
+
+        results = await asyncio.gather(
+            *(self._initialize(speaker_id) for speaker_id in self.speaker_ids),
+            return_exceptions=True,
+        )
+        for speaker_id, result in zip(self.speaker_ids, results):
+            if isinstance(result, BaseException):
+                self.errors.append(f"initialize_speaker {speaker_id}: {result}")
+
+        if self.phrases:
+            results = await asyncio.gather(
+                *(self._render(speaker_id) for speaker_id in self.phrase_speaker_ids),
+                return_exceptions=True,
+            )
+            for speaker_id, result in zip(self.phrase_speaker_ids, results):
+                if isinstance(result, BaseException):
+                    self.errors.append(f"phrases for speaker {speaker_id}: {result}")
+
+        self.duration_ms = round((time.perf_counter() - started_at) * 1000, 1)
+        self.state = "failed" if self.errors else "done"
+        print(
+            f"VoiceVox warm-up {self.state} in {self.duration_ms:.0f} ms "
+            f"({self.speakers_initialized}/{len(self.speaker_ids)} speakers, "
+            f"{self.phrases_rendered}/{self.phrases_total} phrases)"
+        )
+
+    async def _initialize(self, speaker_id: int) -> None:
+        """Initialize one speaker."""
+        await self.client.initialize_speaker(speaker_id)
+        self.speakers_initialized += 1
+
+    async def _render(self, speaker_id: int) -> None:
+        """Pre-render every phrase for one speaker."""
+        await self.client.batch_text_to_speech(self.chunks, speaker_id)
+        self.phrases_rendered += len(self.phrases)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return warm-up progress.
+
+        Returns:
+            Dictionary with state, progress counters, duration and errors
+        """
+        return {
+            "state": self.state,
+            "speakers": f"{self.speakers_initialized}/{len(self.speaker_ids)}",
+            "phrases": f"{self.phrases_rendered}/{self.phrases_total}",
+            "duration_ms": self.duration_ms,
+            "errors": list(self.errors),
+        }
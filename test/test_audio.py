@@ -0,0 +1,298 @@
+"""Tests for audio sources."""
+
+import asyncio
+import io
+import wave
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from discord.opus import OPUS_SILENCE
+
+from src.audio import (
+    FRAME_SIZE,
+    SILENCE_FRAME,
+    ChainedAudioSource,
+    OpusPacketAudio,
+    PCMBufferAudio,
+    StreamingPCMAudio,
+    StreamingWavDecoder,
+    parse_wav_header,
+    stream_wav_to_source,
+    wav_to_discord_pcm,
+)
+
+
+def _wav(samples: np.ndarray, sample_rate: int = 24000, channels: int = 1) -> bytes:
+    """Encode int16 samples as a WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+class TestWavDecoding:
+    """Test suite for in-process WAV decoding."""
+
+    def test_parse_wav_header(self):
+        """Test parsing the VoiceVox output format (24 kHz mono 16-bit)."""
+        info = parse_wav_header(_wav(np.zeros(240, dtype=np.int16)))
+
+        assert info.sample_rate == 24000
+        assert info.channels == 1
+        assert info.bits_per_sample == 16
+        assert info.data_size == 480
+
+    def test_rejects_non_wav(self):
+        """Test that non-WAV data raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_wav_header(b"ID3 mp3 data")
+
+    def test_rejects_8bit_wav(self):
+        """Test that unsupported sample widths raise ValueError."""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(1)
+            wav.setframerate(8000)
+            wav.writeframes(b"\x80" * 10)
+
+        with pytest.raises(ValueError, match="8 bit"):
+            parse_wav_header(buffer.getvalue())
+
+    def test_upsamples_mono_24k_to_stereo_48k(self):
+        """Test resampling and channel duplication."""
+        samples = np.array([0, 1000, 2000, 3000], dtype=np.int16)
+
+        pcm = np.frombuffer(wav_to_discord_pcm(_wav(samples)), dtype="<i2")
+        stereo = pcm.reshape(-1, 2)
+
+        assert len(stereo) == 8
+        assert np.array_equal(stereo[:, 0], stereo[:, 1])
+        assert list(stereo[:7, 0]) == [0, 500, 1000, 1500, 2000, 2500, 3000]
+
+    def test_48k_stereo_passthrough(self):
+        """Test that Discord-native audio is passed through unchanged."""
+        samples = np.arange(-8, 8, dtype=np.int16) * 100
+
+        pcm = wav_to_discord_pcm(_wav(samples, sample_rate=48000, channels=2))
+
+        assert pcm == samples.astype("<i2").tobytes()
+
+    def test_decodes_memoryview(self):
+        """Test decoding from a memory view (as returned by the disk cache)."""
+        data = _wav(np.ones(10, dtype=np.int16))
+
+        assert wav_to_discord_pcm(memoryview(data)) == wav_to_discord_pcm(data)
+
+
+class TestPCMBufferAudio:
+    """Test suite for PCMBufferAudio class."""
+
+    def test_yields_20ms_frames_and_pads_last(self):
+        """Test frame slicing with zero padding of the last partial frame."""
+        source = PCMBufferAudio(b"\x01" * (FRAME_SIZE + 10))
+
+        first = source.read()
+        last = source.read()
+
+        assert first == b"\x01" * FRAME_SIZE
+        assert len(last) == FRAME_SIZE
+        assert last[:10] == b"\x01" * 10
+        assert source.read() == b""
+        assert source.frames_read == 2
+        assert source.total_frames == 2
+        assert not source.is_opus()
+
+    def test_from_wav_one_second(self):
+        """Test that one second of 24 kHz audio yields 50 frames."""
+        source = PCMBufferAudio.from_wav(_wav(np.zeros(24000, dtype=np.int16)))
+
+        assert source.total_frames == 50
+
+    def test_seek_resumes_from_frame(self):
+        """Test that seek continues reading from the given frame."""
+        source = PCMBufferAudio(b"\x01" * FRAME_SIZE + b"\x02" * FRAME_SIZE)
+
+        source.seek(1)
+
+        assert source.read() == b"\x02" * FRAME_SIZE
+        assert source.frames_read == 2
+
+
+class TestOpusPacketAudio:
+    """Test suite for OpusPacketAudio class."""
+
+    def test_yields_packets_unencoded(self):
+        """Test that packets are served as-is and flagged as Opus."""
+        source = OpusPacketAudio([b"p1", b"p2"])
+
+        assert source.is_opus()
+        assert [source.read() for _ in range(3)] == [b"p1", b"p2", b""]
+        assert source.frames_read == 2
+        assert source.total_frames == 2
+
+
+def _source(*frames: bytes) -> MagicMock:
+    """Create a mock audio source returning the given frames then b''."""
+    source = MagicMock()
+    source.read.side_effect = [*frames, b""]
+    return source
+
+
+class TestChainedAudioSource:
+    """Test suite for ChainedAudioSource class."""
+
+    def test_plays_sources_back_to_back(self):
+        """Test that frames of consecutive sources follow without gaps."""
+        chained = ChainedAudioSource()
+        first = _source(b"a1", b"a2")
+        second = _source(b"b1")
+        chained.append(first)
+        chained.append(second)
+        chained.finish()
+
+        frames = [chained.read() for _ in range(4)]
+
+        assert frames == [b"a1", b"a2", b"b1", b""]
+        first.cleanup.assert_called_once()
+        second.cleanup.assert_called_once()
+
+    def test_pads_silence_while_waiting(self):
+        """Test that silence is emitted until the next source arrives."""
+        chained = ChainedAudioSource()
+        chained.append(_source(b"a1"))
+
+        assert chained.read() == b"a1"
+        assert chained.read() == SILENCE_FRAME
+
+        chained.append(_source(b"b1"))
+        chained.finish()
+        assert chained.read() == b"b1"
+        assert chained.read() == b""
+
+    def test_opus_chain_pads_opus_silence(self):
+        """Test that an Opus chain waits with Opus silence packets."""
+        chained = ChainedAudioSource(opus=True)
+
+        assert chained.is_opus()
+        assert chained.read() == OPUS_SILENCE
+
+    def test_gives_up_after_wait_timeout(self):
+        """Test that playback ends if no source arrives in time."""
+        chained = ChainedAudioSource(wait_timeout=0.04)
+
+        assert chained.read() == SILENCE_FRAME
+        assert chained.read() == SILENCE_FRAME
+        assert chained.read() == b""
+
+    def test_cleanup_releases_pending_sources(self):
+        """Test that cleanup releases sources that were never played."""
+        chained = ChainedAudioSource()
+        pending = _source(b"x")
+        chained.append(pending)
+
+        chained.cleanup()
+
+        pending.cleanup.assert_called_once()
+
+    def test_position_survives_cleanup(self):
+        """Test that the position of a stopped chain can be read after cleanup."""
+        chained = ChainedAudioSource()
+        chained.append(_source(b"a1"))
+        second = PCMBufferAudio(b"\x00" * FRAME_SIZE * 3)
+        chained.append(second)
+
+        for _ in range(3):
+            chained.read()
+        assert chained.position == (1, 2)
+
+        chained.cleanup()
+        assert chained.position == (1, 2)
+
+
+class TestStreamingWavDecoder:
+    """Test cases for incremental WAV decoding."""
+
+    @pytest.mark.parametrize("piece_size", [1, 7, 100, 4096])
+    def test_matches_whole_buffer_decoding(self, piece_size):
+        """Test that decoding in pieces matches decoding the whole buffer."""
+        samples = (np.sin(np.arange(2400) / 10) * 10000).astype(np.int16)
+        wav = _wav(samples)
+        decoder = StreamingWavDecoder()
+
+        pcm = b"".join(
+            decoder.feed(wav[i : i + piece_size])
+            for i in range(0, len(wav), piece_size)
+        )
+
+        expected = wav_to_discord_pcm(wav)
+        # The whole-buffer decoder holds the final sample for one extra frame
+        assert len(expected) - len(pcm) <= 4
+        assert pcm == expected[: len(pcm)]
+
+    def test_rejects_non_wav(self):
+        """Test that a non-WAV stream is rejected once its header is complete."""
+        decoder = StreamingWavDecoder()
+
+        with pytest.raises(ValueError):
+            decoder.feed(b"not a wav file" * 400)
+
+
+class TestStreamingPCMAudio:
+    """Test cases for StreamingPCMAudio."""
+
+    @pytest.mark.asyncio
+    async def test_plays_fed_pcm_then_ends(self):
+        """Test that fed PCM is framed and the stream ends after finish."""
+        source = StreamingPCMAudio()
+        await source.feed(b"\x01" * (FRAME_SIZE + 10))
+        await source.finish()
+
+        assert source.read() == b"\x01" * FRAME_SIZE
+        assert source.read() == b"\x01" * 10 + b"\x00" * (FRAME_SIZE - 10)
+        assert source.read() == b""
+        assert source.frames_read == 2
+
+    def test_pads_silence_on_underrun(self):
+        """Test that silence is played while waiting for the producer."""
+        source = StreamingPCMAudio(wait_timeout=0.04)
+
+        assert source.read() == SILENCE_FRAME
+        assert source.read() == SILENCE_FRAME
+        assert source.read() == b""
+
+    @pytest.mark.asyncio
+    async def test_feed_waits_while_buffer_is_full(self):
+        """Test that the producer is held back by the bounded buffer."""
+        source = StreamingPCMAudio(max_blocks=1)
+        await source.feed(b"\x01" * FRAME_SIZE)
+
+        blocked = asyncio.create_task(source.feed(b"\x02" * FRAME_SIZE))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        assert source.read() == b"\x01" * FRAME_SIZE
+        await asyncio.wait_for(blocked, timeout=1)
+        assert source.read() == b"\x02" * FRAME_SIZE
+
+    @pytest.mark.asyncio
+    async def test_stream_wav_to_source(self):
+        """Test decoding a streamed WAV into a playable source."""
+        wav = _wav(np.zeros(480, dtype=np.int16), sample_rate=48000)
+
+        async def pieces():
+            for i in range(0, len(wav), 100):
+                yield wav[i : i + 100]
+
+        source = StreamingPCMAudio()
+        await stream_wav_to_source(pieces(), source)
+
+        frames = []
+        while frame := source.read():
+            frames.append(frame)
+        assert frames == [SILENCE_FRAME]
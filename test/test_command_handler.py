@@ -1,8 +1,11 @@
 """Tests for command handler."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from src.command_handler import CommandRegistry, CommandHandler
+from src.voice_queue import VoiceQueue, VoiceQueueItem
 import discord
 
 
@@ -208,6 +211,34 @@ class TestCommandHandler:
         assert isinstance(embed_arg, discord.Embed)
         assert "Bot Status" in embed_arg.title
 
+    @pytest.mark.asyncio
+    async def test_queue_commands(self, handler, mock_logger):
+        """Test !queue, !skip and !clear against the voice queue."""
+        queue = VoiceQueue(AsyncMock())
+        queue.current = VoiceQueueItem("再生中の通知")
+        queue._heap = [(0, 1, VoiceQueueItem("次の通知", priority="high"))]
+        queue._heap[0][2].future = asyncio.get_running_loop().create_future()
+        mock_logger._voice_queue = queue
+
+        message = AsyncMock()
+        message.author = MagicMock()
+        message.reply = AsyncMock()
+
+        message.content = "!queue"
+        await handler.handle_message(message)
+        embed = message.reply.call_args[1]["embed"]
+        assert embed.fields[0].value == "再生中の通知"
+        assert "🔴 次の通知" in embed.fields[1].value
+
+        message.content = "!clear"
+        await handler.handle_message(message)
+        assert "Cleared 1" in message.reply.call_args[0][0]
+
+        message.content = "!skip"
+        await handler.handle_message(message)
+        assert "Skipped: 再生中の通知" in message.reply.call_args[0][0]
+        assert queue.current.skipped
+
     @pytest.mark.asyncio
     async def test_unknown_command(self, handler, mock_logger):
         """Test unknown command."""
@@ -0,0 +1,142 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.concurrency import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter:
+    """Test cases for AdaptiveLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_queues_over_limit_in_priority_order(self):
+        """Test that excess requests wait and "high" is served before "normal"."""
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        release = asyncio.Event()
+        order = []
+
+        async def hold():
+            async with limiter.acquire():
+                await release.wait()
+
+        async def request(name: str, priority: str):
+            async with limiter.acquire(priority):
+                order.append(name)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(request("normal-1", "normal")),
+            asyncio.create_task(request("normal-2", "normal")),
+            asyncio.create_task(request("high", "high")),
+        ]
+        await asyncio.sleep(0)
+        assert limiter.queued == 3
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order == ["high", "normal-1", "normal-2"]
+        assert limiter.in_flight == 0
+        assert limiter.stats()["queued_total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_while_saturated(self):
+        """Test that the limit increases additively when it is the bottleneck."""
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+        limiter.in_flight = 2
+        started_at = time.perf_counter() - 1.0
+
+        for _ in range(4):
+            limiter._on_success(started_at, 1.0)
+
+        assert 3 <= limiter.limit <= 4
+
+    @pytest.mark.asyncio
+    async def test_limit_does_not_grow_when_idle(self):
+        """Test that an unsaturated limit stays where it is."""
+        limiter = AdaptiveLimiter(initial_limit=4)
+        limiter._on_success(time.perf_counter(), 1.0)
+
+        assert limiter.limit == 4
+
+    def test_latency_spike_shrinks_limit(self):
+        """Test that latency well above the baseline backs the limit off."""
+        limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=2.0, backoff=0.5)
+        limiter._latencies.append(0.01)
+
+        limiter._on_success(time.perf_counter() - 1.0, 1.0)
+
+        assert limiter.limit == 4
+
+    def test_latency_is_compared_per_unit_of_cost(self):
+        """Test that a long text is not mistaken for overload."""
+        limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=2.0, backoff=0.5)
+        limiter._latencies.append(0.01)
+
+        limiter._on_success(time.perf_counter() - 1.0, 200.0)
+
+        assert limiter.limit == 8
+
+    def test_overload_shrinks_once_per_round(self):
+        """Test that requests started before a decrease do not shrink it again."""
+        limiter = AdaptiveLimiter(initial_limit=8, backoff=0.5)
+        started_at = time.perf_counter()
+
+        limiter._on_overload(started_at)
+        limiter._on_overload(started_at)
+
+        assert limiter.limit == 4
+
+    def test_limit_respects_min_limit(self):
+        """Test that backoff never goes below min_limit."""
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, backoff=0.5)
+
+        limiter._on_overload(time.perf_counter())
+
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_counts_as_overload(self):
+        """Test that an exception inside the block shrinks the limit."""
+        limiter = AdaptiveLimiter(initial_limit=8, backoff=0.5)
+
+        with pytest.raises(RuntimeError):
+            async with limiter.acquire():
+                raise RuntimeError("engine error")
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Test that cancelling a queued request frees its place."""
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.acquire():
+                await release.wait()
+
+        async def request():
+            async with limiter.acquire():
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        release.set()
+        await holder
+        assert limiter.in_flight == 0
+        assert limiter.queued == 0
+
+        async with limiter.acquire():
+            assert limiter.in_flight == 1
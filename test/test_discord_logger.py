@@ -1,10 +1,35 @@
 """Tests for Discord logger."""
 
 import asyncio
+import io
+import wave
 import pytest
 import discord
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.discord_logger import DiscordLogger
+from src.voice_backlog import BacklogPolicy
+from src.tts_cache import AudioCache, OpusPacketCache
+
+
+def _silent_wav(frames: int = 2400, sample_rate: int = 24000) -> bytes:
+    """Encode mono 16-bit silence as a WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * frames)
+    return buffer.getvalue()
+
+
+def _voice_client() -> MagicMock:
+    """Mock a connected voice client whose player finishes immediately."""
+    voice_client = MagicMock()
+    voice_client.is_connected.return_value = True
+    voice_client.is_playing.return_value = False
+    voice_client.channel.name = "Test Voice"
+    voice_client.play.side_effect = lambda source, after=None: after(None)
+    return voice_client
 
 
 @pytest.mark.usefixtures("isolate_env")
@@ -167,6 +192,476 @@ class TestDiscordLogger:
             assert result["status"] == "not_connected"
             mock_thread.send.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_notify_voice_chunked_playback(self, logger):
+        """Test that a long message is played as one chained source."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger.voice_chunk_max_chars = 20
+
+        mock_voice_client = _voice_client()
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.disk_cache = None
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        mock_voicevox.text_to_speech = AsyncMock(return_value=b"wav")
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with (
+            patch.object(
+                logger,
+                "_ensure_thread",
+                new_callable=AsyncMock,
+                return_value=mock_thread,
+            ),
+            patch("src.discord_logger.FFmpegPCMAudio") as mock_ffmpeg,
+        ):
+            result = await logger.notify_voice(
+                message="ビルド完了。テストも全部通りました。",
+                voice_channel_id=123,
+            )
+
+        assert result["status"] == "played"
+        assert result["chunks"] == 2
+        assert "time_to_first_audio_ms" in result
+        assert mock_voicevox.text_to_speech.await_count == 2
+        assert mock_ffmpeg.call_count == 2
+        mock_voice_client.play.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_notifications_do_not_overlap(self, logger):
+        """Test that the second caller starts only after the first playback ends."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+
+        finish_callbacks = []
+        mock_voice_client = _voice_client()
+        mock_voice_client.play.side_effect = lambda source, after=None: (
+            finish_callbacks.append(after)
+        )
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.audio_cache = None
+        mock_voicevox.disk_cache = None
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        mock_voicevox.text_to_speech = AsyncMock(return_value=_silent_wav())
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            first = asyncio.create_task(
+                logger.notify_voice(message="一件目", voice_channel_id=123)
+            )
+            second = asyncio.create_task(
+                logger.notify_voice(message="二件目", voice_channel_id=123)
+            )
+            while not finish_callbacks:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.05)
+            assert mock_voice_client.play.call_count == 1
+            assert not first.done()
+
+            finish_callbacks[0](None)
+            assert (await first)["status"] == "played"
+            while len(finish_callbacks) < 2:
+                await asyncio.sleep(0)
+            finish_callbacks[1](None)
+            assert (await second)["status"] == "played"
+
+    @pytest.mark.asyncio
+    async def test_high_priority_interrupts_and_resumes(self, logger):
+        """Test that a preempted notification resumes from the frame it stopped at."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger._voice_queue.preempt = True
+
+        players = []
+        mock_voice_client = _voice_client()
+        mock_voice_client.play.side_effect = lambda source, after=None: players.append(
+            (source, after)
+        )
+        mock_voice_client.is_playing.side_effect = lambda: len(players) == 1
+        mock_voice_client.stop.side_effect = lambda: players[-1][1](None)
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.audio_cache = None
+        mock_voicevox.disk_cache = None
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        mock_voicevox.text_to_speech = AsyncMock(return_value=_silent_wav(24000))
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            normal = asyncio.create_task(
+                logger.notify_voice(message="長い通知", voice_channel_id=123)
+            )
+            while not players:
+                await asyncio.sleep(0)
+            for _ in range(10):
+                players[0][0].read()  # The player sends 10 frames (200 ms)
+
+            urgent = asyncio.create_task(
+                logger.notify_voice(
+                    message="緊急", priority="high", voice_channel_id=123
+                )
+            )
+            while len(players) < 2:
+                await asyncio.sleep(0)
+            players[1][1](None)
+            assert (await urgent)["status"] == "played"
+
+            while len(players) < 3:
+                await asyncio.sleep(0)
+            resumed = players[2][0]
+            resumed.read()
+            assert resumed.position == (0, 11)
+            players[2][1](None)
+
+            result = await normal
+            assert result["status"] == "played"
+            assert result["preemptions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_notify_voice_skips_without_listeners(self, logger):
+        """Test that nothing is synthesized while only bots are in the channel."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger.voice_require_listeners = True
+
+        bot = MagicMock(bot=True)
+        human = MagicMock(bot=False)
+        mock_voice_client = _voice_client()
+        mock_voice_client.channel = MagicMock(spec=discord.VoiceChannel)
+        mock_voice_client.channel.name = "Test Voice"
+        mock_voice_client.channel.members = [bot]
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.audio_cache = None
+        mock_voicevox.disk_cache = None
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        mock_voicevox.text_to_speech = AsyncMock(return_value=_silent_wav())
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_thread.send = AsyncMock()
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            result = await logger.notify_voice(message="ビルド完了")
+
+            assert result["status"] == "skipped_no_listeners"
+            mock_thread.send.assert_awaited_once()
+            mock_voicevox.text_to_speech.assert_not_awaited()
+            mock_voice_client.play.assert_not_called()
+
+            # With a wait, the notification plays once someone joins
+            logger.voice_listener_wait = 5.0
+            pending = asyncio.create_task(logger.notify_voice(message="ビルド完了"))
+            await asyncio.sleep(0.05)
+            assert not pending.done()
+
+            mock_voice_client.channel.members = [bot, human]
+            logger._voice_members_changed.set()
+            assert (await pending)["status"] == "played"
+            mock_voicevox.text_to_speech.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_backlog_speeds_up_and_sheds_to_text(self, logger):
+        """Test that a growing backlog raises the speed, then demotes normal items."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger.voice_backlog = BacklogPolicy(
+            speed_steps=[(1.0, 1.5)], text_only_seconds=2.0, seconds_per_char=0.1
+        )
+
+        finish_callbacks = []
+        mock_voice_client = _voice_client()
+        mock_voice_client.play.side_effect = lambda source, after=None: (
+            finish_callbacks.append(after)
+        )
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.audio_cache = None
+        mock_voicevox.disk_cache = None
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        mock_voicevox.text_to_speech = AsyncMock(return_value=_silent_wav())
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            # 0.5 s of speech: normal speed
+            first = asyncio.create_task(logger.notify_voice(message="一二三四五"))
+            while not finish_callbacks:
+                await asyncio.sleep(0)
+            # Backlog 0.5 + 0.8 + 1.0 s: the 0.8 s one is sped up, the last is shed
+            second = asyncio.create_task(
+                logger.notify_voice(message="一二三四五六七八")
+            )
+            third = asyncio.create_task(
+                logger.notify_voice(message="一二三四五六七八九十")
+            )
+            await asyncio.sleep(0)
+            finish_callbacks[0](None)
+            assert (await first)["speed_scale"] == 1.0
+
+            while len(finish_callbacks) < 2:
+                await asyncio.sleep(0)
+            # Another arrives while the second plays, pushing the backlog over the limit
+            fourth = asyncio.create_task(
+                logger.notify_voice(message="一二三四五六七八九十")
+            )
+            await asyncio.sleep(0)
+            finish_callbacks[1](None)
+            assert (await second)["speed_scale"] == 1.5
+            mock_voicevox.text_to_speech.assert_any_await(
+                "一二三四五六七八", 1, priority="normal", speed_scale=1.5
+            )
+
+            results = [await third, await fourth]
+
+        assert [result["status"] for result in results] == ["text_only", "played"]
+        assert logger.voice_backlog.stats()["text_only"] == 1
+
+    @pytest.mark.asyncio
+    async def test_notify_voice_batches_remaining_chunks(self, logger):
+        """Test that chunks after the first are synthesized in one batch."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger.voice_chunk_max_chars = 10
+
+        mock_voice_client = _voice_client()
+        logger._voice_client = mock_voice_client
+
+        wav = _silent_wav()
+        mock_voicevox = MagicMock()
+        mock_voicevox.disk_cache = None
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        mock_voicevox.text_to_speech = AsyncMock(return_value=wav)
+        mock_voicevox.batch_text_to_speech = AsyncMock(return_value=[wav, wav])
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            result = await logger.notify_voice(
+                message="ビルド完了。テスト成功。デプロイ開始。",
+                voice_channel_id=123,
+            )
+
+        assert result["chunks"] == 3
+        mock_voicevox.text_to_speech.assert_awaited_once_with(
+            "ビルド完了。", 1, priority="normal"
+        )
+        mock_voicevox.batch_text_to_speech.assert_awaited_once_with(
+            ["テスト成功。", "デプロイ開始。"], 1, priority="normal"
+        )
+
+    @pytest.mark.asyncio
+    async def test_notify_voice_streaming_playback(self, logger):
+        """Test that uncached chunks are streamed instead of synthesized whole."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger.voice_streaming = True
+
+        mock_voice_client = _voice_client()
+        logger._voice_client = mock_voice_client
+
+        wav = _silent_wav()
+
+        async def stream(text, speaker_id=1, priority="normal"):
+            yield wav[:50]
+            yield wav[50:]
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        mock_voicevox.text_to_speech = AsyncMock()
+        mock_voicevox.stream_text_to_speech = MagicMock(side_effect=stream)
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            result = await logger.notify_voice(
+                message="ビルド完了", voice_channel_id=123
+            )
+
+        assert result["status"] == "played"
+        mock_voicevox.stream_text_to_speech.assert_called_once_with(
+            "ビルド完了", 1, priority="normal"
+        )
+        mock_voicevox.text_to_speech.assert_not_awaited()
+        mock_voice_client.play.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_notify_voice_plays_cached_opus_packets(self, logger):
+        """Test that cached Opus packets are played without synthesis or encoding."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger.opus_cache = OpusPacketCache()
+        logger.opus_cache.put(AudioCache.make_key("ビルド完了", 1), [b"p1", b"p2"])
+
+        mock_voice_client = _voice_client()
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.is_available = AsyncMock()
+        mock_voicevox.text_to_speech = AsyncMock()
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            result = await logger.notify_voice(
+                message="ビルド完了", voice_channel_id=123
+            )
+
+        assert result["status"] == "played"
+        mock_voicevox.is_available.assert_not_awaited()
+        mock_voicevox.text_to_speech.assert_not_awaited()
+        played = mock_voice_client.play.call_args.args[0]
+        assert played.is_opus()
+        assert [played.read() for _ in range(3)] == [b"p1", b"p2", b""]
+
+    @pytest.mark.asyncio
+    async def test_notify_voice_fills_opus_cache_for_repeated_phrase(self, logger):
+        """Test that a phrase served from the audio cache is encoded to Opus."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger.opus_cache = OpusPacketCache()
+
+        mock_voice_client = _voice_client()
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.is_cached.return_value = True
+        mock_voicevox.text_to_speech = AsyncMock(return_value=_silent_wav())
+        logger._voicevox = mock_voicevox
+
+        mock_thread = MagicMock()
+        mock_status = MagicMock()
+        mock_status.edit = AsyncMock()
+        mock_thread.send = AsyncMock(return_value=mock_status)
+
+        with (
+            patch.object(
+                logger,
+                "_ensure_thread",
+                new_callable=AsyncMock,
+                return_value=mock_thread,
+            ),
+            patch(
+                "src.discord_logger.encode_opus_packets", return_value=[b"p1"]
+            ) as mock_encode,
+        ):
+            await logger.notify_voice(message="ビルド完了", voice_channel_id=123)
+            await asyncio.gather(*logger._background_tasks)
+
+        mock_encode.assert_called_once()
+        assert logger.opus_cache.get(AudioCache.make_key("ビルド完了", 1)) == [b"p1"]
+
+    @pytest.mark.asyncio
+    async def test_notify_voice_reads_cached_health_state(self, logger):
+        """Test that notify_voice fails fast from the monitor's cached state."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+
+        mock_voice_client = MagicMock()
+        mock_voice_client.is_connected.return_value = True
+        mock_voice_client.channel.name = "Test Voice"
+        logger._voice_client = mock_voice_client
+
+        mock_voicevox = MagicMock()
+        mock_voicevox.is_cached.return_value = False
+        mock_voicevox.is_available = AsyncMock(return_value=True)
+        logger._voicevox = mock_voicevox
+        logger._voicevox_health = MagicMock(available=False)
+
+        mock_thread = MagicMock()
+        mock_thread.send = AsyncMock()
+
+        with patch.object(
+            logger, "_ensure_thread", new_callable=AsyncMock, return_value=mock_thread
+        ):
+            with pytest.raises(RuntimeError, match="VoiceVox is required"):
+                await logger.notify_voice(message="ビルド完了", voice_channel_id=123)
+
+        mock_voicevox.is_available.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_notify_voice_rejects_unknown_speaker_before_posting(self, logger):
+        """Test that an unknown speaker_id fails before any Discord work."""
+        logger._client = MagicMock()
+        logger._client.is_ready.return_value = True
+        logger._speaker_catalog = MagicMock(loaded=True, stale=False)
+        logger._speaker_catalog.__contains__.return_value = False
+
+        with patch.object(logger, "_ensure_thread", new_callable=AsyncMock) as ensure:
+            with pytest.raises(ValueError, match="Unknown VoiceVox speaker_id: 999"):
+                await logger.notify_voice(message="ビルド完了", speaker_id=999)
+
+        ensure.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resolve_speaker_by_name(self, logger):
+        """Test that a speaker name overrides speaker_id."""
+        logger._speaker_catalog = MagicMock()
+        logger._speaker_catalog.ensure_fresh = AsyncMock()
+        logger._speaker_catalog.resolve.return_value = MagicMock(style_id=3)
+
+        assert await logger._resolve_speaker(1, "ずんだもん") == 3
+        logger._speaker_catalog.resolve.assert_called_once_with("ずんだもん")
+
     @pytest.mark.asyncio
     async def test_auto_connect_voice_success(self, logger):
         """Test automatic voice channel connection."""
@@ -211,3 +706,16 @@ class TestDiscordLogger:
 
         mock_voice_client.disconnect.assert_awaited_once()
         logger._client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_voicevox_pool(self, logger):
+        """Test that close() closes the pooled VoiceVox client."""
+        logger._client = MagicMock()
+        logger._client.close = AsyncMock()
+        mock_voicevox = MagicMock()
+        mock_voicevox.close = AsyncMock()
+        logger._voicevox = mock_voicevox
+
+        await logger.close()
+
+        mock_voicevox.close.assert_awaited_once()
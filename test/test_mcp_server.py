@@ -64,3 +64,4 @@ class TestMCPServerModels:
 
         assert request.priority == "normal"  # Default
         assert request.speaker_id == 1  # Default
+        assert request.wait is True  # Default
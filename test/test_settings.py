@@ -38,6 +38,47 @@ class TestSettings:
         assert settings.voice_channel_id is None  # Default
         assert settings.voicevox_url == "http://localhost:50021"  # Default
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "http://a:50021, http://b:50021",
+            '["http://a:50021", "http://b:50021"]',
+        ],
+    )
+    def test_voicevox_urls(self, monkeypatch, value):
+        """Test that VOICEVOX_URL accepts several engines."""
+        monkeypatch.setenv("DISCORD_TOKEN", "test-token")
+        monkeypatch.setenv("LOG_CHANNEL_ID", "123456789012345678")
+        monkeypatch.setenv("VOICEVOX_URL", value)
+
+        settings = Settings()
+
+        assert settings.voicevox_urls == ["http://a:50021", "http://b:50021"]
+
+    def test_warmup_lists(self, monkeypatch):
+        """Test that warm-up speakers and phrases are parsed as lists."""
+        monkeypatch.setenv("DISCORD_TOKEN", "test-token")
+        monkeypatch.setenv("LOG_CHANNEL_ID", "123456789012345678")
+        monkeypatch.setenv("VOICE_WARMUP_SPEAKER_IDS", "1, 3")
+        monkeypatch.setenv("VOICE_WARMUP_PHRASES", '["ビルド完了。", "テスト失敗。"]')
+
+        settings = Settings()
+
+        assert settings.warmup_speaker_ids == [1, 3]
+        assert settings.warmup_phrases == ["ビルド完了。", "テスト失敗。"]
+
+    def test_backlog_speed_steps(self, monkeypatch):
+        """Test that backlog speed steps are parsed as (seconds, speed) pairs."""
+        monkeypatch.setenv("DISCORD_TOKEN", "test-token")
+        monkeypatch.setenv("LOG_CHANNEL_ID", "123456789012345678")
+        monkeypatch.setenv("VOICE_BACKLOG_SPEED_STEPS", "20:1.2, 40:1.4")
+
+        assert Settings().backlog_speed_steps == [(20.0, 1.2), (40.0, 1.4)]
+
+        monkeypatch.setenv("VOICE_BACKLOG_SPEED_STEPS", "1.2")
+        with pytest.raises(ValueError, match="seconds:speed"):
+            Settings().backlog_speed_steps
+
     def test_settings_missing_required(self, monkeypatch):
         """Test that missing required fields raise ValidationError."""
         # Clear all relevant env vars
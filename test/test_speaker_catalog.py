@@ -0,0 +1,129 @@
+"""Tests for the VoiceVox speaker catalog."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.speaker_catalog import SpeakerCatalog
+
+SPEAKERS = [
+    {
+        "name": "四国めたん",
+        "speaker_uuid": "uuid-metan",
+        "styles": [{"name": "ノーマル", "id": 2}, {"name": "あまあま", "id": 0}],
+    },
+    {
+        "name": "ずんだもん",
+        "speaker_uuid": "uuid-zundamon",
+        "styles": [
+            {"name": "ハミング", "id": 3001, "type": "frame_decode"},
+            {"name": "ノーマル", "id": 3},
+            {"name": "あまあま", "id": 1},
+        ],
+    },
+]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def client():
+    """Create a mock VoiceVox client."""
+    client = MagicMock()
+    client.get_speakers = AsyncMock(return_value=SPEAKERS)
+    return client
+
+
+class TestSpeakerCatalog:
+    """Test cases for SpeakerCatalog."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_by_style_id_and_name(self, client):
+        """Test lookups by ID, speaker name and speaker/style name."""
+        catalog = SpeakerCatalog(client)
+        await catalog.refresh()
+
+        assert 1 in catalog
+        assert 99 not in catalog
+        assert catalog.get_style(1).label == "ずんだもん/あまあま"
+        assert catalog.find("四国めたん/あまあま").style_id == 0
+        # A bare name selects the first talk style
+        assert catalog.find("ずんだもん").style_id == 3
+        assert [s.style_id for s in catalog.styles_of("ずんだもん")] == [3001, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_resolve(self, client):
+        """Test resolving names and numeric strings."""
+        catalog = SpeakerCatalog(client)
+        await catalog.refresh()
+
+        assert catalog.resolve("ずんだもん／あまあま").style_id == 1
+        assert catalog.resolve("2").speaker_name == "四国めたん"
+        with pytest.raises(ValueError, match="Unknown VoiceVox speaker"):
+            catalog.resolve("存在しない")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_request(self, client):
+        """Test that concurrent callers trigger a single /speakers request."""
+        release = asyncio.Event()
+
+        async def get_speakers():
+            await release.wait()
+            return SPEAKERS
+
+        client.get_speakers = AsyncMock(side_effect=get_speakers)
+        catalog = SpeakerCatalog(client)
+
+        waiters = [asyncio.create_task(catalog.get_speakers()) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert client.get_speakers.await_count == 1
+        assert all(result == SPEAKERS for result in results)
+
+    @pytest.mark.asyncio
+    async def test_ttl(self, client):
+        """Test that the catalog is fetched again only after the TTL."""
+        clock = FakeClock()
+        catalog = SpeakerCatalog(client, ttl=60.0, clock=clock)
+
+        await catalog.get_speakers()
+        clock.now = 59.0
+        await catalog.get_speakers()
+        assert client.get_speakers.await_count == 1
+
+        clock.now = 60.0
+        await catalog.get_speakers()
+        assert client.get_speakers.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_catalog(self, client):
+        """Test that a stale catalog is still served if the engine is down."""
+        clock = FakeClock()
+        catalog = SpeakerCatalog(client, ttl=60.0, clock=clock)
+        await catalog.refresh()
+
+        clock.now = 120.0
+        client.get_speakers.side_effect = RuntimeError("engine down")
+
+        assert await catalog.get_speakers() == SPEAKERS
+        assert 3 in catalog
+
+    @pytest.mark.asyncio
+    async def test_first_load_failure_raises(self, client):
+        """Test that an unloaded catalog reports the fetch error."""
+        client.get_speakers.side_effect = RuntimeError("engine down")
+        catalog = SpeakerCatalog(client)
+
+        with pytest.raises(RuntimeError):
+            await catalog.get_speakers()
+        assert not catalog.loaded
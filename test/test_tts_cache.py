@@ -0,0 +1,185 @@
+"""Tests for synthesized audio caches."""
+
+import os
+
+from src.tts_cache import (
+    AudioCache,
+    AudioQueryCache,
+    DiskAudioCache,
+    OpusPacketCache,
+    normalize_text,
+)
+
+
+class TestNormalizeText:
+    """Test suite for normalize_text."""
+
+    def test_folds_width_and_whitespace(self):
+        """Test that full-width characters and extra whitespace are normalized."""
+        assert normalize_text("  ＢＵＩＬＤ　完了  ") == "BUILD 完了"
+
+    def test_plain_text_unchanged(self):
+        """Test that already-normalized text is unchanged."""
+        assert normalize_text("ビルド完了") == "ビルド完了"
+
+
+class TestAudioCache:
+    """Test suite for AudioCache class."""
+
+    def test_make_key_normalizes_text(self):
+        """Test that keys ignore trivial text differences."""
+        assert AudioCache.make_key("テスト 失敗", 1, None) == AudioCache.make_key(
+            "テスト　失敗 ", 1, None
+        )
+        assert AudioCache.make_key("テスト", 1, None) != AudioCache.make_key(
+            "テスト", 1, 1.2
+        )
+
+    def test_hit_and_miss_counters(self):
+        """Test hit/miss counting."""
+        cache = AudioCache(max_bytes=100)
+        key = AudioCache.make_key("ビルド完了", 1, None)
+
+        assert cache.get(key) is None
+        cache.put(key, b"wav")
+        assert cache.get(key) == b"wav"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used_by_size(self):
+        """Test that eviction keeps total size within max_bytes in LRU order."""
+        cache = AudioCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", b"1234")
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.size == 8
+        assert cache.evictions == 1
+
+    def test_oversized_audio_not_cached(self):
+        """Test that audio larger than the cache is skipped."""
+        cache = AudioCache(max_bytes=4)
+        cache.put("big", b"12345")
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_replacing_entry_updates_size(self):
+        """Test that re-putting a key does not double count its size."""
+        cache = AudioCache(max_bytes=100)
+        cache.put("a", b"1234")
+        cache.put("a", b"12")
+
+        assert cache.size == 2
+        assert len(cache) == 1
+
+
+class TestOpusPacketCache:
+    """Test cases for OpusPacketCache."""
+
+    def test_size_counts_packet_bytes(self):
+        """Test that the byte limit applies to the total packet size."""
+        cache = OpusPacketCache(max_bytes=10, bitrate=32, complexity=5)
+        cache.put("a", [b"123", b"45"])
+        cache.put("b", [b"6789"])
+        assert cache.size == 9
+
+        cache.put("c", [b"ab", b"cd"])
+
+        assert "a" not in cache
+        assert cache.get("c") == [b"ab", b"cd"]
+        assert cache.stats()["bitrate"] == 32
+        assert cache.stats()["complexity"] == 5
+
+
+class TestAudioQueryCache:
+    """Test suite for AudioQueryCache class."""
+
+    def test_returns_independent_copies(self):
+        """Test that modifying a returned query does not change the cache."""
+        cache = AudioQueryCache()
+        key = AudioQueryCache.make_key("ビルド完了", 1)
+        cache.put(key, {"speedScale": 1.0, "accent_phrases": [{"moras": []}]})
+
+        query = cache.get(key)
+        query["speedScale"] = 1.5
+        query["accent_phrases"][0]["moras"].append("x")
+
+        assert cache.get(key) == {"speedScale": 1.0, "accent_phrases": [{"moras": []}]}
+        assert cache.stats()["hits"] == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test eviction by entry count."""
+        cache = AudioQueryCache(max_entries=2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")
+        cache.put("c", {})
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats()["evictions"] == 1
+
+
+class TestDiskAudioCache:
+    """Test suite for DiskAudioCache class."""
+
+    def test_put_and_mmap_get(self, tmp_path):
+        """Test that stored audio is read back through a memory map."""
+        cache = DiskAudioCache(str(tmp_path))
+        key = AudioCache.make_key("ビルド完了", 1, None)
+
+        assert cache.get(key) is None
+        path = cache.put(key, b"RIFF-wav-data")
+
+        view = cache.get(key)
+        assert isinstance(view, memoryview)
+        assert view == b"RIFF-wav-data"
+        assert os.path.basename(path) == DiskAudioCache.address(key) + ".wav"
+        assert cache.get_path(key) == path
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_shared_between_instances(self, tmp_path):
+        """Test that another instance on the same directory sees the entry."""
+        key = AudioCache.make_key("テスト失敗", 3, 1.2)
+        DiskAudioCache(str(tmp_path)).put(key, b"wav")
+
+        assert DiskAudioCache(str(tmp_path)).get(key) == b"wav"
+
+    def test_evicts_least_recently_accessed(self, tmp_path):
+        """Test LRU eviction by access time when exceeding max_bytes."""
+        cache = DiskAudioCache(str(tmp_path), max_bytes=10)
+        old_path = cache.put("old", b"1234")
+        recent_path = cache.put("recent", b"1234")
+        os.utime(old_path, (1_000, 1_000))
+        os.utime(recent_path, (2_000, 2_000))
+
+        new_path = cache.put("new", b"1234")
+
+        assert not os.path.exists(old_path)
+        assert os.path.exists(recent_path)
+        assert os.path.exists(new_path)
+        assert cache.evictions == 1
+        assert cache.size() == 8
+
+    def test_access_refreshes_atime(self, tmp_path):
+        """Test that a hit protects the entry from eviction."""
+        cache = DiskAudioCache(str(tmp_path), max_bytes=10)
+        first = cache.put("first", b"1234")
+        second = cache.put("second", b"1234")
+        os.utime(first, (1_000, 1_000))
+        os.utime(second, (2_000, 2_000))
+
+        cache.get("first")
+        cache.put("third", b"1234")
+
+        assert os.path.exists(first)
+        assert not os.path.exists(second)
@@ -0,0 +1,44 @@
+"""Tests for the voice backlog policy."""
+
+from src.voice_backlog import BacklogPolicy, estimate_speech_seconds
+
+
+class TestBacklogPolicy:
+    """Test cases for BacklogPolicy."""
+
+    def test_estimate_ignores_whitespace(self):
+        """Test that the estimate scales with the spoken characters."""
+        assert estimate_speech_seconds("ビルド 完了", 0.1) == 0.5
+
+    def test_speed_steps_apply_highest_threshold(self):
+        """Test that speed rises step by step as the backlog grows."""
+        policy = BacklogPolicy(speed_steps=[(40, 1.4), (20, 1.2)])
+
+        assert policy.decide("normal", 10).speed_scale is None
+        assert policy.decide("normal", 20).speed_scale == 1.2
+        assert policy.decide("normal", 55).speed_scale == 1.4
+
+    def test_sheds_only_normal_priority_past_limit(self):
+        """Test that past the hard limit normal items go text-only, high ones speak."""
+        policy = BacklogPolicy(speed_steps=[(20, 1.5)], text_only_seconds=60)
+
+        normal = policy.decide("normal", 61)
+        high = policy.decide("high", 61)
+
+        assert normal.text_only
+        assert not high.text_only
+        assert high.speed_scale == 1.5
+
+        policy.record(normal)
+        policy.record(high)
+        assert policy.stats() == {
+            "backlog_seconds": 61,
+            "sped_up": 1,
+            "text_only": 1,
+        }
+
+    def test_backlog_sums_messages(self):
+        """Test that the backlog is the total estimated speech duration."""
+        policy = BacklogPolicy(seconds_per_char=0.5)
+
+        assert policy.backlog_seconds(["ab", "cde"]) == 2.5
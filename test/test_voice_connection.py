@@ -0,0 +1,142 @@
+"""Tests for the voice connection supervisor."""
+
+import asyncio
+
+import discord
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.voice_connection import VoiceConnectionSupervisor
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _voice_client(connected: bool = True) -> MagicMock:
+    """Mock a voice client."""
+    voice_client = MagicMock()
+    voice_client.is_connected.return_value = connected
+    voice_client.is_playing.return_value = False
+    voice_client.disconnect = AsyncMock()
+    return voice_client
+
+
+def _channel(*results) -> MagicMock:
+    """Mock a voice channel whose connect() returns or raises the given results."""
+    channel = MagicMock(spec=discord.VoiceChannel)
+    channel.id = 42
+    channel.connect = AsyncMock(side_effect=list(results))
+    return channel
+
+
+class TestVoiceConnectionSupervisor:
+    """Test cases for VoiceConnectionSupervisor."""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_dropped_connection_with_backoff(self):
+        """Test that a dropped connection is re-established after backing off."""
+        clock = FakeClock()
+        fresh = _voice_client()
+        channel = _channel(RuntimeError("handshake failed"), fresh)
+        supervisor = VoiceConnectionSupervisor(
+            lambda channel_id: channel, channel_id=42, jitter=0.0, clock=clock
+        )
+        dropped = _voice_client(connected=False)
+        supervisor.attach(dropped)
+
+        await supervisor.check()
+        assert supervisor.consecutive_failures == 1
+        assert supervisor.stats()["retry_in"] == 1.0
+
+        await supervisor.check()  # Still backing off
+        assert channel.connect.await_count == 1
+
+        clock.now = 1.0
+        await supervisor.check()
+        assert supervisor.voice_client is fresh
+        assert supervisor.reconnects == 1
+        assert supervisor.consecutive_failures == 0
+        dropped.disconnect.assert_awaited_with(force=True)
+
+    def test_backoff_is_exponential_capped_and_jittered(self):
+        """Test the reconnect delay grows per failure up to backoff_max."""
+        clock = FakeClock()
+        supervisor = VoiceConnectionSupervisor(
+            lambda channel_id: None, backoff_max=5.0, jitter=0.5, clock=clock
+        )
+        delays = []
+        for _ in range(5):
+            supervisor._record_failure(RuntimeError("down"))
+            delays.append(supervisor._retry_at)
+
+        for failures, delay in enumerate(delays):
+            ceiling = min(5.0, 2.0**failures)
+            assert ceiling / 2 <= delay <= ceiling
+
+    @pytest.mark.asyncio
+    async def test_releases_idle_connection(self):
+        """Test that an unused connection is released after idle_timeout."""
+        clock = FakeClock()
+        busy = False
+        voice_client = _voice_client()
+        supervisor = VoiceConnectionSupervisor(
+            lambda channel_id: None,
+            busy=lambda: busy,
+            idle_timeout=60.0,
+            clock=clock,
+        )
+        supervisor.attach(voice_client)
+
+        clock.now = 90.0
+        busy = True  # Notifications queued: keep it
+        await supervisor.check()
+        voice_client.disconnect.assert_not_awaited()
+
+        busy = False
+        await supervisor.check()
+        voice_client.disconnect.assert_awaited_once()
+        assert supervisor.voice_client is None
+        assert not supervisor.wanted
+        assert supervisor.idle_releases == 1
+
+        await supervisor.check()  # Not wanted: no reconnect
+        assert supervisor.connects == 0
+
+    @pytest.mark.asyncio
+    async def test_wake_preconnects_in_background(self):
+        """Test that a queued notification connects before it needs the channel."""
+        voice_client = _voice_client()
+        channel = _channel(voice_client)
+        supervisor = VoiceConnectionSupervisor(
+            lambda channel_id: channel, channel_id=42, check_interval=60.0
+        )
+        supervisor.start()
+        await asyncio.sleep(0)
+        assert channel.connect.await_count == 0  # Not wanted yet
+
+        supervisor.busy = lambda: True
+        supervisor.wake()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await supervisor.stop()
+
+        assert supervisor.voice_client is voice_client
+        assert await supervisor.ensure() is voice_client
+        assert channel.connect.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ensure_rejects_non_voice_channel(self):
+        """Test that connecting to a missing or text channel fails clearly."""
+        supervisor = VoiceConnectionSupervisor(lambda channel_id: MagicMock())
+
+        with pytest.raises(RuntimeError, match="required"):
+            await supervisor.ensure()
+        with pytest.raises(RuntimeError, match="not a voice channel"):
+            await supervisor.ensure(7)
@@ -0,0 +1,84 @@
+"""Tests for voice pipeline helpers."""
+
+import asyncio
+
+import pytest
+
+from src.voice_pipeline import pipelined, split_sentences
+
+
+class TestSplitSentences:
+    """Test suite for split_sentences."""
+
+    def test_short_text_single_chunk(self):
+        """Test that a single sentence is not split."""
+        assert split_sentences("ビルド完了") == ["ビルド完了"]
+
+    def test_japanese_sentences(self):
+        """Test splitting at Japanese sentence terminators."""
+        chunks = split_sentences("ビルド完了。テスト失敗！確認してください？", 10)
+        assert chunks == ["ビルド完了。", "テスト失敗！", "確認してください？"]
+
+    def test_first_sentence_kept_alone_rest_packed(self):
+        """Test that the first sentence is its own chunk and the rest are packed."""
+        chunks = split_sentences("完了。一。二。三。", 80)
+        assert chunks == ["完了。", "一。二。三。"]
+
+    def test_english_sentences_keep_decimals(self):
+        """Test English splitting without breaking version numbers."""
+        chunks = split_sentences("Released v1.2 today. Tests passed! Done?", 25)
+        assert chunks == ["Released v1.2 today.", "Tests passed! Done?"]
+
+    def test_long_sentence_split_at_clauses(self):
+        """Test that an overlong sentence is split at 、 boundaries."""
+        chunks = split_sentences("あいうえお、かきくけこ、さしすせそ。", 12)
+        assert chunks == ["あいうえお、かきくけこ、", "さしすせそ。"]
+
+    def test_hard_wrap_without_boundaries(self):
+        """Test that text with no boundaries is hard-wrapped."""
+        chunks = split_sentences("あ" * 25, 10)
+        assert chunks == ["あ" * 10, "あ" * 10, "あ" * 5]
+
+    def test_blank_text(self):
+        """Test that blank text yields no chunks."""
+        assert split_sentences("  \n ") == []
+
+
+class TestPipelined:
+    """Test suite for pipelined."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_order_with_bounded_concurrency(self):
+        """Test ordering and the concurrency bound."""
+        running = 0
+        peak = 0
+
+        async def render(item: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later items finish first to check ordering
+            await asyncio.sleep(0.01 * (5 - int(item)))
+            running -= 1
+            return f"audio-{item}"
+
+        results = [r async for r in pipelined(["1", "2", "3", "4"], render, 2)]
+
+        assert results == ["audio-1", "audio-2", "audio-3", "audio-4"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_first_result_before_rest_finished(self):
+        """Test that the first result is yielded while later items still render."""
+        release = asyncio.Event()
+
+        async def render(item: str) -> str:
+            if item != "first":
+                await release.wait()
+            return item
+
+        generator = pipelined(["first", "second"], render, 2)
+        assert await generator.__anext__() == "first"
+        release.set()
+        assert await generator.__anext__() == "second"
+        await generator.aclose()
@@ -0,0 +1,291 @@
+"""Tests for the voice notification queue."""
+
+import asyncio
+
+import pytest
+
+from src.voice_queue import VoiceQueue, VoiceQueueItem, dedup_key
+
+
+class TestVoiceQueue:
+    """Test cases for VoiceQueue."""
+
+    @pytest.mark.asyncio
+    async def test_plays_one_at_a_time_by_priority(self):
+        """Test that items never overlap and "high" jumps ahead of "normal"."""
+        release = asyncio.Event()
+        playing = 0
+        order = []
+
+        async def play(item: VoiceQueueItem):
+            nonlocal playing
+            playing += 1
+            assert playing == 1
+            order.append(item.message)
+            if item.message == "first":
+                await release.wait()
+            playing -= 1
+            return {"status": "played"}
+
+        queue = VoiceQueue(play)
+        futures = [queue.submit(VoiceQueueItem("first"))]
+        await asyncio.sleep(0)
+        futures.append(queue.submit(VoiceQueueItem("normal")))
+        futures.append(queue.submit(VoiceQueueItem("urgent", priority="high")))
+        assert [item.message for item in queue.pending()] == ["urgent", "normal"]
+
+        release.set()
+        results = await asyncio.gather(*futures)
+
+        assert order == ["first", "urgent", "normal"]
+        assert all(result["status"] == "played" for result in results)
+        assert queue.stats()["played"] == 3
+
+    @pytest.mark.asyncio
+    async def test_prepares_next_item_while_playing(self):
+        """Test that the next item is prepared before its turn."""
+        release = asyncio.Event()
+        events = []
+
+        async def play(item: VoiceQueueItem):
+            events.append(f"play {item.message}")
+            if item.message == "first":
+                await release.wait()
+            return {"status": "played"}
+
+        async def prepare(item: VoiceQueueItem):
+            events.append(f"prepare {item.message}")
+
+        queue = VoiceQueue(play, prepare=prepare)
+        first = queue.submit(VoiceQueueItem("first"))
+        await asyncio.sleep(0)
+        second = queue.submit(VoiceQueueItem("second"))
+        await asyncio.sleep(0)
+
+        assert events == ["play first", "prepare second"]
+        release.set()
+        await asyncio.gather(first, second)
+        assert events[-1] == "play second"
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_the_caller(self):
+        """Test that a failed item raises for its caller and the queue goes on."""
+
+        async def play(item: VoiceQueueItem):
+            if item.message == "bad":
+                raise RuntimeError("boom")
+            return {"status": "played"}
+
+        queue = VoiceQueue(play)
+        bad = queue.submit(VoiceQueueItem("bad"))
+        good = queue.submit(VoiceQueueItem("good"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await bad
+        assert (await good)["status"] == "played"
+
+    @pytest.mark.asyncio
+    async def test_skip_and_clear(self):
+        """Test that !skip stops the current item and !clear drops the rest."""
+        stopped = asyncio.Event()
+
+        async def play(item: VoiceQueueItem):
+            await stopped.wait()
+            return {"status": "skipped" if item.skipped else "played"}
+
+        queue = VoiceQueue(play, on_skip=stopped.set)
+        current = queue.submit(VoiceQueueItem("current"))
+        waiting = [queue.submit(VoiceQueueItem(f"waiting {i}")) for i in range(2)]
+        await asyncio.sleep(0)
+
+        assert queue.clear() == 2
+        assert queue.skip() is queue.current
+        assert (await current)["status"] == "skipped"
+        assert [(await future)["status"] for future in waiting] == ["cleared"] * 2
+        assert queue.skip() is None
+
+    @pytest.mark.asyncio
+    async def test_high_priority_preempts_and_normal_resumes(self):
+        """Test that "high" interrupts "normal", which resumes before later arrivals."""
+        stopped = asyncio.Event()
+        plays = []
+
+        async def play(item: VoiceQueueItem):
+            plays.append((item.message, item.resume_frame))
+            if item.message == "long" and not item.preemptions:
+                await stopped.wait()
+                item.resume_frame = 42  # Where the player was stopped
+                return {"status": "preempted"}
+            return {"status": "played"}
+
+        queue = VoiceQueue(play, on_skip=stopped.set, preempt=True)
+        long = queue.submit(VoiceQueueItem("long"))
+        await asyncio.sleep(0)
+        later = queue.submit(VoiceQueueItem("later"))
+        urgent = queue.submit(VoiceQueueItem("urgent", priority="high"))
+
+        results = await asyncio.gather(long, urgent, later)
+
+        assert plays == [("long", 0), ("urgent", 0), ("long", 42), ("later", 0)]
+        assert all(result["status"] == "played" for result in results)
+        assert queue.stats()["preempted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_preemption_by_default(self):
+        """Test that "high" waits for the playing item unless preemption is on."""
+        release = asyncio.Event()
+        stops = []
+
+        async def play(item: VoiceQueueItem):
+            if item.message == "long":
+                await release.wait()
+            return {"status": "played"}
+
+        queue = VoiceQueue(play, on_skip=lambda: stops.append(True))
+        long = queue.submit(VoiceQueueItem("long"))
+        await asyncio.sleep(0)
+        urgent = queue.submit(VoiceQueueItem("urgent", priority="high"))
+        release.set()
+        await asyncio.gather(long, urgent)
+
+        assert stops == []
+        assert not queue.current
+
+    @pytest.mark.asyncio
+    async def test_merges_repeats_within_dedup_window(self):
+        """Test that repeats of a waiting item are announced once with their count."""
+        release = asyncio.Event()
+        plays = []
+
+        async def play(item: VoiceQueueItem):
+            plays.append((item.message, item.count))
+            if item.message == "first":
+                await release.wait()
+            return {"status": "played"}
+
+        queue = VoiceQueue(play, dedup_window=60.0)
+        first = queue.submit(VoiceQueueItem("first"))
+        await asyncio.sleep(0)
+        repeats = [
+            queue.submit(VoiceQueueItem(text))
+            for text in ["テスト失敗", "テスト失敗！", "ﾃｽﾄ失敗", "テスト 失敗。"]
+        ]
+        other_speaker = queue.submit(VoiceQueueItem("テスト失敗", speaker_id=3))
+        assert len(queue) == 2
+
+        release.set()
+        await first
+        results = await asyncio.gather(*repeats)
+        await other_speaker
+
+        assert plays == [("first", 1), ("テスト失敗", 4), ("テスト失敗", 1)]
+        target = results[0]
+        assert target["status"] == "played"
+        assert target["merged_requests"] == [r["request_id"] for r in results[1:]]
+        for merged in results[1:]:
+            assert merged["status"] == "merged"
+            assert merged["merged_into"] == target["request_id"]
+            assert merged["result"]["status"] == "played"
+        assert queue.stats()["merged"] == 3
+
+    @pytest.mark.asyncio
+    async def test_merged_caller_outlives_cancelled_target(self):
+        """Test that a merged request still plays if the original caller gave up."""
+        release = asyncio.Event()
+        plays = []
+
+        async def play(item: VoiceQueueItem):
+            plays.append(item.message)
+            if item.message == "first":
+                await release.wait()
+            return {"status": "played"}
+
+        queue = VoiceQueue(play, dedup_window=60.0)
+        first = queue.submit(VoiceQueueItem("first"))
+        await asyncio.sleep(0)
+        original = queue.submit(VoiceQueueItem("repeat"))
+        repeat = queue.submit(VoiceQueueItem("repeat"))
+        original.cancel()
+
+        release.set()
+        await first
+        result = await repeat
+        assert plays == ["first", "repeat"]
+        assert result["status"] == "merged"
+
+    @pytest.mark.asyncio
+    async def test_job_states_and_timing(self):
+        """Test that requests report queued/synthesizing/playing/done and timings."""
+        audio_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def play(item: VoiceQueueItem):
+            item.mark_playing()
+            audio_started.set()
+            await release.wait()
+            if item.message == "bad":
+                raise RuntimeError("boom")
+            return {"status": "played"}
+
+        queue = VoiceQueue(play, dedup_window=60.0)
+        first = VoiceQueueItem("first")
+        queue.submit(first)
+        second = VoiceQueueItem("bad")
+        queue.submit(second)
+        repeat = VoiceQueueItem("bad")
+        queue.submit(repeat)
+        assert first.status()["state"] == "queued"
+
+        await audio_started.wait()
+        assert queue.get(first.id).status()["state"] == "playing"
+        assert queue.get(second.id).status()["state"] == "queued"
+
+        release.set()
+        await first.future
+        with pytest.raises(RuntimeError):
+            await second.future
+
+        status = queue.get(first.id).status()
+        assert status["state"] == "done"
+        assert status["result"]["request_id"] == first.id
+        assert set(status["timing"]) == {
+            "queued_ms",
+            "time_to_audio_ms",
+            "playback_ms",
+            "total_ms",
+        }
+        assert status["timing"]["total_ms"] is not None
+        merged = queue.get(repeat.id).status()
+        assert merged["state"] == "failed"
+        assert merged["merged_into"] == second.id
+        assert merged["error"] == "boom"
+        assert queue.get(999) is None
+
+    def test_dedup_key(self):
+        """Test that only width, case, spacing and punctuation are ignored."""
+        assert dedup_key("Build  failed!") == dedup_key("build failed")
+        assert dedup_key("３件失敗。") == dedup_key("3件失敗")
+        assert dedup_key("3件失敗") != dedup_key("4件失敗")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_is_dropped(self):
+        """Test that an item whose caller gave up is not played."""
+        release = asyncio.Event()
+        played = []
+
+        async def play(item: VoiceQueueItem):
+            played.append(item.message)
+            await release.wait()
+            return {"status": "played"}
+
+        queue = VoiceQueue(play)
+        first = queue.submit(VoiceQueueItem("first"))
+        abandoned = queue.submit(VoiceQueueItem("abandoned"))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+
+        release.set()
+        await first
+        await asyncio.sleep(0)
+        assert played == ["first"]
+        await queue.stop()
@@ -1,8 +1,13 @@
 """Tests for VoiceVox client."""
 
+import io
+import zipfile
+
 import pytest
 import httpx
 from unittest.mock import AsyncMock, patch, MagicMock
+from src.concurrency import AdaptiveLimiter
+from src.tts_cache import AudioCache, AudioQueryCache, DiskAudioCache
 from src.voicevox_client import VoiceVoxClient
 
 
@@ -118,6 +123,300 @@ class TestVoiceVoxClient:
             mock_query.assert_awaited_once_with("テストです", 3)
             mock_synth.assert_awaited_once_with({"query": "data"}, 3)
 
+    @pytest.mark.asyncio
+    async def test_open_reuses_pooled_client(self, client):
+        """Test that an opened client reuses one pooled httpx client across calls."""
+        with patch("httpx.AsyncClient") as mock_client:
+            pooled = mock_client.return_value
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"query": "data"}
+            pooled.get = AsyncMock(return_value=mock_response)
+            pooled.post = AsyncMock(return_value=mock_response)
+            pooled.aclose = AsyncMock()
+
+            await client.open()
+            await client.open()  # Idempotent
+            assert client.is_open
+
+            await client.is_available()
+            await client.create_audio_query("こんにちは", speaker_id=1)
+            await client.get_speakers()
+
+            mock_client.assert_called_once()
+            assert mock_client.call_args.kwargs["limits"] == client.limits
+            assert pooled.get.await_count == 2
+            pooled.post.assert_awaited_once()
+
+            await client.close()
+            pooled.aclose.assert_awaited_once()
+            assert not client.is_open
+
+    @pytest.mark.asyncio
+    async def test_context_manager_opens_and_closes(self, client):
+        """Test that async with opens and closes the pool."""
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.aclose = AsyncMock()
+
+            async with client as opened:
+                assert opened.is_open
+
+            assert not client.is_open
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    def test_pool_limits_configurable(self):
+        """Test that connection pool limits are configurable."""
+        client = VoiceVoxClient(
+            max_connections=4, max_keepalive_connections=2, keepalive_expiry=5.0
+        )
+        assert client.limits.max_connections == 4
+        assert client.limits.max_keepalive_connections == 2
+        assert client.limits.keepalive_expiry == 5.0
+
+    @pytest.mark.asyncio
+    async def test_text_to_speech_cache_hit_skips_engine(self):
+        """Test that a repeated phrase is served from the audio cache."""
+        client = VoiceVoxClient(audio_cache=AudioCache(max_bytes=1024))
+        with (
+            patch.object(
+                client, "create_audio_query", new_callable=AsyncMock
+            ) as mock_query,
+            patch.object(client, "synthesize", new_callable=AsyncMock) as mock_synth,
+        ):
+            mock_query.return_value = {"query": "data"}
+            mock_synth.return_value = b"audio-data"
+
+            first = await client.text_to_speech("ビルド完了", speaker_id=1)
+            assert client.is_cached("ビルド完了", speaker_id=1)
+            second = await client.text_to_speech("ビルド完了", speaker_id=1)
+
+            assert first == second == b"audio-data"
+            mock_query.assert_awaited_once()
+            mock_synth.assert_awaited_once()
+            assert client.cache_stats()["audio"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_text_to_speech_cache_keyed_on_speed(self):
+        """Test that a different speed_scale is a cache miss."""
+        client = VoiceVoxClient(audio_cache=AudioCache(max_bytes=1024))
+        with (
+            patch.object(
+                client, "create_audio_query", new_callable=AsyncMock
+            ) as mock_query,
+            patch.object(client, "synthesize", new_callable=AsyncMock) as mock_synth,
+        ):
+            mock_query.return_value = {"query": "data"}
+            mock_synth.return_value = b"audio-data"
+
+            await client.text_to_speech("ビルド完了", speaker_id=1)
+            await client.text_to_speech("ビルド完了", speaker_id=1, speed_scale=1.5)
+
+            assert mock_synth.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_new_client(self, tmp_path):
+        """Test that audio cached on disk is reused by a fresh client."""
+        first = VoiceVoxClient(disk_cache=DiskAudioCache(str(tmp_path)))
+        with (
+            patch.object(first, "create_audio_query", new_callable=AsyncMock),
+            patch.object(first, "synthesize", new_callable=AsyncMock) as mock_synth,
+        ):
+            mock_synth.return_value = b"audio-data"
+            path = await first.text_to_speech_file("ビルド完了", speaker_id=1)
+
+        second = VoiceVoxClient(disk_cache=DiskAudioCache(str(tmp_path)))
+        with patch.object(second, "synthesize", new_callable=AsyncMock) as mock_synth:
+            assert second.is_cached("ビルド完了", speaker_id=1)
+            assert await second.text_to_speech_file("ビルド完了", speaker_id=1) == path
+            assert await second.text_to_speech("ビルド完了", speaker_id=1) == (
+                b"audio-data"
+            )
+            mock_synth.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_text_to_speech_file_requires_disk_cache(self, client):
+        """Test that text_to_speech_file fails without a disk cache."""
+        with pytest.raises(RuntimeError, match="Disk cache is not configured"):
+            await client.text_to_speech_file("テスト")
+
+    @pytest.mark.asyncio
+    async def test_prosody_change_reuses_audio_query(self):
+        """Test that changing speed/volume/pitch only calls /synthesis again."""
+        client = VoiceVoxClient(
+            audio_cache=AudioCache(max_bytes=1024), query_cache=AudioQueryCache()
+        )
+        with patch("httpx.AsyncClient") as mock_client:
+            query_response = MagicMock()
+            query_response.json.return_value = {"speedScale": 1.0}
+            synth_response = MagicMock()
+            synth_response.content = b"audio-data"
+
+            async def post(url, **kwargs):
+                return (
+                    query_response if url.endswith("/audio_query") else synth_response
+                )
+
+            mock_post = AsyncMock(side_effect=post)
+            mock_client.return_value.__aenter__.return_value.post = mock_post
+
+            await client.text_to_speech("ビルド完了", speaker_id=1)
+            await client.text_to_speech("ビルド完了", speaker_id=1, speed_scale=1.3)
+            await client.text_to_speech(
+                "ビルド完了", speaker_id=1, volume_scale=0.8, pitch_scale=0.05
+            )
+
+            urls = [call.args[0] for call in mock_post.await_args_list]
+            assert sum(url.endswith("/audio_query") for url in urls) == 1
+            assert sum(url.endswith("/synthesis") for url in urls) == 3
+            last_query = mock_post.await_args_list[-1].kwargs["json"]
+            assert last_query == {
+                "speedScale": 1.0,
+                "volumeScale": 0.8,
+                "pitchScale": 0.05,
+            }
+
+            stats = client.cache_stats()
+            assert stats["audio_query"]["hits"] == 2
+            assert stats["audio"]["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_text_to_speech_writes_through_disk_cache(self, tmp_path):
+        """Test that streamed audio is yielded in pieces and cached on disk."""
+        client = VoiceVoxClient(disk_cache=DiskAudioCache(str(tmp_path)))
+
+        async def stream(audio_query, speaker_id=1, chunk_size=8192):
+            for piece in (b"RIFF", b"-audio", b"-data"):
+                yield piece
+
+        with (
+            patch.object(client, "create_audio_query", new_callable=AsyncMock),
+            patch.object(client, "stream_synthesize", side_effect=stream),
+        ):
+            pieces = [p async for p in client.stream_text_to_speech("ビルド完了")]
+
+        assert pieces == [b"RIFF", b"-audio", b"-data"]
+        assert client.is_cached("ビルド完了")
+        cached = [bytes(p) async for p in client.stream_text_to_speech("ビルド完了")]
+        assert cached == [b"RIFF-audio-data"]
+
+    @pytest.mark.asyncio
+    async def test_stream_text_to_speech_discards_partial_audio(self, tmp_path):
+        """Test that an interrupted stream leaves no disk cache entry."""
+        client = VoiceVoxClient(disk_cache=DiskAudioCache(str(tmp_path)))
+
+        async def stream(audio_query, speaker_id=1, chunk_size=8192):
+            yield b"RIFF"
+            raise httpx.ReadError("connection lost")
+
+        with (
+            patch.object(client, "create_audio_query", new_callable=AsyncMock),
+            patch.object(client, "stream_synthesize", side_effect=stream),
+        ):
+            with pytest.raises(httpx.ReadError):
+                async for _ in client.stream_text_to_speech("ビルド完了"):
+                    pass
+
+        assert not client.is_cached("ビルド完了")
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_limiter_wraps_synthesis_but_not_cache_hits(self):
+        """Test that only engine work takes a concurrency slot."""
+        limiter = AdaptiveLimiter()
+        client = VoiceVoxClient(audio_cache=AudioCache(max_bytes=1024), limiter=limiter)
+
+        async def synthesize(audio_query, speaker_id=1):
+            assert limiter.in_flight == 1
+            return b"audio-data"
+
+        with (
+            patch.object(client, "create_audio_query", new_callable=AsyncMock),
+            patch.object(client, "synthesize", side_effect=synthesize),
+        ):
+            await client.text_to_speech("ビルド完了", priority="high")
+            await client.text_to_speech("ビルド完了", priority="high")
+
+        assert limiter.completed == 1
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_text_to_speech_uses_multi_synthesis(self):
+        """Test that uncached texts of one speaker share a /multi_synthesis call."""
+        client = VoiceVoxClient(audio_cache=AudioCache(max_bytes=1024))
+        client.audio_cache.put(AudioCache.make_key("キャッシュ済み", 1), b"cached")
+
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("002.wav", b"wav-2")
+            zf.writestr("001.wav", b"wav-1")
+
+        with patch("httpx.AsyncClient") as mock_client:
+            query_response = MagicMock()
+            query_response.json.return_value = {"speedScale": 1.0}
+            multi_response = MagicMock()
+            multi_response.content = archive.getvalue()
+
+            async def post(url, **kwargs):
+                return (
+                    query_response if url.endswith("/audio_query") else multi_response
+                )
+
+            mock_post = AsyncMock(side_effect=post)
+            mock_client.return_value.__aenter__.return_value.post = mock_post
+
+            audio = await client.batch_text_to_speech(
+                ["一つ目", "キャッシュ済み", "二つ目", "一つ目"], speaker_ids=1
+            )
+
+        assert audio == [b"wav-1", b"cached", b"wav-2", b"wav-1"]
+        urls = [call.args[0] for call in mock_post.await_args_list]
+        assert sum(url.endswith("/audio_query") for url in urls) == 2
+        assert sum(url.endswith("/multi_synthesis") for url in urls) == 1
+        assert client.is_cached("二つ目")
+        assert client.batch_stats()["batched_syntheses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_text_to_speech_falls_back_without_multi_synthesis(self):
+        """Test that engines without /multi_synthesis get one /synthesis per text."""
+        client = VoiceVoxClient()
+        not_found = httpx.HTTPStatusError(
+            "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
+        )
+
+        with (
+            patch.object(client, "create_audio_query", new_callable=AsyncMock),
+            patch.object(client, "multi_synthesize", side_effect=not_found) as multi,
+            patch.object(
+                client, "synthesize", new_callable=AsyncMock, return_value=b"wav"
+            ) as synthesize,
+        ):
+            assert await client.batch_text_to_speech(["一", "二"]) == [b"wav", b"wav"]
+            await client.batch_text_to_speech(["三", "四"])
+
+        assert multi.await_count == 1
+        assert synthesize.await_count == 4
+        assert client.multi_synthesis_supported is False
+
+    @pytest.mark.asyncio
+    async def test_initialize_speaker_on_every_engine(self):
+        """Test that /initialize_speaker is sent to each engine in the pool."""
+        client = VoiceVoxClient(["http://a:50021", "http://b:50021"])
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_post = AsyncMock(return_value=MagicMock())
+            mock_client.return_value.__aenter__.return_value.post = mock_post
+
+            await client.initialize_speaker(3)
+
+        urls = sorted(call.args[0] for call in mock_post.await_args_list)
+        assert urls == [
+            "http://a:50021/initialize_speaker",
+            "http://b:50021/initialize_speaker",
+        ]
+        assert mock_post.await_args.kwargs["params"] == {
+            "speaker": 3,
+            "skip_reinit": "true",
+        }
+
     def test_client_initialization(self):
         """Test VoiceVoxClient initialization with custom URL."""
         client = VoiceVoxClient(base_url="http://custom:8080")
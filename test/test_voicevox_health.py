@@ -0,0 +1,128 @@
+"""Tests for the VoiceVox health monitor and circuit breaker."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.voicevox_health import CircuitBreaker, CircuitState, VoiceVoxHealthMonitor
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_half_open_allows_single_trial(self):
+        """Test that only one trial request passes after the reset timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 5.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.consecutive_failures == 0
+
+    def test_failed_trial_backs_off(self):
+        """Test that failed trials double the reset timeout up to the maximum."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_timeout=5.0, max_reset_timeout=15.0, clock=clock
+        )
+        breaker.record_failure()
+
+        for expected in (10.0, 15.0, 15.0):
+            clock.now += breaker.reset_timeout
+            assert breaker.allow_request()
+            breaker.record_failure()
+            assert breaker.reset_timeout == expected
+            assert breaker.retry_in == expected
+
+        clock.now += breaker.reset_timeout
+        breaker.record_success()
+        assert breaker.reset_timeout == 5.0
+
+
+class TestVoiceVoxHealthMonitor:
+    """Test cases for VoiceVoxHealthMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_check_caches_probe_result(self):
+        """Test that availability is read from the last probe."""
+        client = MagicMock()
+        client.is_available = AsyncMock(return_value=True)
+        monitor = VoiceVoxHealthMonitor(client)
+
+        assert not monitor.available
+        assert await monitor.check()
+        assert monitor.available
+        assert monitor.stats()["state"] == "closed"
+        client.is_available.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_probes(self):
+        """Test that probes are skipped while the circuit is open."""
+        clock = FakeClock()
+        client = MagicMock()
+        client.is_available = AsyncMock(return_value=False)
+        monitor = VoiceVoxHealthMonitor(
+            client, breaker=CircuitBreaker(failure_threshold=1, clock=clock)
+        )
+
+        assert not await monitor.check()
+        assert not await monitor.check()
+        assert client.is_available.await_count == 1
+
+        clock.now = 5.0
+        client.is_available.return_value = True
+        assert await monitor.check()
+        assert monitor.available
+
+    @pytest.mark.asyncio
+    async def test_record_failure_fails_fast(self):
+        """Test that failures reported by callers mark the engine unavailable."""
+        client = MagicMock()
+        client.is_available = AsyncMock(return_value=True)
+        monitor = VoiceVoxHealthMonitor(
+            client, breaker=CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        )
+        await monitor.check()
+
+        monitor.record_failure()
+
+        assert not monitor.available
+        assert monitor.stats()["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        """Test that the background task probes and stops cleanly."""
+        client = MagicMock()
+        client.is_available = AsyncMock(return_value=True)
+        monitor = VoiceVoxHealthMonitor(client, interval=60.0)
+
+        monitor.start()
+        await monitor.stop()
+
+        assert monitor._task is None
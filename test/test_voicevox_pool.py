@@ -0,0 +1,185 @@
+"""Tests for the multi-engine VoiceVox pool."""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.voicevox_client import VoiceVoxClient
+from src.voicevox_pool import VoiceVoxPool
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError with the given status."""
+    request = httpx.Request("POST", "http://engine/synthesis")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+class TestVoiceVoxPool:
+    """Test cases for VoiceVoxPool."""
+
+    def test_requires_an_engine(self):
+        """Test that an empty URL list is rejected."""
+        with pytest.raises(ValueError):
+            VoiceVoxPool([])
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_requests(self):
+        """Test that requests go to the engine with the fewest in flight."""
+        pool = VoiceVoxPool(["http://a", "http://b", "http://c/"])
+
+        async with pool.request() as first:
+            async with pool.request() as second:
+                async with pool.request() as third:
+                    assert {first, second, third} == {
+                        "http://a",
+                        "http://b",
+                        "http://c",
+                    }
+                    assert all(e.outstanding == 1 for e in pool.engines)
+
+        assert all(e.outstanding == 0 for e in pool.engines)
+
+    @pytest.mark.asyncio
+    async def test_prefers_lower_latency_when_idle(self):
+        """Test that ties are broken by recent latency."""
+        pool = VoiceVoxPool(["http://a", "http://b"])
+        pool.engines[0].record_latency(300.0)
+        pool.engines[1].record_latency(100.0)
+
+        assert pool.select().url == "http://b"
+
+    @pytest.mark.asyncio
+    async def test_engine_failure_takes_engine_out_of_rotation(self):
+        """Test that connection errors and 5xx remove an engine until it recovers."""
+        pool = VoiceVoxPool(["http://a", "http://b"])
+
+        with pytest.raises(httpx.ConnectError):
+            async with pool.request():
+                raise httpx.ConnectError("refused")
+        with pytest.raises(httpx.HTTPStatusError):
+            async with pool.request():
+                raise _status_error(503)
+
+        assert [e.healthy for e in pool.engines] == [False, False]
+        # With every engine out of rotation, requests still go somewhere
+        assert pool.select() in pool.engines
+
+        pool.mark(pool.engines[1], True)
+        assert pool.select().url == "http://b"
+
+    @pytest.mark.asyncio
+    async def test_client_error_keeps_engine_in_rotation(self):
+        """Test that a 4xx (bad request) does not mark the engine unhealthy."""
+        pool = VoiceVoxPool(["http://a"])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            async with pool.request():
+                raise _status_error(422)
+
+        engine = pool.engines[0]
+        assert engine.healthy
+        assert engine.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_latency_stats(self):
+        """Test that successful requests record per-engine latency."""
+        pool = VoiceVoxPool(["http://a"])
+        for latency in (10.0, 20.0, 30.0, 40.0):
+            pool.engines[0].record_latency(latency)
+
+        stats = pool.stats()[0]
+        assert stats["url"] == "http://a"
+        assert stats["latency_ms"]["p50"] == 30.0
+        assert stats["latency_ms"]["p95"] == 40.0
+
+
+class TestVoiceVoxClientWithPool:
+    """Test cases for VoiceVoxClient balancing across engines."""
+
+    @pytest.mark.asyncio
+    async def test_is_available_probes_every_engine(self):
+        """Test that health checks update each engine's rotation state."""
+        client = VoiceVoxClient(["http://a", "http://b"])
+
+        async def get(url, **kwargs):
+            if url.startswith("http://a"):
+                raise httpx.ConnectError("refused")
+            return MagicMock(status_code=200)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                side_effect=get
+            )
+            assert await client.is_available()
+
+        assert [e.healthy for e in client.pool.engines] == [False, True]
+        assert client.base_url == "http://a"
+
+    @pytest.mark.asyncio
+    async def test_requests_are_balanced(self):
+        """Test that synthesis requests use the selected engine's URL."""
+        client = VoiceVoxClient(["http://a", "http://b"])
+        client.pool.engines[0].healthy = False
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_post = AsyncMock(return_value=MagicMock(content=b"wav"))
+            mock_client.return_value.__aenter__.return_value.post = mock_post
+            await client.synthesize({}, speaker_id=1)
+
+        assert mock_post.await_args.args[0] == "http://b/synthesis"
+        assert client.pool.engines[1].requests == 1
+
+    @pytest.mark.asyncio
+    async def test_hedged_synthesis_second_engine_wins(self):
+        """Test that a slow synthesis is hedged and the loser is cancelled."""
+        client = VoiceVoxClient(["http://slow", "http://fast"], hedge_percentile=95)
+        client._synthesis_latencies.extend([0.01] * 20)
+
+        async def post(url, **kwargs):
+            if url.startswith("http://slow"):
+                await asyncio.sleep(5)
+            return MagicMock(content=url.encode())
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+                side_effect=post
+            )
+            audio = await client.synthesize({}, speaker_id=1)
+
+        assert audio == b"http://fast/synthesis"
+        stats = client.hedge_stats()
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["hedge_rate"] == 1.0
+        assert all(engine.outstanding == 0 for engine in client.pool.engines)
+        # Cancellation is not an engine failure
+        assert client.pool.engines[0].healthy
+
+    @pytest.mark.asyncio
+    async def test_fast_synthesis_is_not_hedged(self):
+        """Test that requests faster than the learned delay are sent once."""
+        client = VoiceVoxClient(["http://a", "http://b"], hedge_percentile=95)
+        client._synthesis_latencies.extend([1.0] * 20)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_post = AsyncMock(return_value=MagicMock(content=b"wav"))
+            mock_client.return_value.__aenter__.return_value.post = mock_post
+            await client.synthesize({}, speaker_id=1)
+
+        assert mock_post.await_count == 1
+        assert client.hedge_stats()["hedged"] == 0
+
+    def test_hedging_needs_samples_and_engines(self):
+        """Test that hedging stays off until there is enough data."""
+        single = VoiceVoxClient("http://a", hedge_percentile=95)
+        single._synthesis_latencies.extend([0.1] * 20)
+        assert single.hedge_delay() is None
+
+        pooled = VoiceVoxClient(["http://a", "http://b"], hedge_percentile=50)
+        assert pooled.hedge_delay() is None
+        pooled._synthesis_latencies.extend([0.1] * 10 + [0.3] * 10)
+        assert pooled.hedge_delay() == 0.3
@@ -0,0 +1,130 @@
+"""Tests for the VoiceVox Engine stub, driven through VoiceVoxClient."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.audio import parse_wav_header
+from src.voicevox_client import VoiceVoxClient
+from src.voicevox_stub import StubConfig, VoiceVoxStub
+
+
+def _client(stub: VoiceVoxStub, **kwargs) -> VoiceVoxClient:
+    return VoiceVoxClient(transport=httpx.ASGITransport(app=stub.app), **kwargs)
+
+
+def _duration(wav: bytes) -> float:
+    info = parse_wav_header(wav)
+    return info.data_size / (info.sample_rate * info.channels * 2)
+
+
+class TestVoiceVoxStub:
+    """Test cases for VoiceVoxStub."""
+
+    @pytest.fixture
+    def stub(self):
+        """Create a stub without latency."""
+        return VoiceVoxStub(
+            StubConfig(latency_ms=0, latency_ms_per_char=0, query_latency_ms=0)
+        )
+
+    @pytest.mark.asyncio
+    async def test_available_and_speakers(self, stub):
+        """Test /version and /speakers."""
+        async with _client(stub) as client:
+            assert await client.is_available()
+            speakers = await client.get_speakers()
+
+        assert [speaker["name"] for speaker in speakers] == ["四国めたん", "ずんだもん"]
+
+    @pytest.mark.asyncio
+    async def test_wav_duration_follows_text_length(self, stub):
+        """Test that synthesized audio is deterministic and scales with the text."""
+        async with _client(stub) as client:
+            short = await client.text_to_speech("ビルド完了", 1)
+            long = await client.text_to_speech("ビルド完了ビルド完了", 1)
+            again = await _client(stub).text_to_speech("ビルド完了", 1)
+            fast = await client.text_to_speech("ビルド完了", 1, speed_scale=2.0)
+
+        assert _duration(long) == pytest.approx(2 * _duration(short), rel=0.01)
+        assert _duration(fast) == pytest.approx(_duration(short) / 2, rel=0.01)
+        assert short == again
+
+    @pytest.mark.asyncio
+    async def test_multi_synthesis(self, stub):
+        """Test that batch synthesis goes through /multi_synthesis."""
+        async with _client(stub) as client:
+            waves = await client.batch_text_to_speech(["一つ目", "二つ目です"], 3)
+
+        assert len(waves) == 2
+        assert _duration(waves[1]) > _duration(waves[0])
+        assert client.batch_stats()["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_initialize_speaker(self, stub):
+        """Test that /initialize_speaker marks the style as loaded."""
+        async with _client(stub) as client:
+            await client.initialize_speaker(3)
+
+        assert stub.stats()["initialized"] == [3]
+
+    @pytest.mark.asyncio
+    async def test_unknown_speaker_is_rejected(self, stub):
+        """Test that an unknown style is a client error, not an engine failure."""
+        async with _client(stub) as client:
+            with pytest.raises(httpx.HTTPStatusError) as excinfo:
+                await client.text_to_speech("テスト", 999)
+
+        assert excinfo.value.response.status_code == 422
+        assert client.pool.engines[0].healthy
+
+    @pytest.mark.asyncio
+    async def test_error_rate(self):
+        """Test that injected failures surface as 500 errors."""
+        stub = VoiceVoxStub(StubConfig(error_rate=1.0, query_latency_ms=0))
+
+        async with _client(stub) as client:
+            with pytest.raises(httpx.HTTPStatusError) as excinfo:
+                await client.create_audio_query("テスト", 1)
+
+        assert excinfo.value.response.status_code == 500
+        assert stub.stats()["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """Test that syntheses beyond max_concurrency queue inside the engine."""
+        stub = VoiceVoxStub(
+            StubConfig(
+                latency_ms=20,
+                latency_ms_per_char=0,
+                query_latency_ms=0,
+                max_concurrency=2,
+            )
+        )
+
+        async with _client(stub) as client:
+            await asyncio.gather(
+                *(client.text_to_speech(f"テスト{i}", 1) for i in range(6))
+            )
+
+        assert stub.stats()["max_in_flight"] == 2
+        assert stub.stats()["syntheses"] == 6
+
+    def test_latency_distributions(self):
+        """Test that sampled latencies follow the configured model."""
+        fixed = VoiceVoxStub(StubConfig(latency_ms=100, latency_ms_per_char=10))
+        assert fixed.latency(5) == pytest.approx(0.15)
+
+        uniform = VoiceVoxStub(
+            StubConfig(
+                latency_ms=100,
+                latency_ms_per_char=0,
+                distribution="uniform",
+                spread=0.5,
+                seed=1,
+            )
+        )
+        samples = [uniform.latency(0) for _ in range(100)]
+        assert all(0.05 <= sample <= 0.15 for sample in samples)
+        assert len(set(samples)) > 1
@@ -0,0 +1,62 @@
+"""Tests for the VoiceVox startup warm-up."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.voicevox_warmup import VoiceVoxWarmup
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.initialize_speaker = AsyncMock()
+    client.batch_text_to_speech = AsyncMock(return_value=[b"wav"])
+    return client
+
+
+class TestVoiceVoxWarmup:
+    """Test cases for VoiceVoxWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_initializes_speakers_and_renders_phrases(self):
+        """Test that every speaker is initialized and phrases are rendered for it."""
+        client = _client()
+        warmup = VoiceVoxWarmup(client, speaker_ids=[1, 3, 1], phrases=["ビルド完了。"])
+
+        await warmup.run()
+
+        assert [c.args[0] for c in client.initialize_speaker.await_args_list] == [1, 3]
+        rendered_for = [c.args[1] for c in client.batch_text_to_speech.await_args_list]
+        assert sorted(rendered_for) == [1, 3]
+        stats = warmup.stats()
+        assert stats["state"] == "done"
+        assert stats["speakers"] == "2/2"
+        assert stats["phrases"] == "2/2"
+        assert stats["duration_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_phrases_are_split_like_notifications(self):
+        """Test that long phrases are rendered as the chunks notify_voice plays."""
+        client = _client()
+        warmup = VoiceVoxWarmup(
+            client, phrases=["ビルド完了。テスト成功。"], chunk_max_chars=8
+        )
+
+        await warmup.run()
+
+        client.batch_text_to_speech.assert_awaited_once_with(
+            ["ビルド完了。", "テスト成功。"], 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded(self):
+        """Test that a failed speaker does not stop the rest of the warm-up."""
+        client = _client()
+        client.initialize_speaker.side_effect = [RuntimeError("boom"), None]
+        warmup = VoiceVoxWarmup(client, speaker_ids=[1, 2])
+
+        await warmup.run()
+
+        stats = warmup.stats()
+        assert stats["state"] == "failed"
+        assert stats["speakers"] == "1/2"
+        assert "initialize_speaker 1: boom" in stats["errors"]